@@ -0,0 +1,164 @@
+import re
+import sys
+import glob
+import json
+import time
+import platform
+import argparse
+import statistics
+import multiprocessing
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "src"))
+
+from benchmarks.bench_transcription import _median_seconds, _result  # noqa: E402
+
+
+def _tokens(text):
+    return re.findall(r"\w+", text.lower())
+
+
+def _ngrams(tokens, n):
+    return Counter(zip(*[tokens[i:] for i in range(n)]))
+
+
+def _f1(overlap, reference_count, candidate_count):
+    if not overlap:
+        return 0.0
+    precision = overlap / candidate_count
+    recall = overlap / reference_count
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_n(reference, candidate, n=1):
+    """ROUGE-N F1 between two texts (clipped n-gram overlap)."""
+    ref = _ngrams(_tokens(reference), n)
+    cand = _ngrams(_tokens(candidate), n)
+    overlap = sum((ref & cand).values())
+    return _f1(overlap, sum(ref.values()), sum(cand.values()))
+
+
+def _lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for x in a:
+        current = [0]
+        for j, y in enumerate(b):
+            current.append(previous[j] + 1 if x == y else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def rouge_l(reference, candidate):
+    """ROUGE-L F1 between two texts (longest common subsequence of words)."""
+    ref, cand = _tokens(reference), _tokens(candidate)
+    return _f1(_lcs_length(ref, cand), len(ref), len(cand))
+
+
+def _bench_backend(model_name, backend, threads, transcripts, repeat):
+    """Load one backend cold and summarize every transcript. Runs in a fresh process."""
+    import summary
+    import quantized_summarizer
+    from calibrate import peak_rss_mb
+    from model_registry import set_torch_threads
+
+    summary.SUMMARY_CACHE_ENABLED = False
+    summary.T5_MODEL = model_name
+    summary.T5_BACKEND = backend
+    quantized_summarizer.T5_THREADS = threads
+    set_torch_threads(threads)
+
+    label = f"{model_name}/{backend}"
+    start = time.perf_counter()
+    summary.get_summarizer()
+    results = [_result(f"t5/load/{label}", "seconds", time.perf_counter() - start)]
+
+    outputs = {}
+    for name, text in transcripts:
+        elapsed, outputs[name] = _median_seconds(
+            lambda: summary.summarize_text(text, use_local=True), repeat
+        )
+        results.append(_result(f"t5/latency/{label}/{name}", "seconds", elapsed))
+    results.append(_result(f"t5/rss/{label}", "mb", peak_rss_mb() or 0.0))
+    return results, outputs
+
+
+def run(models, backends, threads, transcripts, repeat):
+    context = multiprocessing.get_context("spawn")
+    results = []
+    outputs = {}
+    for model_name in models:
+        for backend in backends:
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                future = pool.submit(
+                    _bench_backend, model_name, backend, threads, transcripts, repeat
+                )
+                backend_results, outputs[(model_name, backend)] = future.result()
+            results.extend(backend_results)
+
+    # Quality: every backend's summaries against fp32 of the same model
+    for model_name in models:
+        reference = outputs.get((model_name, "fp32"))
+        if reference is None:
+            continue
+        for backend in backends:
+            if backend == "fp32":
+                continue
+            candidate = outputs[(model_name, backend)]
+            for metric, score in (
+                ("rouge1", lambda r, c: rouge_n(r, c, 1)),
+                ("rouge2", lambda r, c: rouge_n(r, c, 2)),
+                ("rougeL", rouge_l),
+            ):
+                value = statistics.mean(score(reference[n], candidate[n]) for n in reference)
+                results.append(_result(f"t5/{metric}/{model_name}/{backend}", "f1", value))
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "python": platform.python_version(),
+            "models": models,
+            "backends": backends,
+            "threads": threads,
+            "transcripts": [name for name, _ in transcripts],
+            "repeat": repeat,
+        },
+        "results": results,
+        "summaries": {f"{m}/{b}": texts for (m, b), texts in outputs.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare fp32 and int8 T5 summarization")
+    parser.add_argument("--models", nargs="+", default=["t5-small", "t5-base"])
+    parser.add_argument("--backends", nargs="+", default=["fp32", "int8"])
+    parser.add_argument("--transcripts", default=str(ROOT / "data" / "transcripts" / "*.txt"),
+                        help="Glob of transcripts to summarize")
+    parser.add_argument("--threads", type=int, help="Torch intra-op threads (default: all cores)")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per measurement (median)")
+    parser.add_argument("--output", type=str, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(args.transcripts))
+    if not paths:
+        print(f"No transcripts match {args.transcripts}")
+        sys.exit(1)
+    transcripts = [(Path(p).stem, Path(p).read_text(encoding="utf-8")) for p in paths]
+
+    report = run(args.models, args.backends, args.threads, transcripts, args.repeat)
+    for r in report["results"]:
+        print(f"{r['name']:<48}{r['value']:>12.4f} {r['unit']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
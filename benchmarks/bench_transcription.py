@@ -0,0 +1,182 @@
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import tempfile
+import statistics
+import multiprocessing
+from datetime import datetime
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT = Path(__file__).parent.parent
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "src"))
+
+from benchmarks.fixtures import make_fixture  # noqa: E402
+
+
+def _median_seconds(fn, repeat):
+    timings = []
+    value = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        value = fn()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), value
+
+
+def bench_decode(fixtures, repeat):
+    """Time ffmpeg-pipe decoding of every fixture."""
+    from audio import load_audio
+
+    results = []
+    for (seconds, fmt), path in fixtures.items():
+        elapsed, _ = _median_seconds(lambda: load_audio(path), repeat)
+        results.append(_result(f"decode/{fmt}/{seconds}s", "seconds", elapsed))
+    return results
+
+
+def _bench_model(model_name, audio_paths, repeat):
+    """Load a model cold and run inference. Runs in a fresh process."""
+    import transcript_cache
+    from audio import load_audio, duration_seconds
+    from calibrate import peak_rss_mb
+    from model_registry import get_registry, load_whisper_model
+    from transcribe import transcribe, transcribe_audio
+
+    results = []
+    start = time.perf_counter()
+    model = load_whisper_model(model_name, "cpu", "fp32")
+    results.append(_result(f"load/{model_name}", "seconds", time.perf_counter() - start))
+    get_registry().clear()
+
+    # End-to-end runs must not be served from the cache or write into data/
+    transcript_cache.TRANSCRIPT_CACHE_ENABLED = False
+    transcript_cache.TRANSCRIPTS_DIR = Path(tempfile.mkdtemp(prefix="lectura-bench-"))
+
+    for seconds, path in audio_paths:
+        audio = load_audio(path)
+        duration = duration_seconds(audio)
+        for use_vad in (False, True):
+            elapsed, _ = _median_seconds(
+                lambda: transcribe_audio(audio, model, use_vad=use_vad), repeat
+            )
+            label = "vad" if use_vad else "full"
+            results.append(
+                _result(f"rtf/{model_name}/{label}/{seconds}s", "rtf", elapsed / duration)
+            )
+        elapsed, _ = _median_seconds(
+            lambda: transcribe(str(path), model_name=model_name, checkpoint=False), repeat
+        )
+        results.append(_result(f"e2e/{model_name}/{seconds}s", "seconds", elapsed))
+
+    results.append(_result(f"rss/{model_name}", "mb", peak_rss_mb() or 0.0))
+    return results
+
+
+def bench_models(models, fixtures, repeat):
+    """Benchmark each model in its own process so load time and RSS are cold."""
+    audio_paths = [(seconds, path) for (seconds, fmt), path in fixtures.items() if fmt == "wav"]
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for model_name in models:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results.extend(pool.submit(_bench_model, model_name, audio_paths, repeat).result())
+    return results
+
+
+def _result(name, unit, value):
+    return {"name": name, "unit": unit, "value": round(float(value), 4)}
+
+
+def compare(results, baseline, tolerance=0.15):
+    """
+    Compare results with a baseline run.
+
+    Every metric is lower-is-better, so a regression is a value more than
+    ``tolerance`` (as a fraction) above the baseline value.
+
+    Args:
+        results: Result list from this run
+        baseline: Result list from the baseline run
+        tolerance: Allowed relative slowdown
+
+    Returns:
+        List of (name, baseline value, new value) for every regression
+    """
+    previous = {r["name"]: r["value"] for r in baseline}
+    regressions = []
+    for r in results:
+        before = previous.get(r["name"])
+        if before is None or before <= 0:
+            continue
+        if r["value"] > before * (1 + tolerance):
+            regressions.append((r["name"], before, r["value"]))
+    return regressions
+
+
+def run(lengths, formats, models, repeat):
+    fixtures = {}
+    for seconds in lengths:
+        for fmt in sorted(set(formats) | {"wav"}):
+            fixtures[(seconds, fmt)] = make_fixture(seconds, fmt)
+
+    results = bench_decode(fixtures, repeat)
+    if models:
+        results.extend(bench_models(models, fixtures, repeat))
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "python": platform.python_version(),
+            "lengths": lengths,
+            "formats": formats,
+            "models": models,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Lectura transcription benchmarks")
+    parser.add_argument("--lengths", type=int, nargs="+", default=[30, 300],
+                        help="Fixture lengths in seconds")
+    parser.add_argument("--formats", nargs="+", default=["wav", "mp3", "m4a"],
+                        help="Fixture formats to decode")
+    parser.add_argument("--models", nargs="*", default=["tiny"],
+                        help="Whisper models to benchmark (none for decode only)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (median)")
+    parser.add_argument("--output", type=str, help="Write results as JSON to this file")
+    parser.add_argument("--baseline", type=str, help="Compare against a previous results file")
+    parser.add_argument("--tolerance", type=float, default=0.15,
+                        help="Allowed relative slowdown before a metric counts as a regression")
+    args = parser.parse_args()
+
+    report = run(args.lengths, args.formats, args.models, args.repeat)
+    for r in report["results"]:
+        print(f"{r['name']:<32}{r['value']:>12.4f} {r['unit']}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report["results"], baseline["results"], args.tolerance)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%}:")
+            for name, before, after in regressions:
+                print(f"  {name}: {before:.4f} → {after:.4f}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.tolerance:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import sys
+import wave
+import shutil
+import subprocess
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from utils.synthetic_audio import synthetic_speech  # noqa: E402
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# ffmpeg encoder arguments for the formats lectures arrive in
+ENCODERS = {
+    "mp3": ["-c:a", "libmp3lame", "-b:a", "64k"],
+    "m4a": ["-c:a", "aac", "-b:a", "64k"],
+    "ogg": ["-c:a", "libopus", "-b:a", "32k"],
+    "flac": ["-c:a", "flac"],
+}
+
+
+def write_wav(path, audio, sr):
+    """Write float32 samples as a 16-bit mono WAV."""
+    pcm = (audio.clip(-1.0, 1.0) * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sr)
+        w.writeframes(pcm.tobytes())
+    return path
+
+
+def make_fixture(seconds, fmt="wav", sr=44100, seed=0, directory=FIXTURES_DIR):
+    """
+    Create (or reuse) a synthetic speech recording.
+
+    WAV fixtures are written directly; other formats are encoded from the
+    WAV with ffmpeg. Files are named after their parameters, so repeated
+    runs reuse them and the same parameters always describe the same audio.
+
+    Args:
+        seconds: Length of the recording
+        fmt: "wav" or one of ENCODERS
+        sr: Sample rate of the fixture (recorders capture at 44.1 kHz)
+        seed: Seed for the synthetic speech generator
+        directory: Where fixtures are kept
+
+    Returns:
+        Path to the fixture
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    stem = f"speech_{seconds}s_{sr}hz_seed{seed}"
+    wav_path = directory / f"{stem}.wav"
+    if not wav_path.exists():
+        write_wav(wav_path, synthetic_speech(seconds, sr=sr, seed=seed), sr)
+    if fmt == "wav":
+        return wav_path
+
+    if fmt not in ENCODERS:
+        raise ValueError(f"Unsupported fixture format: {fmt}")
+    path = directory / f"{stem}.{fmt}"
+    if not path.exists():
+        if shutil.which("ffmpeg") is None:
+            raise RuntimeError(f"ffmpeg is required to create {fmt} fixtures")
+        subprocess.run(
+            ["ffmpeg", "-nostdin", "-y", "-i", str(wav_path), *ENCODERS[fmt],
+             "-map_metadata", "-1", "-fflags", "+bitexact", str(path)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    return path
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import os
 from pathlib import Path
@@ -16,6 +16,7 @@ RECORDINGS_DIR = DATA_DIR / "recordings"
 TRANSCRIPTS_DIR = DATA_DIR / "transcripts"
 SUMMARIES_DIR = DATA_DIR / "summaries"
 LOGS_DIR = DATA_DIR / "logs"
+CACHE_DIR = DATA_DIR / "cache"
 
 # Create directories if they don't exist
 for directory in [DATA_DIR, RECORDINGS_DIR, TRANSCRIPTS_DIR, SUMMARIES_DIR, LOGS_DIR]:
@@ -27,7 +28,98 @@ DEEPGRAM_API_KEY = os.getenv("DEEPGRAM_API_KEY")
 
 # Model configurations
 WHISPER_MODEL = "base"  # Options: "tiny", "base", "small", "medium", "large"
+WHISPER_DEVICE = os.getenv("WHISPER_DEVICE", "cpu")  # Options: "cpu", "cuda"
+WHISPER_PRECISION = "fp32"  # Options: "fp32", "fp16" (fp16 only applies on GPU)
+MODEL_CACHE_SIZE = 2  # Maximum number of models kept loaded per process
+MODEL_MEMORY_BUDGET_MB = None  # Optional cap on memory held by loaded models
+
+# Automatic model selection from a calibration profile (python app.py --calibrate)
+WHISPER_AUTO_SELECT = True  # Only applies when a profile exists and no model is given
+WHISPER_TARGET_RTF = 0.5  # Processing time / audio time the chosen model must meet
+WHISPER_PROFILE_PATH = DATA_DIR / "profiles" / "whisper_profile.json"
+
+# Voice activity detection (skips silence before Whisper runs)
+VAD_ENABLED = True
+VAD_FRAME_MS = 30
+VAD_MARGIN_DB = 12.0  # Speech must be this far above the noise floor
+VAD_MIN_SPEECH_MS = 250
+VAD_MIN_SILENCE_MS = 600
+VAD_PAD_MS = 200
+
+# Parallel transcription of a single long recording
+TRANSCRIBE_WORKERS = 1  # Worker processes per recording (1 disables parallel mode)
+PARALLEL_MIN_SECONDS = 600  # Shorter recordings are always transcribed serially
+PARALLEL_WINDOW_SECONDS = 300
+PARALLEL_OVERLAP_SECONDS = 5
+PARALLEL_SEARCH_SECONDS = 20  # How far a window cut may move to land on silence
+
+# Resumable transcription: long recordings are cut into windows and each
+# finished window is journaled (opt in with --resumable; changes the output
+# slightly because every window is decoded on its own)
+CHECKPOINT_ENABLED = False
+CHECKPOINT_MIN_SECONDS = 1200
+
+# Transcript cache (keyed by audio content hash, engine, model and options)
+TRANSCRIPT_CACHE_ENABLED = True
+TRANSCRIPT_CACHE_DIR = CACHE_DIR / "transcripts"
+TRANSCRIPT_CACHE_MAX_MB = 512
+TRANSCRIPT_CACHE_MAX_AGE_DAYS = 90
+
+# Local summarization
 T5_MODEL = "t5-small"  # Options: "t5-small", "t5-base", "t5-large"
+T5_MAX_INPUT_TOKENS = 512  # Input budget per chunk, including the task prefix
+T5_BATCH_SIZE = 8  # Chunks per pipeline forward pass
+T5_BACKEND = os.getenv("T5_BACKEND", "fp32")  # "fp32" or "int8" (dynamic quantization, CPU)
+T5_THREADS = None  # Intra-op threads for the int8 backend (None: one per CPU core)
+T5_QUANTIZED_DIR = CACHE_DIR / "t5-int8"
+
+# Claude summarization
+CLAUDE_MODEL = "claude-3-sonnet-20240229"
+ANTHROPIC_BASE_URL = os.getenv("ANTHROPIC_BASE_URL")  # e.g. a proxy or local stub server
+SUMMARY_SECTION_CHARS = 12000  # Longer transcripts are summarized section by section
+SUMMARY_CONCURRENCY = 4  # Concurrent Claude requests when summarizing sections
+SUMMARY_REDUCE_FAN_IN = 8  # Partial summaries combined per reduce request
+
+# Extractive pre-ranking: long transcripts are cut to their most central sentences
+# (TextRank) before Claude or T5 sees them
+SUMMARY_EXTRACTIVE = True
+EXTRACTIVE_RATIO = 0.3  # Fraction of the transcript's tokens to keep
+EXTRACTIVE_MIN_TOKENS = 3000  # Transcripts shorter than this are left whole
+EXTRACTIVE_SECTIONS = 8  # Stretches of the lecture the budget is spread over
+
+# Anthropic rate limits and retries for bulk summarization (match your account's tier)
+ANTHROPIC_REQUESTS_PER_MINUTE = 50
+ANTHROPIC_TOKENS_PER_MINUTE = 40000
+ANTHROPIC_MAX_RETRIES = 5
+ANTHROPIC_RETRY_BASE_SECONDS = 1.0
+ANTHROPIC_RETRY_MAX_SECONDS = 60.0
+
+# Summary cache (keyed by transcript hash, backend, model, prompt and parameters)
+SUMMARY_CACHE_ENABLED = True
+SUMMARY_CACHE_DIR = CACHE_DIR / "summaries"
+SUMMARY_CACHE_MAX_MB = 64
+SUMMARY_CACHE_MAX_AGE_DAYS = 90
+
+# Deepgram
+DEEPGRAM_CONCURRENCY = 8  # Uploads in flight for bulk Deepgram transcription
+DEEPGRAM_API_URL = os.getenv("DEEPGRAM_API_URL", "https://api.deepgram.com/v1/listen")
+DEEPGRAM_UPLOAD_CODEC = "opus"  # Upload as 16 kHz mono "opus" or "flac"; None sends files as is
+DEEPGRAM_TIMEOUT = 600  # Seconds a single Deepgram request may take
+DEEPGRAM_LIVE_URL = os.getenv("DEEPGRAM_LIVE_URL", "wss://api.deepgram.com/v1/listen")
+DEEPGRAM_LIVE_CHUNK_SECONDS = 0.1  # Audio sent per websocket message in live mode
+
+# Transcription routing (app.py --auto): engines are tried in order, later ones are fallbacks
+ROUTER_ENGINES = ["deepgram", "whisper"]
+# Seconds per attempt (None: no limit); Whisper runs in a thread that cannot be
+# cancelled, so it is never timed out
+ROUTER_TIMEOUTS = {"deepgram": 900, "whisper": None}
+ROUTER_RETRIES = {"deepgram": 2, "whisper": 0}  # Extra attempts before falling back
+ROUTER_CONCURRENCY = {"deepgram": DEEPGRAM_CONCURRENCY, "whisper": 1}  # Jobs per engine at once
+ROUTER_RETRY_BASE_SECONDS = 2.0
+ROUTER_RETRY_MAX_SECONDS = 60.0
+BREAKER_FAILURE_THRESHOLD = 3  # Consecutive failures that take an engine out of rotation
+BREAKER_RESET_SECONDS = 120  # How long before a failed engine is tried again
+ROUTER_METRICS_DIR = LOGS_DIR  # transcription_router.prom / .json are written here
 
 # Recording settings
 SAMPLE_RATE = 16000
@@ -57,7 +149,7 @@ class RecordingConfig:
 class Config:
     api: APIConfig
     storage: StorageConfig
-    recording: RecordingConfig = RecordingConfig()
+    recording: RecordingConfig = field(default_factory=RecordingConfig)
 
     @classmethod
     def from_env(cls) -> 'Config':
@@ -2,8 +2,11 @@ import streamlit as st
 import os
 import tempfile
 from transcribe import transcribe
-from summary import generate_summary
+from summary import stream_summary
+from summary_store import SummaryStore, hash_transcript
+from config import CLAUDE_MODEL
 from deepgram_transcribe import transcribe as deepgram_transcribe
+from transcription_router import transcribe_auto
 import time
 
 # Page configuration
@@ -78,9 +81,14 @@ with st.sidebar:
     st.markdown("### ⚙️ Settings")
     transcription_engine = st.radio(
         "Transcription Engine",
-        ["Whisper (Local)", "Deepgram (API)"],
+        ["Whisper (Local)", "Deepgram (API)", "Auto (Deepgram, Whisper fallback)"],
         index=0
     )
+    resumable = st.checkbox(
+        "Resumable Whisper transcription",
+        value=False,
+        help="Journal long recordings window by window so an interrupted run can resume"
+    )
     
     st.markdown("---")
     
@@ -119,27 +127,29 @@ with tab1:
         # Process button
         if st.button("Process Recording"):
             with st.spinner("Processing your file... ⏳"):
-                # Save to temporary file
-                with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(uploaded_file.name)[1]) as temp_file:
-                    temp_file.write(uploaded_file.read())
-                    temp_path = temp_file.name
-                
-                # Transcribe based on selected engine
-                if transcription_engine == "Whisper (Local)":
-                    transcript_path = transcribe(temp_path)
-                else:
-                    transcript_path = deepgram_transcribe(temp_path)
-                
-                # Clean up temp file
-                os.unlink(temp_path)
+                # Save under the original name so the transcript is named after it;
+                # repeated uploads of the same recording hit the transcript cache
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    temp_path = os.path.join(temp_dir, os.path.basename(uploaded_file.name))
+                    with open(temp_path, "wb") as temp_file:
+                        temp_file.write(uploaded_file.getbuffer())
+                    
+                    # Transcribe based on selected engine
+                    if transcription_engine == "Whisper (Local)":
+                        transcript_path = transcribe(temp_path, checkpoint=resumable)
+                    elif transcription_engine == "Deepgram (API)":
+                        transcript_path = deepgram_transcribe(temp_path)
+                    else:
+                        report = transcribe_auto(temp_path)
+                        if report.failed:
+                            st.error(f"Transcription failed: {report.failed[0].error}")
+                            st.stop()
+                        transcript_path = report.succeeded[0].transcript_path
                 
                 # Read transcript
                 with open(transcript_path, "r", encoding="utf-8") as f:
                     transcript = f.read()
                 
-                # Generate summary
-                summary = generate_summary(transcript)
-                
                 st.markdown('<div class="success-box">✅ Processing complete!</div>', unsafe_allow_html=True)
             
             # Display results in columns
@@ -159,7 +169,17 @@ with tab1:
             
             with col2:
                 st.markdown('<h3 class="sub-header">🧠 Summary & Study Tips</h3>', unsafe_allow_html=True)
-                st.markdown(summary)
+                store = SummaryStore()
+                saved = store.latest(transcript_path)
+                if saved and saved.transcript_hash == hash_transcript(transcript_path):
+                    # This transcript was summarized before
+                    summary = store.read(saved)
+                    st.markdown(summary)
+                    st.caption(f"Saved summary v{saved.version} ({saved.created})")
+                else:
+                    # Render the summary as it is generated
+                    summary = st.write_stream(stream_summary(transcript))
+                    store.save(transcript_path, summary, "claude", CLAUDE_MODEL)
                 
                 # Download summary button
                 st.download_button(
@@ -177,10 +197,10 @@ with tab2:
     
     if search_query:
         # Import search function
-        from search_notes import search_transcripts
+        from search_notes import search_transcripts, search_summaries
         
         # Perform search
-        results = search_transcripts(search_query)
+        results = search_transcripts(search_query) + search_summaries(search_query)
         
         if results:
             st.markdown(f"### Found {len(results)} matches:")
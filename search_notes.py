@@ -1,4 +1,5 @@
 import os
+import re
 import glob
 
 try:
@@ -7,6 +8,9 @@ except ImportError:
     print("❌ Please install fuzzywuzzy first: pip install fuzzywuzzy[speedup]")
     exit(1)
 
+# Older versions appended the summary to the transcript; it is not lecture text
+LEGACY_SUMMARY = re.compile(r"\n\n---\n\n(Local )?Summary:\n")
+
 def highlight_match(line, query):
     """Highlight matching part of the line."""
     start = line.lower().find(query.lower())
@@ -28,9 +32,9 @@ def search_transcripts(query, folder="notes", threshold=60):
 
     for filepath in glob.glob(f"{folder}/*.txt"):
         with open(filepath, "r", encoding="utf-8") as f:
-            lines = f.readlines()
+            text = LEGACY_SUMMARY.split(f.read(), maxsplit=1)[0]
 
-        for line in lines:
+        for line in text.splitlines():
             if fuzz.partial_ratio(query.lower(), line.lower()) >= threshold:
                 highlighted = highlight_match(line.strip(), query)
                 results.append((os.path.basename(filepath), highlighted))
@@ -38,6 +42,20 @@ def search_transcripts(query, folder="notes", threshold=60):
     return results
 
 
+def search_summaries(query, store=None, threshold=60):
+    """Search the latest saved summary of every transcript (see summary_store)."""
+    from summary_store import SummaryStore
+
+    store = store or SummaryStore()
+    results = []
+    for record in store.latest_versions():
+        for line in store.read(record).splitlines():
+            if line.strip() and fuzz.partial_ratio(query.lower(), line.lower()) >= threshold:
+                results.append((record.path, highlight_match(line.strip(), query)))
+
+    return results
+
+
 if __name__ == "__main__":
     print("\n🧠 Lectura: Transcript Search\n")
     query = input("🔍 What would you like to search for in your notes? ")
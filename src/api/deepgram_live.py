@@ -0,0 +1,254 @@
+import os
+import json
+import time
+import wave
+import signal
+import asyncio
+import datetime
+from dataclasses import dataclass
+from urllib.parse import urlencode
+from audio import SAMPLE_RATE, BYTES_PER_SAMPLE, stream_pcm
+from transcript_store import LiveTranscriptWriter
+from utils.error_handler import APIError, TranscriptionError, logger
+from api.deepgram_transcribe import DEEPGRAM_MODEL, DEEPGRAM_OPTIONS
+from config import (
+    RECORDINGS_DIR,
+    TRANSCRIPTS_DIR,
+    DEEPGRAM_LIVE_URL,
+    DEEPGRAM_LIVE_CHUNK_SECONDS,
+)
+
+# Raw PCM as produced by the audio sources below
+LIVE_OPTIONS = {
+    "encoding": "linear16",
+    "sample_rate": SAMPLE_RATE,
+    "channels": 1,
+    "interim_results": True,
+}
+
+# Prerecorded-only options the streaming endpoint does not accept
+PRERECORDED_ONLY = ("utterances",)
+
+
+@dataclass
+class LiveEvent:
+    """One transcript update from the streaming API."""
+
+    text: str
+    start: float
+    end: float
+    is_final: bool
+    confidence: float = float("nan")
+
+
+def parse_event(message):
+    """Return a LiveEvent for a "Results" message, or None for any other message."""
+    if isinstance(message, bytes):
+        return None
+    data = json.loads(message)
+    if data.get("type") != "Results":
+        return None
+    alternative = data["channel"]["alternatives"][0]
+    start = float(data.get("start", 0.0))
+    return LiveEvent(
+        text=alternative.get("transcript", ""),
+        start=start,
+        end=start + float(data.get("duration", 0.0)),
+        is_final=bool(data.get("is_final")),
+        confidence=float(alternative.get("confidence", float("nan"))),
+    )
+
+
+def live_url(url=DEEPGRAM_LIVE_URL, model=DEEPGRAM_MODEL, options=None):
+    options = DEEPGRAM_OPTIONS if options is None else options
+    params = {"model": model, **options, **LIVE_OPTIONS}
+    params = {k: v for k, v in params.items() if k not in PRERECORDED_ONLY}
+    return url + "?" + urlencode(
+        {k: str(v).lower() if isinstance(v, bool) else v for k, v in params.items()}
+    )
+
+
+async def file_source(file_path, chunk_seconds=DEEPGRAM_LIVE_CHUNK_SECONDS, realtime=False):
+    """
+    Stream an audio file as raw PCM chunks, optionally paced like a live microphone.
+
+    Args:
+        file_path: Path to any audio file ffmpeg understands
+        chunk_seconds: Audio per chunk
+        realtime: If True, yield no faster than the audio plays
+
+    Yields:
+        Mono 16-bit PCM bytes at SAMPLE_RATE
+    """
+    start = time.monotonic()
+    sent_seconds = 0.0
+    async for chunk in stream_pcm(file_path, chunk_seconds):
+        yield chunk
+        sent_seconds += len(chunk) / (SAMPLE_RATE * BYTES_PER_SAMPLE)
+        if realtime:
+            await asyncio.sleep(max(0.0, start + sent_seconds - time.monotonic()))
+
+
+async def microphone_source(chunk_seconds=DEEPGRAM_LIVE_CHUNK_SECONDS, stop=None):
+    """
+    Capture the default microphone as raw PCM chunks until ``stop`` is set.
+
+    Args:
+        chunk_seconds: Audio per chunk
+        stop: asyncio.Event that ends the capture (default: run until cancelled)
+
+    Yields:
+        Mono 16-bit PCM bytes at SAMPLE_RATE
+    """
+    import sounddevice as sd
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+
+    def callback(indata, frames, time_info, status):
+        if status:
+            logger.warning(f"Microphone: {status}")
+        loop.call_soon_threadsafe(queue.put_nowait, bytes(indata))
+
+    with sd.RawInputStream(samplerate=SAMPLE_RATE, channels=1, dtype="int16",
+                           blocksize=int(chunk_seconds * SAMPLE_RATE), callback=callback):
+        while stop is None or not stop.is_set():
+            try:
+                yield await asyncio.wait_for(queue.get(), timeout=0.5)
+            except asyncio.TimeoutError:
+                continue
+    # Audio captured after stop was requested
+    while not queue.empty():
+        yield queue.get_nowait()
+
+
+async def save_wav(source, recording_path):
+    """Pass PCM chunks through while also writing them to a WAV file."""
+    with wave.open(str(recording_path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(BYTES_PER_SAMPLE)
+        w.setframerate(SAMPLE_RATE)
+        async for chunk in source:
+            w.writeframes(chunk)
+            yield chunk
+
+
+def _connect(url, headers):
+    import websockets
+
+    # The keyword for request headers was renamed in websockets 14
+    major = int(websockets.__version__.split(".")[0])
+    key = "additional_headers" if major >= 14 else "extra_headers"
+    return websockets.connect(url, max_size=None, **{key: headers})
+
+
+async def transcribe_live(source, transcript_path, on_event=None, url=DEEPGRAM_LIVE_URL,
+                          api_key=None):
+    """
+    Stream audio to Deepgram's websocket API and write the transcript as it arrives.
+
+    Audio chunks are sent as they are produced while transcript events
+    are received on the same connection. Final results are appended to
+    the transcript immediately and interim results update its sidecar
+    (see transcript_store.LiveTranscriptWriter), so the transcript is
+    complete a moment after the source ends.
+
+    Args:
+        source: Async iterator of mono 16-bit PCM chunks at SAMPLE_RATE
+            (file_source or microphone_source)
+        transcript_path: Where to write the transcript
+        on_event: Optional callback that receives every LiveEvent
+        url: Deepgram streaming endpoint
+        api_key: Deepgram API key (default: DEEPGRAM_API_KEY)
+
+    Returns:
+        Path to the transcript file
+
+    Raises:
+        APIError: If no API key is set
+        TranscriptionError: If streaming fails
+    """
+    api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
+    if not api_key:
+        raise APIError("DEEPGRAM_API_KEY environment variable is not set")
+
+    with LiveTranscriptWriter(transcript_path) as writer:
+        try:
+            async with _connect(live_url(url), {"Authorization": f"Token {api_key}"}) as ws:
+                async def send():
+                    try:
+                        async for chunk in source:
+                            await ws.send(chunk)
+                    except Exception:
+                        # Nothing more is coming; stop waiting for results
+                        await ws.close()
+                        raise
+                    # Ask Deepgram to flush the remaining results and close
+                    await ws.send(json.dumps({"type": "CloseStream"}))
+
+                sender = asyncio.create_task(send())
+                try:
+                    async for message in ws:
+                        event = parse_event(message)
+                        if event is None:
+                            continue
+                        if event.is_final:
+                            writer.add_final({
+                                "start": event.start,
+                                "end": event.end,
+                                "text": event.text,
+                            })
+                        else:
+                            writer.add_interim(event.text)
+                        if on_event:
+                            on_event(event)
+                    await sender
+                finally:
+                    sender.cancel()
+        except (APIError, TranscriptionError):
+            raise
+        except Exception as e:
+            logger.error(f"Live transcription failed: {str(e)}")
+            raise TranscriptionError(f"Live transcription failed: {str(e)}")
+
+    logger.info(f"Live transcript saved to {transcript_path} ({len(writer.segments)} segments)")
+    return transcript_path
+
+
+def transcribe_file_live(file_path, on_event=None, realtime=False):
+    """
+    Transcribe an audio file through the streaming API.
+
+    Returns:
+        Path to the transcript file
+    """
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    transcript_path = TRANSCRIPTS_DIR / f"{stem}_live.txt"
+    source = file_source(file_path, realtime=realtime)
+    return asyncio.run(transcribe_live(source, transcript_path, on_event))
+
+
+def record_live(on_event=None):
+    """
+    Record from the microphone and transcribe while recording, until Ctrl+C.
+
+    The audio is also saved to RECORDINGS_DIR.
+
+    Returns:
+        (recording path, transcript path)
+    """
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    recording_path = RECORDINGS_DIR / f"lecture_{timestamp}.wav"
+    transcript_path = TRANSCRIPTS_DIR / f"lecture_{timestamp}_live.txt"
+
+    async def run():
+        stop = asyncio.Event()
+        try:
+            # Stop capturing on Ctrl+C but let the last results arrive
+            asyncio.get_running_loop().add_signal_handler(signal.SIGINT, stop.set)
+        except (NotImplementedError, RuntimeError):
+            pass
+        source = save_wav(microphone_source(stop=stop), recording_path)
+        return await transcribe_live(source, transcript_path, on_event)
+
+    return recording_path, asyncio.run(run())
@@ -1,4 +1,6 @@
 import os
+import time
+import shutil
 import asyncio
 from pathlib import Path
 from deepgram import DeepgramClient, PrerecordedOptions
@@ -9,7 +11,20 @@ from utils.error_handler import (
     handle_error, 
     logger
 )
-from config import TRANSCRIPTS_DIR
+from utils.disk_cache import hash_file
+from transcript_store import UtteranceTable, utterances_path_for
+from api.deepgram_upload import transcribe_compressed, create_http_client
+from config import DEEPGRAM_CONCURRENCY, DEEPGRAM_UPLOAD_CODEC
+import transcript_cache
+
+DEEPGRAM_MODEL = "nova-2"
+DEEPGRAM_OPTIONS = {
+    "smart_format": True,
+    "language": "en-US",
+    "punctuate": True,
+    "diarize": True,  # Speaker identification
+    "utterances": True,
+}
 
 # Initialize Deepgram client
 try:
@@ -24,18 +39,36 @@ def get_data_dir():
     data_dir.mkdir(exist_ok=True)
     return data_dir
 
-async def transcribe_with_deepgram(file_path):
+
+def _cache_options(codec):
+    # Transcoded uploads can transcribe slightly differently than the original
+    return {**DEEPGRAM_OPTIONS, "upload_codec": codec} if codec else DEEPGRAM_OPTIONS
+
+
+async def transcribe_with_deepgram(file_path, client=None, http_client=None,
+                                   codec=DEEPGRAM_UPLOAD_CODEC, on_upload=None):
     """
     Transcribe an audio file using Deepgram's API.
     
     Args:
         file_path: Path to the audio file
+        client: DeepgramClient to use (default: the module's shared client)
+        http_client: httpx.AsyncClient for compressed uploads (default: a new one)
+        codec: Transcode the upload to this speech codec (see
+            api.deepgram_upload); None sends the file as is
+        on_upload: Optional callback that receives the UploadStats of a
+            compressed upload (not called on a cache hit or without a codec)
         
     Returns:
         Path to the transcript file
     """
-    # Check if client is initialized
-    if dg_client is None:
+    client = client or dg_client
+    if codec:
+        # Compressed uploads go straight to the HTTP API, not through the SDK
+        if not os.environ.get("DEEPGRAM_API_KEY"):
+            raise APIError("DEEPGRAM_API_KEY environment variable is not set")
+    elif client is None:
+        # Check if client is initialized
         raise APIError("Deepgram client not initialized. Please set DEEPGRAM_API_KEY environment variable.")
     
     # Check if file exists
@@ -43,60 +76,163 @@ async def transcribe_with_deepgram(file_path):
         raise FileError(f"File not found: {file_path}")
     
     try:
-        # Get clean filename for saving transcript
-        filename_base = os.path.splitext(os.path.basename(file_path))[0]
-        transcript_path = TRANSCRIPTS_DIR / f"{filename_base}_deepgram.txt"
+        # Identify the recording by content, not by name
+        audio_hash = await asyncio.to_thread(hash_file, file_path)
+        transcript_path = transcript_cache.transcript_path_for(
+            file_path, audio_hash, suffix="_deepgram"
+        )
+        cache_key = transcript_cache.transcript_key(
+            audio_hash, "deepgram", DEEPGRAM_MODEL, _cache_options(codec)
+        )
+        cached = transcript_cache.lookup(cache_key)
+        if cached is not None:
+            transcript = (cached / transcript_cache.TRANSCRIPT_FILE).read_text(encoding="utf-8")
+            with open(transcript_path, 'w', encoding='utf-8') as f:
+                f.write(transcript)
+            if (cached / transcript_cache.UTTERANCES_FILE).exists():
+                shutil.copyfile(
+                    cached / transcript_cache.UTTERANCES_FILE, utterances_path_for(transcript_path)
+                )
+            logger.info(f"Reused cached transcript for {file_path}")
+            return str(transcript_path)
         
-        logger.info(f"Opening audio file: {file_path}")
-        # Open the audio file
-        with open(file_path, 'rb') as audio:
+        if codec:
+            logger.info(f"Streaming {file_path} to Deepgram as {codec}")
+            # Transcode on the fly and stream the result as the request body
+            response, stats = await transcribe_compressed(
+                file_path, DEEPGRAM_MODEL, DEEPGRAM_OPTIONS, codec, http_client
+            )
+            if on_upload:
+                on_upload(stats)
+        else:
+            logger.info(f"Reading audio file: {file_path}")
+            # Read off the event loop so other uploads keep going
+            audio = await asyncio.to_thread(Path(file_path).read_bytes)
+
             # Set transcription options
-            options = PrerecordedOptions(
-                smart_format=True,
-                model="nova-2",
-                language="en-US",
-                punctuate=True,
-                diarize=True,  # Speaker identification
-                utterances=True,
+            options = PrerecordedOptions(model=DEEPGRAM_MODEL, **DEEPGRAM_OPTIONS)
+
+            logger.info(f"Sending {file_path} to Deepgram")
+            # Send request to Deepgram with the SDK's async client
+            response = await client.listen.asyncprerecorded.v("1").transcribe_file(
+                {"buffer": audio}, options
             )
+            response = response.to_dict()
+
+        # Extract transcript
+        transcript = response["results"]["channels"][0]["alternatives"][0]["transcript"]
+
+        logger.info(f"Writing transcript to {transcript_path}")
+        # Write transcript to file
+        with open(transcript_path, 'w', encoding='utf-8') as f:
+            f.write(transcript)
+        # Keep the speaker turns we paid for next to the text
+        utterances_path = UtteranceTable.from_response(response).save(
+            utterances_path_for(transcript_path)
+        )
+        transcript_cache.store(cache_key, {
+            transcript_cache.TRANSCRIPT_FILE: transcript,
+            transcript_cache.UTTERANCES_FILE: utterances_path,
+        })
             
-            logger.info("Sending request to Deepgram")
-            # Send request to Deepgram
-            response = await dg_client.listen.prerecorded.v("1").transcribe_file(audio, options)
-            
-            logger.info("Extracting transcript from response")
-            # Extract transcript
-            transcript = response.results.channels[0].alternatives[0].transcript
-            
-            logger.info(f"Writing transcript to {transcript_path}")
-            # Write transcript to file
-            with open(transcript_path, 'w', encoding='utf-8') as f:
-                f.write(transcript)
-                
-            logger.info("Transcription completed successfully")
-            return str(transcript_path)
+        logger.info(f"Transcription of {file_path} completed successfully")
+        return str(transcript_path)
     except Exception as e:
         logger.error(f"Deepgram transcription failed: {str(e)}")
         raise TranscriptionError(f"Deepgram transcription failed: {str(e)}")
 
-def transcribe(file_path):
+def transcribe(file_path, on_upload=None):
     """
     Synchronous wrapper for the async transcribe function.
     
     Args:
         file_path: Path to the audio file
+        on_upload: See transcribe_with_deepgram
         
     Returns:
         Path to the transcript file
     """
     try:
-        return asyncio.run(transcribe_with_deepgram(file_path))
+        return asyncio.run(transcribe_with_deepgram(file_path, on_upload=on_upload))
     except Exception as e:
         if isinstance(e, TranscriptionError):
             raise
         else:
             raise TranscriptionError(f"Unexpected error during transcription: {str(e)}")
 
+
+async def transcribe_many_async(paths, concurrency=DEEPGRAM_CONCURRENCY, client=None,
+                                codec=DEEPGRAM_UPLOAD_CODEC):
+    """
+    Transcribe many audio files with Deepgram on one event loop.
+
+    At most ``concurrency`` uploads are in flight at once, all through the
+    same client and its connection pool. Each transcript is written as
+    soon as its response arrives.
+
+    Args:
+        paths: Audio file paths
+        concurrency: Maximum number of requests in flight
+        client: DeepgramClient to use (default: the module's shared client)
+        codec: See transcribe_with_deepgram
+
+    Returns:
+        A BatchReport with per-file latency and errors
+    """
+    # Imported here: batch_transcribe also sets up the Whisper worker pool
+    from batch_transcribe import BatchReport, FileResult
+
+    semaphore = asyncio.Semaphore(concurrency)
+    report = BatchReport(workers=concurrency)
+    http_client = create_http_client() if codec else None
+
+    async def transcribe_one(path):
+        async with semaphore:
+            start = time.perf_counter()
+            uploads = []
+            try:
+                transcript_path = await transcribe_with_deepgram(
+                    path, client, http_client, codec, on_upload=uploads.append
+                )
+                return FileResult(path, "ok", transcript_path, seconds=time.perf_counter() - start,
+                                  upload=uploads[0] if uploads else None)
+            except Exception as e:
+                return FileResult(path, "failed", error=str(e), seconds=time.perf_counter() - start)
+
+    logger.info(f"Transcribing {len(paths)} files with Deepgram, {concurrency} at a time")
+    start = time.perf_counter()
+    try:
+        for finished in asyncio.as_completed([transcribe_one(path) for path in paths]):
+            result = await finished
+            report.results.append(result)
+            logger.info(
+                f"[{len(report.results)}/{len(paths)}] {result.path}: {result.status} "
+                f"({result.seconds:.1f}s)"
+            )
+    finally:
+        if http_client is not None:
+            await http_client.aclose()
+    report.wall_seconds = time.perf_counter() - start
+    return report
+
+
+def transcribe_many(source, concurrency=None):
+    """
+    Transcribe a batch of recordings with Deepgram.
+
+    Args:
+        source: Directory, glob pattern or manifest (see batch_transcribe.collect_inputs)
+        concurrency: Maximum number of requests in flight (default: DEEPGRAM_CONCURRENCY)
+
+    Returns:
+        A BatchReport with per-file results and throughput
+    """
+    from batch_transcribe import collect_inputs
+
+    paths = collect_inputs(source)
+    return asyncio.run(transcribe_many_async(paths, concurrency or DEEPGRAM_CONCURRENCY))
+
+
 if __name__ == "__main__":
     import sys
     
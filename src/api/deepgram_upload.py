@@ -0,0 +1,103 @@
+import os
+import time
+from dataclasses import dataclass
+import httpx
+from audio import SPEECH_ENCODINGS, stream_encoded
+from utils.error_handler import APIError, FileError, logger
+from config import DEEPGRAM_API_URL, DEEPGRAM_TIMEOUT
+
+
+@dataclass
+class UploadStats:
+    """Size and duration of one compressed upload."""
+
+    source_bytes: int
+    uploaded_bytes: int
+    seconds: float
+
+    @property
+    def saved_bytes(self):
+        return self.source_bytes - self.uploaded_bytes
+
+    @property
+    def raw_upload_seconds(self):
+        """Estimated time to send the original file at the throughput seen for this upload."""
+        if not self.uploaded_bytes:
+            return 0.0
+        return self.seconds * self.source_bytes / self.uploaded_bytes
+
+    def format(self):
+        saved = 100.0 * self.saved_bytes / self.source_bytes if self.source_bytes else 0.0
+        return (
+            f"uploaded {self.uploaded_bytes / 1e6:.1f} MB instead of "
+            f"{self.source_bytes / 1e6:.1f} MB ({saved:.0f}% smaller) in {self.seconds:.1f}s; "
+            f"the original would take ~{self.raw_upload_seconds:.1f}s at the same throughput"
+        )
+
+
+def create_http_client():
+    """Return an HTTP client for Deepgram uploads; share one across concurrent uploads."""
+    return httpx.AsyncClient(timeout=httpx.Timeout(DEEPGRAM_TIMEOUT, connect=10.0))
+
+
+async def transcribe_compressed(file_path, model, options, codec="opus", http_client=None,
+                                api_key=None, url=DEEPGRAM_API_URL):
+    """
+    Send an audio file to Deepgram's prerecorded API as compact speech audio.
+
+    ffmpeg transcodes the file to 16 kHz mono ``codec`` and its output is
+    streamed as the request body while it is produced (chunked transfer),
+    so the upload never buffers the whole file or writes a temporary copy.
+
+    Args:
+        file_path: Path to the audio file
+        model: Deepgram model name
+        options: Deepgram query options (e.g. {"diarize": True})
+        codec: Key of audio.SPEECH_ENCODINGS
+        http_client: httpx.AsyncClient to send with (default: a new one)
+        api_key: Deepgram API key (default: DEEPGRAM_API_KEY)
+        url: Deepgram listen endpoint
+
+    Returns:
+        (response JSON, UploadStats)
+
+    Raises:
+        FileError: If the file does not exist
+        APIError: If no API key is set or Deepgram rejects the request
+    """
+    if not os.path.exists(file_path):
+        raise FileError(f"File not found: {file_path}")
+    api_key = api_key or os.environ.get("DEEPGRAM_API_KEY")
+    if not api_key:
+        raise APIError("DEEPGRAM_API_KEY environment variable is not set")
+
+    stats = UploadStats(source_bytes=os.path.getsize(file_path), uploaded_bytes=0, seconds=0.0)
+    start = time.perf_counter()
+
+    async def body():
+        async for chunk in stream_encoded(file_path, codec):
+            stats.uploaded_bytes += len(chunk)
+            yield chunk
+        stats.seconds = time.perf_counter() - start
+
+    _, content_type = SPEECH_ENCODINGS[codec]
+    owns_client = http_client is None
+    http_client = http_client or create_http_client()
+    try:
+        response = await http_client.post(
+            url,
+            params={"model": model, **options},
+            headers={"Authorization": f"Token {api_key}", "Content-Type": content_type},
+            content=body(),
+        )
+    finally:
+        if owns_client:
+            await http_client.aclose()
+
+    if response.status_code >= 400:
+        raise APIError(
+            f"Deepgram returned {response.status_code}: {response.text[:200]}",
+            status_code=response.status_code,
+        )
+    logger.info(f"{file_path}: {stats.format()}")
+    return response.json(), stats
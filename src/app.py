@@ -9,9 +9,10 @@ sys.path.append(str(Path(__file__).parent))
 
 from utils.logging_config import setup_logging
 from utils.error_handler import handle_error
-from transcribe import transcribe
-from api.deepgram_transcribe import transcribe as deepgram_transcribe
-from summary import append_summary_to_file
+from config import TRANSCRIBE_WORKERS, CHECKPOINT_ENABLED
+
+# Engines are imported inside the branch that uses them so that --help and
+# --record start without loading NumPy, the Deepgram SDK or transformers.
 
 # Initialize logging
 logger = setup_logging()
@@ -25,6 +26,30 @@ def main():
     parser.add_argument("--transcribe", type=str, help="Transcribe an audio file")
     parser.add_argument("--summarize", type=str, help="Summarize a transcript file")
     parser.add_argument("--deepgram", type=str, help="Transcribe using Deepgram")
+    parser.add_argument("--model", type=str, help="Whisper model to use (default: config)")
+    parser.add_argument("--deadline", type=float,
+                        help="Seconds a transcription may take; picks a faster model if needed")
+    parser.add_argument("--calibrate", nargs="?", const=True, metavar="RECORDING",
+                        help="Benchmark Whisper models on this machine and save a profile "
+                             "(on a lecture recording if given, else synthetic audio)")
+    parser.add_argument("--resumable", action="store_true",
+                        help="Journal long transcriptions window by window so an "
+                             "interrupted run picks up where it stopped")
+    parser.add_argument("--no-vad", action="store_true",
+                        help="Transcribe silent stretches instead of skipping them")
+    parser.add_argument("--batch", type=str,
+                        help="Transcribe a directory, glob pattern or manifest of recordings")
+    parser.add_argument("--live", nargs="?", const="mic", metavar="AUDIO_FILE",
+                        help="Record and transcribe with Deepgram as you speak "
+                             "(or stream an audio file through the live API)")
+    parser.add_argument("--deepgram-batch", type=str,
+                        help="Transcribe a directory, glob pattern or manifest with Deepgram")
+    parser.add_argument("--workers", type=int,
+                        help="Worker processes for --batch, or per recording for --transcribe; "
+                             "uploads in flight for --deepgram-batch")
+    parser.add_argument("--auto", type=str,
+                        help="Transcribe a file, directory, glob pattern or manifest with "
+                             "Deepgram, falling back to local Whisper when it fails")
     
     args = parser.parse_args()
     
@@ -45,7 +70,15 @@ def main():
         # Transcribe audio
         elif args.transcribe:
             logger.info(f"Starting transcription of {args.transcribe}")
-            transcript_path = transcribe(args.transcribe)
+            from transcribe import transcribe
+            transcript_path = transcribe(
+                args.transcribe,
+                model_name=args.model,
+                use_vad=not args.no_vad,
+                workers=args.workers or TRANSCRIBE_WORKERS,
+                checkpoint=args.resumable or CHECKPOINT_ENABLED,
+                deadline=args.deadline,
+            )
             
             if transcript_path:
                 print(f"\n🎉 Transcription complete!")
@@ -53,25 +86,101 @@ def main():
                 print("\nTo summarize this transcript, run:")
                 print(f"python app.py --summarize {transcript_path}")
         
+        # Measure models on this machine
+        elif args.calibrate:
+            logger.info("Starting Whisper calibration")
+            from calibrate import calibrate, format_profile
+            models = [args.model] if args.model else ["tiny", "base", "small"]
+            sample_path = None if args.calibrate is True else args.calibrate
+            profile = calibrate(models=models, sample_path=sample_path)
+
+            print("\n📊 Calibration complete:")
+            print(format_profile(profile))
+
+        # Transcribe many recordings
+        elif args.batch:
+            logger.info(f"Starting batch transcription of {args.batch}")
+            from batch_transcribe import transcribe_batch
+            report = transcribe_batch(args.batch, workers=args.workers, model_name=args.model)
+
+            print("\n📚 Batch transcription finished:")
+            print(report.format())
+            if report.failed:
+                sys.exit(1)
+
         # Summarize transcript
         elif args.summarize:
             logger.info(f"Starting summarization of {args.summarize}")
-            append_summary_to_file(args.summarize)
+            from summary import summarize_transcript_file
+            print()
+            # Print the summary as it is generated
+            summary_path = summarize_transcript_file(
+                args.summarize, on_delta=lambda text: print(text, end="", flush=True)
+            )
             
-            print(f"\n🎉 Summarization complete!")
-            print(f"📝 Summary appended to: {args.summarize}")
+            print("\n\n🎉 Summarization complete!")
+            print(f"📝 Summary saved to: {summary_path}")
         
         # Transcribe with Deepgram
         elif args.deepgram:
             logger.info(f"Starting Deepgram transcription of {args.deepgram}")
-            transcript_path = deepgram_transcribe(args.deepgram)
+            from api.deepgram_transcribe import transcribe as deepgram_transcribe
+            uploads = []
+            transcript_path = deepgram_transcribe(args.deepgram, on_upload=uploads.append)
             
             if transcript_path:
                 print(f"\n🎉 Deepgram transcription complete!")
                 print(f"📝 Transcript saved to: {transcript_path}")
+                for stats in uploads:
+                    print(f"📦 {stats.format()}")
                 print("\nTo summarize this transcript, run:")
                 print(f"python app.py --summarize {transcript_path}")
         
+        # Record and transcribe live with Deepgram
+        elif args.live:
+            from api.deepgram_live import record_live, transcribe_file_live
+
+            def print_event(event):
+                # Interim text is redrawn in place until its final version arrives
+                end = "\n" if event.is_final else ""
+                print(f"\r\033[K{event.text}", end=end, flush=True)
+
+            if args.live == "mic":
+                logger.info("Starting live recording and transcription")
+                print("🎤 Live transcription started. Press Ctrl+C to stop.")
+                recording_path, transcript_path = record_live(print_event)
+                print(f"\n📁 Recording saved to: {recording_path}")
+            else:
+                logger.info(f"Starting live transcription of {args.live}")
+                transcript_path = transcribe_file_live(args.live, print_event)
+
+            print("\n🎉 Live transcription complete!")
+            print(f"📝 Transcript saved to: {transcript_path}")
+            print("\nTo summarize this transcript, run:")
+            print(f"python app.py --summarize {transcript_path}")
+
+        # Transcribe many recordings with Deepgram
+        elif args.deepgram_batch:
+            logger.info(f"Starting Deepgram batch transcription of {args.deepgram_batch}")
+            from api.deepgram_transcribe import transcribe_many
+            report = transcribe_many(args.deepgram_batch, concurrency=args.workers)
+
+            print("\n📚 Deepgram batch transcription finished:")
+            print(report.format())
+            if report.failed:
+                sys.exit(1)
+
+        # Transcribe through the engine router
+        elif args.auto:
+            logger.info(f"Starting routed transcription of {args.auto}")
+            from transcription_router import transcribe_auto
+            report = transcribe_auto(args.auto)
+
+            print("\n📚 Transcription finished:")
+            print(report.format())
+            if report.failed:
+                sys.exit(1)
+
         else:
             parser.print_help()
             
@@ -0,0 +1,225 @@
+import shutil
+import asyncio
+import subprocess
+import numpy as np
+from utils.error_handler import TranscriptionError, AudioDecodeError
+
+SAMPLE_RATE = 16000  # Sample rate required by whisper
+BYTES_PER_SAMPLE = 2  # 16-bit PCM
+
+# Compact speech encodings for uploads: (ffmpeg output arguments, MIME type)
+SPEECH_ENCODINGS = {
+    "opus": (["-c:a", "libopus", "-b:a", "24k", "-application", "voip", "-f", "ogg"], "audio/ogg"),
+    "flac": (["-c:a", "flac", "-f", "flac"], "audio/flac"),
+}
+
+
+def check_ffmpeg():
+    """Check if ffmpeg is installed."""
+    if shutil.which("ffmpeg") is None:
+        raise TranscriptionError("ffmpeg is not installed or not found in system PATH.")
+
+
+def probe_duration(input_path):
+    """
+    Return a file's duration in seconds from its container, or None if unknown.
+
+    ffprobe reads only the header, which is far cheaper than decoding.
+    """
+    if shutil.which("ffprobe") is None:
+        return None
+    try:
+        proc = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(input_path),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+        return float(proc.stdout.decode("utf-8").strip())
+    except (subprocess.CalledProcessError, ValueError):
+        return None
+
+
+def pcm16_to_float32(data):
+    """
+    Convert raw little-endian 16-bit PCM bytes to float32 samples in [-1, 1).
+
+    Args:
+        data: Bytes-like object of s16le samples
+
+    Returns:
+        A 1-D float32 NumPy array
+    """
+    usable = len(data) - (len(data) % BYTES_PER_SAMPLE)
+    samples = np.frombuffer(data, dtype="<i2", count=usable // BYTES_PER_SAMPLE)
+    return samples.astype(np.float32) / 32768.0
+
+
+def _ffmpeg_command(input_path, sr):
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-threads", "0",
+        "-i", str(input_path),
+        "-f", "s16le",       # Raw PCM on stdout, no container
+        "-acodec", "pcm_s16le",
+        "-ac", "1",          # Mono channel
+        "-ar", str(sr),
+        "-",
+    ]
+
+
+def load_audio(input_path, sr=SAMPLE_RATE):
+    """
+    Decode any audio file ffmpeg understands into a mono float32 array.
+
+    ffmpeg writes raw PCM to a pipe, so nothing touches the disk and the
+    result can be handed straight to ``model.transcribe``.
+
+    Args:
+        input_path: Path to the input audio file
+        sr: Target sample rate
+
+    Returns:
+        A 1-D float32 NumPy array sampled at ``sr``
+    """
+    check_ffmpeg()
+    try:
+        proc = subprocess.run(
+            _ffmpeg_command(input_path, sr),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        stderr = e.stderr.decode("utf-8", errors="replace").strip().splitlines()
+        detail = stderr[-1] if stderr else str(e)
+        raise AudioDecodeError(f"Failed to decode audio: {detail}")
+    return pcm16_to_float32(proc.stdout)
+
+
+def iter_audio_chunks(input_path, chunk_seconds=30, sr=SAMPLE_RATE):
+    """
+    Stream-decode an audio file in fixed-size chunks.
+
+    Only one chunk is held in memory at a time, which keeps memory flat for
+    multi-hour recordings.
+
+    Args:
+        input_path: Path to the input audio file
+        chunk_seconds: Length of each yielded chunk in seconds
+        sr: Target sample rate
+
+    Yields:
+        1-D float32 NumPy arrays; the last one may be shorter
+    """
+    check_ffmpeg()
+    chunk_bytes = int(chunk_seconds * sr) * BYTES_PER_SAMPLE
+    proc = subprocess.Popen(
+        _ffmpeg_command(input_path, sr),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    finished = False
+    try:
+        while True:
+            data = proc.stdout.read(chunk_bytes)
+            if not data:
+                finished = True
+                break
+            yield pcm16_to_float32(data)
+    finally:
+        proc.stdout.close()
+        if not finished:
+            # The caller stopped early; don't leave ffmpeg running
+            proc.kill()
+        returncode = proc.wait()
+    if returncode != 0:
+        raise AudioDecodeError(f"Failed to decode audio: ffmpeg exited with {returncode}")
+
+
+def _encode_command(input_path, codec, sr):
+    arguments, _ = SPEECH_ENCODINGS[codec]
+    return [
+        "ffmpeg",
+        "-nostdin",
+        "-i", str(input_path),
+        "-vn",
+        "-ac", "1",
+        "-ar", str(sr),
+        *arguments,
+        "-",
+    ]
+
+
+async def stream_encoded(input_path, codec="opus", sr=SAMPLE_RATE, chunk_bytes=64 * 1024):
+    """
+    Transcode an audio file to compact mono speech audio, streamed from an ffmpeg pipe.
+
+    Nothing is written to disk and only one chunk is held in memory, so
+    the output can be sent as a request body while ffmpeg is still
+    encoding.
+
+    Args:
+        input_path: Path to the input audio file
+        codec: Key of SPEECH_ENCODINGS
+        sr: Target sample rate
+        chunk_bytes: Maximum size of each yielded chunk
+
+    Yields:
+        Encoded bytes
+    """
+    if codec not in SPEECH_ENCODINGS:
+        raise TranscriptionError(f"Unsupported upload codec: {codec}")
+    async for data in _stream_ffmpeg(_encode_command(input_path, codec, sr), chunk_bytes):
+        yield data
+
+
+async def stream_pcm(input_path, chunk_seconds=0.1, sr=SAMPLE_RATE):
+    """
+    Stream-decode an audio file to raw mono s16le PCM on an asyncio pipe.
+
+    Yields:
+        Bytes of ``chunk_seconds`` of audio each; the last may be shorter
+    """
+    chunk_bytes = int(chunk_seconds * sr) * BYTES_PER_SAMPLE
+    async for data in _stream_ffmpeg(_ffmpeg_command(input_path, sr), chunk_bytes):
+        yield data
+
+
+async def _stream_ffmpeg(command, chunk_bytes):
+    check_ffmpeg()
+    proc = await asyncio.create_subprocess_exec(
+        *command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+    finished = False
+    try:
+        while True:
+            # readexactly keeps chunks whole, which matters for PCM sample alignment
+            try:
+                data = await proc.stdout.readexactly(chunk_bytes)
+            except asyncio.IncompleteReadError as e:
+                data = e.partial
+            if not data:
+                finished = True
+                break
+            yield data
+    finally:
+        if not finished:
+            # The consumer stopped early; don't leave ffmpeg running
+            proc.kill()
+        returncode = await proc.wait()
+    if returncode != 0:
+        raise AudioDecodeError(f"Failed to process audio: ffmpeg exited with {returncode}")
+
+
+def duration_seconds(audio, sr=SAMPLE_RATE):
+    """Return the duration of a decoded audio array in seconds."""
+    return len(audio) / float(sr)
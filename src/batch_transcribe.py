@@ -0,0 +1,190 @@
+import os
+import csv
+import glob
+import json
+import time
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from utils.error_handler import FileError, logger
+from model_registry import init_worker
+from config import WHISPER_MODEL
+
+AUDIO_EXTENSIONS = (".mp3", ".wav", ".m4a", ".flac", ".ogg", ".aac", ".mp4", ".webm")
+MANIFEST_EXTENSIONS = (".txt", ".csv", ".jsonl")
+
+
+@dataclass
+class FileResult:
+    path: str
+    status: str
+    transcript_path: str = None
+    error: str = None
+    seconds: float = 0.0
+    engine: str = None
+    upload: object = None  # api.deepgram_upload.UploadStats of a compressed upload
+
+
+@dataclass
+class BatchReport:
+    results: list = field(default_factory=list)
+    wall_seconds: float = 0.0
+    workers: int = 1
+
+    @property
+    def succeeded(self):
+        return [r for r in self.results if r.status == "ok"]
+
+    @property
+    def failed(self):
+        return [r for r in self.results if r.status != "ok"]
+
+    @property
+    def files_per_minute(self):
+        if self.wall_seconds <= 0:
+            return 0.0
+        return len(self.results) * 60.0 / self.wall_seconds
+
+    def format(self):
+        """Render a human-readable summary of the batch."""
+        lines = []
+        for r in sorted(self.results, key=lambda r: r.path):
+            if r.status == "ok":
+                via = f" via {r.engine}" if r.engine else ""
+                lines.append(f"  ✅ {r.path} ({r.seconds:.1f}s{via}) → {r.transcript_path}")
+            else:
+                lines.append(f"  ❌ {r.path} ({r.seconds:.1f}s): {r.error}")
+        lines.append("")
+        lines.append(
+            f"{len(self.succeeded)}/{len(self.results)} files transcribed in "
+            f"{self.wall_seconds:.1f}s with {self.workers} worker(s) "
+            f"({self.files_per_minute:.1f} files/min)"
+        )
+        uploads = [r.upload for r in self.results if r.upload is not None]
+        if uploads:
+            source = sum(u.source_bytes for u in uploads)
+            uploaded = sum(u.uploaded_bytes for u in uploads)
+            saved = 100.0 * (source - uploaded) / source if source else 0.0
+            lines.append(
+                f"Uploaded {uploaded / 1e6:.1f} MB instead of {source / 1e6:.1f} MB "
+                f"({saved:.0f}% smaller) for {len(uploads)} file(s)"
+            )
+        if self.failed:
+            lines.append(f"{len(self.failed)} file(s) failed")
+        return "\n".join(lines)
+
+
+def _read_manifest(manifest_path):
+    base_dir = os.path.dirname(os.path.abspath(manifest_path))
+    ext = os.path.splitext(manifest_path)[1].lower()
+    entries = []
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        if ext == ".csv":
+            for row in csv.reader(f):
+                if row and row[0].strip() and row[0].strip().lower() != "path":
+                    entries.append(row[0].strip())
+        elif ext == ".jsonl":
+            for line in f:
+                if line.strip():
+                    entries.append(json.loads(line)["path"])
+        else:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    entries.append(line)
+    return [p if os.path.isabs(p) else os.path.join(base_dir, p) for p in entries]
+
+
+def collect_inputs(source):
+    """
+    Resolve a batch source into a list of audio file paths.
+
+    Args:
+        source: A directory, a glob pattern, or a manifest file
+            (.txt with one path per line, .csv with paths in the first
+            column, or .jsonl with a "path" field)
+
+    Returns:
+        Sorted list of unique file paths
+    """
+    if os.path.isdir(source):
+        paths = [
+            os.path.join(source, name)
+            for name in os.listdir(source)
+            if os.path.splitext(name)[1].lower() in AUDIO_EXTENSIONS
+        ]
+    elif os.path.isfile(source) and source.lower().endswith(MANIFEST_EXTENSIONS):
+        paths = _read_manifest(source)
+    elif os.path.isfile(source):
+        paths = [source]
+    else:
+        paths = glob.glob(source, recursive=True)
+
+    if not paths:
+        raise FileError(f"No audio files found for batch source: {source}")
+    return sorted(set(paths))
+
+
+def _transcribe_one(path, model_name):
+    from transcribe import transcribe
+
+    start = time.perf_counter()
+    try:
+        transcript_path = transcribe(path, model_name=model_name)
+        return FileResult(path, "ok", transcript_path, seconds=time.perf_counter() - start)
+    except Exception as e:
+        return FileResult(path, "failed", error=str(e), seconds=time.perf_counter() - start)
+
+
+def transcribe_batch(source, workers=None, model_name=None):
+    """
+    Transcribe many recordings using a pool of warm Whisper workers.
+
+    Each worker process loads its model once at startup and then serves
+    files from the queue, so the load cost is paid per worker, not per file.
+
+    Args:
+        source: Directory, glob pattern or manifest (see collect_inputs)
+        workers: Number of worker processes (default: CPU count)
+        model_name: Whisper model to use (default: config.WHISPER_MODEL with
+            several workers; a single worker lets the calibration profile
+            pick one per file, see transcribe)
+
+    Returns:
+        A BatchReport with per-file results and throughput
+    """
+    paths = collect_inputs(source)
+    cpus = os.cpu_count() or 1
+    workers = max(1, min(workers or cpus, len(paths)))
+    threads = max(1, cpus // workers)
+    report = BatchReport(workers=workers)
+
+    logger.info(f"Transcribing {len(paths)} files with {workers} worker(s)")
+    start = time.perf_counter()
+
+    if workers == 1:
+        for path in paths:
+            result = _transcribe_one(path, model_name)
+            report.results.append(result)
+            logger.info(f"[{len(report.results)}/{len(paths)}] {path}: {result.status}")
+    else:
+        # Every worker serves the model it preloaded: letting each file pick
+        # one from the calibration profile would load a second model per
+        # worker and override the per-worker thread cap
+        model_name = model_name or WHISPER_MODEL
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(model_name, None, None, threads),
+        ) as pool:
+            futures = {pool.submit(_transcribe_one, path, model_name): path for path in paths}
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # The worker itself died (e.g. out of memory)
+                    result = FileResult(futures[future], "failed", error=str(e))
+                report.results.append(result)
+                logger.info(f"[{len(report.results)}/{len(paths)}] {result.path}: {result.status}")
+
+    report.wall_seconds = time.perf_counter() - start
+    return report
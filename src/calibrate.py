@@ -0,0 +1,240 @@
+import os
+import sys
+import json
+import time
+import platform
+import multiprocessing
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from utils.error_handler import handle_error, logger
+from utils.synthetic_audio import synthetic_speech
+from config import (
+    WHISPER_DEVICE,
+    WHISPER_PROFILE_PATH,
+    WHISPER_TARGET_RTF,
+)
+
+# Smallest to largest; later entries are assumed to be more accurate
+MODEL_QUALITY_ORDER = ("tiny", "base", "small", "medium", "large")
+
+
+def peak_rss_mb():
+    """Return this process's peak resident set size in MB, or None if unknown."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    if sys.platform == "darwin":
+        return peak / (1024 * 1024)
+    return peak / 1024
+
+
+def default_thread_counts():
+    """Thread counts worth trying on this machine: powers of two up to the CPU count."""
+    cpus = os.cpu_count() or 1
+    counts = []
+    n = 1
+    while n < cpus:
+        counts.append(n)
+        n *= 2
+    counts.append(cpus)
+    return counts
+
+
+def load_sample(sample_seconds, sample_path=None):
+    """
+    Return the audio to calibrate on.
+
+    Whisper's decoding cost depends on what it hears: synthetic noise
+    triggers no-speech and temperature fallbacks that real lectures rarely
+    do. A real recording gives representative numbers, so when one is
+    given its middle ``sample_seconds`` are used.
+    """
+    if sample_path is None:
+        return synthetic_speech(sample_seconds)
+    from audio import SAMPLE_RATE, load_audio
+
+    audio = load_audio(sample_path)
+    length = int(sample_seconds * SAMPLE_RATE)
+    start = max(0, (len(audio) - length) // 2)
+    return audio[start:start + length]
+
+
+def _measure(model_name, threads, device, precision, sample_seconds, sample_path=None):
+    """Measure one configuration. Runs in a fresh process so RSS is not shared."""
+    from audio import SAMPLE_RATE
+    from model_registry import load_whisper_model, set_torch_threads
+
+    set_torch_threads(threads)
+    audio = load_sample(sample_seconds, sample_path)
+    sample_seconds = len(audio) / SAMPLE_RATE
+
+    start = time.perf_counter()
+    model = load_whisper_model(model_name, device, precision)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    model.transcribe(audio, fp16=precision == "fp16")
+    inference_seconds = time.perf_counter() - start
+
+    return {
+        "model": model_name,
+        "threads": threads,
+        "device": device,
+        "precision": precision,
+        "load_seconds": round(load_seconds, 3),
+        "rtf": round(inference_seconds / sample_seconds, 4),
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def calibrate(models=("tiny", "base", "small"), thread_counts=None, device=WHISPER_DEVICE,
+              sample_seconds=60, profile_path=WHISPER_PROFILE_PATH, sample_path=None):
+    """
+    Benchmark Whisper models on this machine and save a profile.
+
+    Every (model, thread count, precision) combination is measured in its
+    own short-lived process on the same sample, recording load time,
+    real-time factor (processing time / audio time) and peak memory.
+
+    Args:
+        models: Model names to measure
+        thread_counts: Torch thread counts to try (default: powers of two
+            up to the CPU count)
+        device: Device to run on
+        sample_seconds: Length of the sample
+        profile_path: Where to write the profile
+        sample_path: A real lecture recording to measure on; its RTF is far
+            more representative than the synthetic sample used otherwise
+
+    Returns:
+        The profile dict
+    """
+    precisions = ["fp32"] if device == "cpu" else ["fp32", "fp16"]
+    results = []
+    context = multiprocessing.get_context("spawn")
+
+    for model_name in models:
+        for threads in thread_counts or default_thread_counts():
+            for precision in precisions:
+                logger.info(f"Calibrating {model_name} with {threads} thread(s), {precision}")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                    future = pool.submit(
+                        _measure, model_name, threads, device, precision, sample_seconds,
+                        sample_path,
+                    )
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        logger.warning(f"Calibration of {model_name} failed: {str(e)}")
+                        continue
+                logger.info(f"  RTF {result['rtf']:.3f}, load {result['load_seconds']:.1f}s")
+                results.append(result)
+
+    profile = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "host": {
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "sample_seconds": sample_seconds,
+        "sample": str(sample_path) if sample_path else "synthetic",
+        "results": results,
+    }
+    save_profile(profile, profile_path)
+    return profile
+
+
+def save_profile(profile, path=WHISPER_PROFILE_PATH):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2)
+
+
+def load_profile(path=WHISPER_PROFILE_PATH):
+    """Return the saved calibration profile, or None if there is none."""
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable calibration profile {path}: {str(e)}")
+        return None
+
+
+def _quality(model_name):
+    base_name = model_name.split(".")[0].split("-")[0]
+    if base_name in MODEL_QUALITY_ORDER:
+        return MODEL_QUALITY_ORDER.index(base_name)
+    return -1
+
+
+def select_model(duration_seconds, target_rtf=WHISPER_TARGET_RTF, deadline_seconds=None,
+                 profile=None, device=None):
+    """
+    Pick the most accurate calibrated configuration that is fast enough.
+
+    Args:
+        duration_seconds: Length of the recording to transcribe
+        target_rtf: Highest acceptable real-time factor
+        deadline_seconds: Optional wall-clock budget for this recording;
+            tightens the RTF target to deadline / duration
+        profile: Calibration profile (default: the saved one)
+        device: Only consider results measured on this device
+
+    Returns:
+        The chosen profile entry ({"model", "threads", "precision", "rtf", ...}),
+        or None if no profile is available
+    """
+    profile = profile or load_profile()
+    if not profile or not profile.get("results"):
+        return None
+
+    results = profile["results"]
+    if device:
+        results = [r for r in results if r.get("device") == device] or results
+
+    target = target_rtf
+    if deadline_seconds and duration_seconds > 0:
+        target = min(target, deadline_seconds / duration_seconds)
+
+    eligible = [r for r in results if r["rtf"] <= target]
+    if eligible:
+        choice = max(eligible, key=lambda r: (_quality(r["model"]), -r["rtf"]))
+    else:
+        choice = min(results, key=lambda r: r["rtf"])
+        logger.warning(
+            f"No calibrated model meets RTF {target:.3f}; using the fastest ({choice['model']})"
+        )
+    logger.info(
+        f"Selected {choice['model']} ({choice['precision']}, {choice['threads']} threads, "
+        f"RTF {choice['rtf']:.3f}) for {duration_seconds:.0f}s of audio"
+    )
+    return choice
+
+
+def format_profile(profile):
+    """Render a calibration profile as a table."""
+    lines = [f"{'model':<10}{'threads':>8}{'prec':>6}{'RTF':>9}{'load s':>9}{'RSS MB':>9}"]
+    for r in sorted(profile["results"], key=lambda r: (_quality(r["model"]), r["threads"])):
+        rss = f"{r['peak_rss_mb']:.0f}" if r.get("peak_rss_mb") else "-"
+        lines.append(
+            f"{r['model']:<10}{r['threads']:>8}{r['precision']:>6}"
+            f"{r['rtf']:>9.3f}{r['load_seconds']:>9.1f}{rss:>9}"
+        )
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    try:
+        profile = calibrate(models=sys.argv[1:] or ("tiny", "base", "small"))
+        print(format_profile(profile))
+        print(f"Profile saved to: {WHISPER_PROFILE_PATH}")
+    except Exception as e:
+        error_message = handle_error(e, "calibrate.py")
+        print(f"Error: {error_message}")
+        sys.exit(1)
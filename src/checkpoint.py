@@ -0,0 +1,88 @@
+import os
+import json
+from pathlib import Path
+from utils.error_handler import logger
+
+JOURNAL_VERSION = 1
+
+
+class TranscriptionJournal:
+    """
+    Append-only sidecar journal of finished transcription windows.
+
+    The first line is a header describing the job (audio hash, model,
+    options and window plan). Every finished window is appended as one
+    JSON line and fsynced, so a crash loses at most the window in flight.
+    On restart, a journal whose header matches the job is resumed; any
+    other journal is discarded.
+    """
+
+    def __init__(self, path, header):
+        self.path = Path(path)
+        # Round-trip through JSON so it compares equal to what is read back
+        self.header = json.loads(json.dumps(dict(header, type="header", version=JOURNAL_VERSION)))
+        self._completed = {}
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            self._rewrite()
+            return
+
+        records, damaged = [], False
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A torn write from the crash we are recovering from
+                    damaged = True
+
+        if not records or records[0] != self.header:
+            logger.info(f"Ignoring stale transcription journal {self.path}")
+            self._rewrite()
+            return
+
+        for record in records[1:]:
+            if record.get("type") == "window":
+                self._completed[record["index"]] = record["result"]
+        if damaged:
+            self._rewrite()
+        if self._completed:
+            logger.info(f"Resuming transcription: {len(self._completed)} window(s) already done")
+
+    def _rewrite(self):
+        """Rewrite the journal from memory, replacing whatever is on disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self.header) + "\n")
+            for index, result in sorted(self._completed.items()):
+                f.write(self._window_line(index, result))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _window_line(index, result):
+        record = {"type": "window", "index": index, "result": result}
+        return json.dumps(record, default=float) + "\n"
+
+    def completed(self):
+        """Return {window index: result} for every window already finished."""
+        return dict(self._completed)
+
+    def record(self, index, result):
+        """Durably record a finished window."""
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(self._window_line(index, result))
+            f.flush()
+            os.fsync(f.fileno())
+        self._completed[index] = result
+
+    def discard(self):
+        """Delete the journal once the transcript has been written."""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,160 @@
+import re
+import numpy as np
+from text_chunking import split_sentences
+from config import EXTRACTIVE_RATIO, EXTRACTIVE_MIN_TOKENS, EXTRACTIVE_SECTIONS
+
+# Rough size of a token in English text, when no tokenizer is at hand
+CHARS_PER_TOKEN = 4
+
+# TextRank runs within blocks of at most this many consecutive sentences,
+# which keeps the similarity matrix small and spreads picks over the lecture
+BLOCK_SENTENCES = 400
+
+STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have he her his i if in into is it its "
+    "just like me my no not of on or our so she that the their them then there these "
+    "they this to um uh was we were what when which who will with would yeah you your "
+    "okay ok right gonna".split()
+)
+
+
+def estimate_tokens(sentences):
+    """Approximate token counts from character counts."""
+    return [len(s) // CHARS_PER_TOKEN + 1 for s in sentences]
+
+
+def _words(sentence):
+    return [w for w in re.findall(r"[a-z0-9']+", sentence.lower()) if w not in STOPWORDS]
+
+
+def tfidf_matrix(sentences):
+    """
+    Build L2-normalized TF-IDF row vectors for a list of sentences.
+
+    Returns:
+        float32 array of shape (len(sentences), vocabulary size)
+    """
+    vocabulary = {}
+    rows, cols = [], []
+    for i, sentence in enumerate(sentences):
+        for word in _words(sentence):
+            rows.append(i)
+            cols.append(vocabulary.setdefault(word, len(vocabulary)))
+
+    counts = np.zeros((len(sentences), max(1, len(vocabulary))), dtype=np.float32)
+    np.add.at(counts, (np.array(rows, dtype=np.int64), np.array(cols, dtype=np.int64)), 1.0)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(sentences)) / (1 + document_frequency)) + 1.0
+    weights = np.log1p(counts) * idf.astype(np.float32)
+    norms = np.linalg.norm(weights, axis=1, keepdims=True)
+    return weights / np.where(norms == 0, 1.0, norms)
+
+
+def textrank(vectors, damping=0.85, iterations=50, tolerance=1e-6):
+    """
+    Score sentences by PageRank over their cosine-similarity graph.
+
+    Args:
+        vectors: L2-normalized sentence vectors, one row per sentence
+
+    Returns:
+        float64 array of scores that sums to 1
+    """
+    n = len(vectors)
+    if n == 0:
+        return np.zeros(0)
+    similarity = vectors @ vectors.T
+    np.fill_diagonal(similarity, 0.0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # Sentences with no similar neighbours link to everyone equally
+    linked = out_weight > 0
+    transition = np.where(linked, similarity / np.where(linked, out_weight, 1), 1 / n)
+
+    scores = np.full(n, 1.0 / n)
+    for _ in range(iterations):
+        updated = (1 - damping) / n + damping * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < tolerance:
+            scores = updated
+            break
+        scores = updated
+    return scores / scores.sum()
+
+
+def rank_sentences(sentences):
+    """
+    Score sentences block by block with TextRank over TF-IDF vectors.
+
+    Scores are normalized within each block, so every stretch of the
+    lecture competes on equal terms.
+    """
+    scores = np.zeros(len(sentences))
+    for start in range(0, len(sentences), BLOCK_SENTENCES):
+        block = sentences[start:start + BLOCK_SENTENCES]
+        scores[start:start + len(block)] = textrank(tfidf_matrix(block)) * len(block)
+    return scores
+
+
+def select_sentences(sentences, counts, budget, sections=EXTRACTIVE_SECTIONS):
+    """
+    Pick the highest-ranked sentences that fit a token budget.
+
+    The budget is shared among ``sections`` consecutive stretches of the
+    text in proportion to their length, so the selection covers the whole
+    transcript instead of clustering where the vocabulary is richest.
+
+    Args:
+        sentences: Sentences in reading order
+        counts: Token count of each sentence
+        budget: Total token budget
+        sections: Number of stretches the budget is spread over
+
+    Returns:
+        Sorted indices of the selected sentences
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    total = int(counts.sum())
+    if total <= budget:
+        return np.arange(len(sentences))
+
+    scores = rank_sentences(sentences)
+    selected = []
+    bounds = np.linspace(0, len(sentences), min(sections, len(sentences)) + 1).astype(int)
+    carry = 0
+    for lo, hi in zip(bounds[:-1], bounds[1:]):
+        # Unused budget from earlier sections rolls forward
+        allowance = budget * counts[lo:hi].sum() / total + carry
+        for index in lo + np.argsort(-scores[lo:hi], kind="stable"):
+            if counts[index] <= allowance:
+                selected.append(index)
+                allowance -= counts[index]
+        carry = allowance
+    return np.sort(np.array(selected, dtype=np.int64))
+
+
+def extract(text, ratio=EXTRACTIVE_RATIO, min_tokens=EXTRACTIVE_MIN_TOKENS,
+            count_fn=estimate_tokens, sections=EXTRACTIVE_SECTIONS):
+    """
+    Shrink a transcript to its most central sentences, in original order.
+
+    The budget is ``ratio`` of the transcript's tokens, but never less
+    than ``min_tokens``, so short transcripts pass through untouched.
+
+    Args:
+        text: Transcript text
+        ratio: Fraction of tokens to keep
+        min_tokens: Smallest budget
+        count_fn: Maps a list of sentences to their token counts
+        sections: See select_sentences
+
+    Returns:
+        The selected sentences joined by spaces, or the text itself if it
+        already fits
+    """
+    sentences = split_sentences(text)
+    counts = count_fn(sentences)
+    total = sum(counts)
+    budget = max(min_tokens, int(total * ratio))
+    if total <= budget:
+        return text
+    indices = select_sentences(sentences, counts, budget, sections)
+    return " ".join(sentences[i] for i in indices)
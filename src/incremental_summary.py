@@ -0,0 +1,220 @@
+import os
+import json
+import hashlib
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from utils.error_handler import SummarizationError, FileError, logger
+from summary import update_summary, stream_update_summary, STUDY_TIPS
+from summary_store import SummaryStore, hash_transcript
+from transcript_store import interim_path_for
+from config import CLAUDE_MODEL, T5_MODEL, T5_BACKEND
+
+STATE_SUFFIX = ".summary.json"
+STATE_VERSION = 1
+
+# Bytes before the covered offset that must be unchanged for the saved
+# state to still describe the file
+TAIL_BYTES = 4096
+
+# Older versions appended summaries to the transcript itself; text after
+# these markers is not part of the lecture
+LEGACY_SUMMARY_MARKERS = (b"\n\n---\n\nSummary:\n", b"\n\n---\n\nLocal Summary:\n")
+
+
+@dataclass
+class SummaryState:
+    """How much of a transcript the rolling summary covers."""
+
+    covered_bytes: int = 0
+    tail_hash: str = ""
+    summary: str = ""
+    backend: str = ""
+    model: str = ""
+    version: int = STATE_VERSION
+
+
+def state_path_for(transcript_path):
+    transcript_path = Path(transcript_path)
+    return transcript_path.with_name(transcript_path.stem + STATE_SUFFIX)
+
+
+def load_state(path):
+    """Return the saved SummaryState, or None if missing, unreadable or outdated."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        state = SummaryState(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+    return state if state.version == STATE_VERSION else None
+
+
+def save_state(path, state):
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(state), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _tail_hash(f, end):
+    start = max(0, end - TAIL_BYTES)
+    f.seek(start)
+    return hashlib.sha256(f.read(end - start)).hexdigest()
+
+
+def _complete_prefix(data):
+    """
+    Return how many bytes of newly read data from a growing transcript can be summarized now.
+
+    Live transcripts are written a line at a time, so stop after the last
+    newline to avoid summarizing half a sentence. Data without any newline
+    is taken whole, minus an incomplete UTF-8 character at the end.
+    """
+    newline = data.rfind(b"\n")
+    if newline >= 0:
+        return newline + 1
+    try:
+        data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        if e.reason == "unexpected end of data":
+            return e.start
+    return len(data)
+
+
+def is_growing(transcript_path):
+    """Return True while a live session is still writing the transcript."""
+    return interim_path_for(transcript_path).exists()
+
+
+def read_new_text(transcript_path, state, growing=False):
+    """
+    Read the transcript text that the state does not cover yet.
+
+    Args:
+        transcript_path: Path to the transcript file
+        state: SummaryState of the previous run (covered_bytes 0 for none)
+        growing: If True, the file is still being written and an unfinished
+            last line is left for the next run; otherwise the whole tail is read
+
+    Returns:
+        (new text, new covered offset, hash of the bytes before that offset)
+    """
+    with open(transcript_path, "rb") as f:
+        f.seek(state.covered_bytes)
+        data = f.read()
+        for marker in LEGACY_SUMMARY_MARKERS:
+            position = data.find(marker)
+            if position >= 0:
+                data = data[:position]
+        end = state.covered_bytes + (_complete_prefix(data) if growing else len(data))
+        text = data[:end - state.covered_bytes].decode("utf-8", errors="replace")
+        return text, end, _tail_hash(f, end)
+
+
+def _state_matches(transcript_path, state, backend, model):
+    if state.backend != backend or state.model != model:
+        return False
+    try:
+        if os.path.getsize(transcript_path) < state.covered_bytes:
+            return False
+        with open(transcript_path, "rb") as f:
+            return _tail_hash(f, state.covered_bytes) == state.tail_hash
+    except OSError:
+        return False
+
+
+def summarize_incremental(transcript_path, use_local=False, on_delta=None, store=None,
+                          growing=None):
+    """
+    Update the rolling summary of a transcript with the text added since the last run.
+
+    A sidecar state file records the byte offset the summary covers and a
+    hash of the bytes just before it. The next run reads only what lies
+    past that offset, summarizes it and merges it into the saved summary,
+    so cost follows the new content rather than the whole transcript. If
+    the transcript was rewritten or the backend changed, the summary
+    starts over.
+
+    Args:
+        transcript_path: Path to the transcript file
+        use_local: If True, use local T5 model instead of Claude
+        on_delta: Optional callback that receives the summary (heading,
+            text and study tips) piece by piece as it is generated
+        store: SummaryStore to save into (default: SUMMARIES_DIR)
+        growing: Whether the transcript is still being written (default:
+            True while a live session's interim sidecar exists)
+
+    Returns:
+        Path to the saved summary version
+
+    Raises:
+        FileError: If the transcript file cannot be read or written
+        SummarizationError: If summary generation fails
+    """
+    if not os.path.exists(transcript_path):
+        raise FileError(f"Transcript file not found: {transcript_path}")
+
+    if use_local:
+        backend, model = "t5", f"{T5_MODEL}/{T5_BACKEND}"
+    else:
+        backend, model = "claude", CLAUDE_MODEL
+    state_path = state_path_for(transcript_path)
+    store = store or SummaryStore()
+
+    state = load_state(state_path)
+    if state is None or not _state_matches(transcript_path, state, backend, model):
+        if state is not None:
+            logger.info("Transcript or summarizer changed since the last summary; starting over")
+        state = SummaryState(backend=backend, model=model)
+
+    try:
+        if growing is None:
+            growing = is_growing(transcript_path)
+        new_text, end, tail_hash = read_new_text(transcript_path, state, growing)
+    except OSError as e:
+        raise FileError(f"Failed to read transcript: {str(e)}")
+
+    if not new_text.strip() and not state.summary:
+        raise SummarizationError(f"Transcript is empty: {transcript_path}")
+
+    heading = "Local Summary:\n" if use_local else "Summary:\n"
+    if on_delta:
+        on_delta(heading)
+    if new_text.strip():
+        logger.info(
+            f"Summarizing {end - state.covered_bytes} new bytes of {transcript_path} "
+            f"(already covered: {state.covered_bytes})"
+        )
+        try:
+            if on_delta:
+                pieces = []
+                for delta in stream_update_summary(state.summary, new_text, use_local):
+                    pieces.append(delta)
+                    on_delta(delta)
+                summary = "".join(pieces)
+            else:
+                summary = update_summary(state.summary, new_text, use_local)
+        except SummarizationError:
+            raise
+        except Exception as e:
+            raise SummarizationError(f"Failed to update summary: {str(e)}")
+        state = SummaryState(
+            covered_bytes=end, tail_hash=tail_hash, summary=summary, backend=backend, model=model
+        )
+    else:
+        logger.info("No new transcript text since the last summary")
+        if on_delta:
+            on_delta(state.summary)
+    if on_delta:
+        on_delta(STUDY_TIPS)
+
+    try:
+        record = store.save(
+            transcript_path, heading + state.summary + STUDY_TIPS, backend, model,
+            transcript_hash=hash_transcript(transcript_path, state.covered_bytes),
+        )
+        save_state(state_path, state)
+    except OSError as e:
+        raise FileError(f"Failed to write summary: {str(e)}")
+    return store.path_of(record)
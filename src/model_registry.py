@@ -0,0 +1,211 @@
+import threading
+from collections import OrderedDict
+from utils.error_handler import TranscriptionError, logger
+from config import (
+    WHISPER_MODEL,
+    WHISPER_DEVICE,
+    WHISPER_PRECISION,
+    MODEL_CACHE_SIZE,
+    MODEL_MEMORY_BUDGET_MB,
+)
+
+PRECISIONS = ("fp32", "fp16")
+
+
+def estimate_model_bytes(model):
+    """
+    Estimate the memory held by a model's parameters and buffers.
+
+    Args:
+        model: A torch module (or anything exposing parameters()/buffers())
+
+    Returns:
+        Size in bytes, or 0 if it cannot be determined
+    """
+    total = 0
+    try:
+        for tensor in list(model.parameters()) + list(model.buffers()):
+            total += tensor.numel() * tensor.element_size()
+    except Exception:
+        return 0
+    return total
+
+
+def load_whisper_model(name, device, precision):
+    """
+    Load a Whisper model from disk.
+
+    Args:
+        name: Whisper model name ("tiny", "base", ...)
+        device: Torch device string ("cpu", "cuda")
+        precision: "fp32" or "fp16"
+
+    Returns:
+        The loaded Whisper model
+    """
+    import whisper
+
+    model = whisper.load_model(name, device=device)
+    if precision == "fp16" and device != "cpu":
+        model = model.half()
+    return model
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded models keyed by (name, device, precision).
+
+    Models are loaded lazily on first request. When more than ``max_models``
+    are held, or their combined size exceeds ``memory_budget_mb``, the least
+    recently used models are evicted. Concurrent requests for the same key
+    wait for a single load instead of loading the weights twice.
+    """
+
+    def __init__(self, loader=load_whisper_model, max_models=MODEL_CACHE_SIZE,
+                 memory_budget_mb=MODEL_MEMORY_BUDGET_MB, size_fn=estimate_model_bytes):
+        self._loader = loader
+        self._size_fn = size_fn
+        self.max_models = max_models
+        self.memory_budget_mb = memory_budget_mb
+        self._models = OrderedDict()
+        self._sizes = {}
+        self._key_locks = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.hits = 0
+
+    @staticmethod
+    def make_key(name=None, device=None, precision=None):
+        """Normalize a request into a registry key, applying config defaults."""
+        precision = precision or WHISPER_PRECISION
+        if precision not in PRECISIONS:
+            raise TranscriptionError(f"Unsupported model precision: {precision}")
+        return (name or WHISPER_MODEL, device or WHISPER_DEVICE, precision)
+
+    def get(self, name=None, device=None, precision=None):
+        """
+        Return a loaded model, loading it if it is not cached yet.
+
+        Args:
+            name: Model name (default: config.WHISPER_MODEL)
+            device: Device string (default: config.WHISPER_DEVICE)
+            precision: "fp32" or "fp16" (default: config.WHISPER_PRECISION)
+
+        Returns:
+            The loaded model
+        """
+        key = self.make_key(name, device, precision)
+
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                self.hits += 1
+                return self._models[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have finished loading while we waited
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    self.hits += 1
+                    return self._models[key]
+
+            logger.info(f"Loading model {key[0]} on {key[1]} ({key[2]})")
+            try:
+                model = self._loader(*key)
+            except Exception as e:
+                raise TranscriptionError(f"Failed to load model {key[0]}: {str(e)}")
+            size = self._size_fn(model)
+
+            with self._lock:
+                self._models[key] = model
+                self._sizes[key] = size
+                self.loads += 1
+                self._evict_locked(keep=key)
+                self._key_locks.pop(key, None)
+            return model
+
+    def preload(self, name=None, device=None, precision=None):
+        """Load a model ahead of time, e.g. from a worker initializer."""
+        self.get(name, device, precision)
+
+    def evict(self, name=None, device=None, precision=None):
+        """Drop a single model from the registry. Returns True if it was cached."""
+        key = self.make_key(name, device, precision)
+        with self._lock:
+            self._sizes.pop(key, None)
+            return self._models.pop(key, None) is not None
+
+    def clear(self):
+        """Drop every cached model."""
+        with self._lock:
+            self._models.clear()
+            self._sizes.clear()
+
+    def keys(self):
+        """Return the cached keys, least recently used first."""
+        with self._lock:
+            return list(self._models)
+
+    def memory_bytes(self):
+        """Return the estimated memory held by cached models."""
+        with self._lock:
+            return sum(self._sizes.values())
+
+    def _evict_locked(self, keep):
+        budget = None
+        if self.memory_budget_mb:
+            budget = self.memory_budget_mb * 1024 * 1024
+
+        while len(self._models) > 1:
+            over_count = self.max_models and len(self._models) > self.max_models
+            over_budget = budget is not None and sum(self._sizes.values()) > budget
+            if not (over_count or over_budget):
+                break
+            oldest = next(iter(self._models))
+            if oldest == keep:
+                break
+            self._models.pop(oldest)
+            self._sizes.pop(oldest, None)
+            logger.info(f"Evicted model {oldest[0]} on {oldest[1]} ({oldest[2]})")
+
+
+_registry = None
+_registry_lock = threading.Lock()
+
+
+def get_registry():
+    """Return the process-wide model registry."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ModelRegistry()
+        return _registry
+
+
+def get_model(name=None, device=None, precision=None):
+    """Shortcut for get_registry().get(...)."""
+    return get_registry().get(name, device, precision)
+
+
+def set_torch_threads(threads):
+    """Cap the intra-op threads torch uses in this process (no-op without torch)."""
+    if not threads:
+        return
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+def init_worker(model_name=None, device=None, precision=None, threads=None):
+    """
+    Warm a worker process: cap torch threads and load its model once.
+
+    Meant to be used as a ProcessPoolExecutor initializer so every worker
+    pays the load cost at startup rather than per task.
+    """
+    set_torch_threads(threads)
+    get_registry().preload(model_name, device, precision)
@@ -0,0 +1,273 @@
+import os
+import re
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+from utils.error_handler import TranscriptionError, logger
+from audio import SAMPLE_RATE
+from vad import frame_features
+from model_registry import init_worker
+from config import (
+    PARALLEL_WINDOW_SECONDS,
+    PARALLEL_OVERLAP_SECONDS,
+    PARALLEL_SEARCH_SECONDS,
+    WHISPER_PRECISION,
+)
+
+# Longest run of repeated words looked for where two windows meet
+MAX_OVERLAP_WORDS = 16
+
+
+@dataclass
+class Window:
+    index: int
+    start: int  # First sample sent to the model (includes leading overlap)
+    end: int  # One past the last sample sent to the model
+    core_start: int  # Part of the timeline this window is responsible for
+    core_end: int
+
+
+def _quietest_sample(energy_db, frame_len, lo, hi):
+    """Return the sample offset of the quietest frame between samples lo and hi."""
+    first, last = lo // frame_len, max(lo // frame_len + 1, hi // frame_len)
+    frame = first + int(np.argmin(energy_db[first:last]))
+    return frame * frame_len + frame_len // 2
+
+
+def plan_windows(audio, sr=SAMPLE_RATE, window_seconds=PARALLEL_WINDOW_SECONDS,
+                 overlap_seconds=PARALLEL_OVERLAP_SECONDS,
+                 search_seconds=PARALLEL_SEARCH_SECONDS):
+    """
+    Split a recording into overlapping windows, cutting on silence.
+
+    Each nominal cut point is moved to the quietest frame within
+    ``search_seconds`` of it, so words are rarely split. Windows extend
+    ``overlap_seconds`` past their cut points on both sides.
+
+    Args:
+        audio: 1-D float32 array
+        sr: Sample rate of ``audio``
+        window_seconds: Target length of each window
+        overlap_seconds: Audio shared with each neighbouring window
+        search_seconds: How far a cut may move to find silence
+
+    Returns:
+        A list of Window objects covering the whole recording
+    """
+    total = len(audio)
+    window = int(window_seconds * sr)
+    if total <= window:
+        return [Window(0, 0, total, 0, total)]
+
+    frame_len = int(0.03 * sr)
+    energy_db, _ = frame_features(audio, frame_len)
+    search = int(search_seconds * sr)
+    overlap = int(overlap_seconds * sr)
+
+    cuts = [0]
+    while total - cuts[-1] > window + window // 4:
+        target = cuts[-1] + window
+        lo = max(cuts[-1] + window // 2, target - search)
+        hi = min(total - window // 4, target + search)
+        cuts.append(_quietest_sample(energy_db, frame_len, lo, hi) if hi > lo else target)
+    cuts.append(total)
+
+    return [
+        Window(
+            index=i,
+            start=max(0, cuts[i] - overlap),
+            end=min(total, cuts[i + 1] + overlap),
+            core_start=cuts[i],
+            core_end=cuts[i + 1],
+        )
+        for i in range(len(cuts) - 1)
+    ]
+
+
+def _normalize(word):
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def overlap_length(previous_words, next_words, max_words=MAX_OVERLAP_WORDS):
+    """
+    Count the words at the start of ``next_words`` that repeat the end of ``previous_words``.
+
+    Returns:
+        The length of the longest matching suffix/prefix, or 0
+    """
+    previous = [_normalize(w) for w in previous_words[-max_words:]]
+    following = [_normalize(w) for w in next_words[:max_words]]
+    for k in range(min(len(previous), len(following)), 0, -1):
+        if previous[-k:] == following[:k]:
+            return k
+    return 0
+
+
+def stitch(window_results, sr=SAMPLE_RATE):
+    """
+    Merge per-window transcripts into one.
+
+    Each window keeps the segments whose midpoint falls inside its core
+    span; words repeated across a window boundary are then dropped from
+    the later window.
+
+    Args:
+        window_results: List of (Window, result) pairs; segment times must
+            already be on the global timeline
+        sr: Sample rate used for the window offsets
+
+    Returns:
+        A Whisper-style result dict with "text" and "segments"
+    """
+    segments = []
+    for window, result in sorted(window_results, key=lambda pair: pair[0].index):
+        core_start, core_end = window.core_start / sr, window.core_end / sr
+        kept = [
+            dict(segment)
+            for segment in result.get("segments", [])
+            if core_start <= (segment["start"] + segment["end"]) / 2 < core_end
+        ]
+        if segments and kept:
+            previous_words = " ".join(s["text"] for s in segments[-2:]).split()
+            next_words = kept[0]["text"].split()
+            drop = overlap_length(previous_words, next_words)
+            if drop:
+                remaining = next_words[drop:]
+                if remaining:
+                    kept[0]["text"] = " " + " ".join(remaining)
+                else:
+                    kept.pop(0)
+        segments.extend(kept)
+
+    for i, segment in enumerate(segments):
+        segment["id"] = i
+    return {
+        "text": "".join(segment["text"] for segment in segments),
+        "segments": segments,
+    }
+
+
+def _transcribe_window(window_audio, offset_seconds, model_name, device, precision, use_vad):
+    from model_registry import get_model
+    from transcribe import transcribe_audio
+
+    model = get_model(model_name, device, precision)
+    fp16 = (precision or WHISPER_PRECISION) == "fp16"
+    result = transcribe_audio(window_audio, model, fp16=fp16, use_vad=use_vad)
+    for segment in result.get("segments", []):
+        segment["start"] += offset_seconds
+        segment["end"] += offset_seconds
+        for word in segment.get("words", []):
+            word["start"] += offset_seconds
+            word["end"] += offset_seconds
+    return result
+
+
+def _merge_vad_metrics(results):
+    metrics = [r.get("vad") for r in results if r.get("vad")]
+    if not metrics:
+        return None
+    # Overlaps are counted twice; close enough for a ratio
+    speech = sum(m["speech_seconds"] for m in metrics)
+    total = sum(m["total_seconds"] for m in metrics)
+    return {
+        "speech_ratio": round(speech / total, 4) if total else 0.0,
+        "speech_seconds": round(speech, 2),
+        "total_seconds": round(total, 2),
+        "regions": sum(m["regions"] for m in metrics),
+    }
+
+
+def transcribe_windows(audio, windows, workers=1, model_name=None, device=None, precision=None,
+                       use_vad=True, journal=None, sr=SAMPLE_RATE):
+    """
+    Transcribe a planned set of windows and stitch them together.
+
+    With ``workers`` > 1 the windows run in a pool of warm worker
+    processes; otherwise they run one after another in this process. If a
+    journal is given, windows it already holds are skipped and every newly
+    finished window is recorded in it.
+
+    Args:
+        audio: 1-D float32 array
+        windows: Output of plan_windows
+        workers: Number of worker processes
+        model_name: Whisper model to use (default: config.WHISPER_MODEL)
+        device: Device to run on (default: config.WHISPER_DEVICE)
+        precision: "fp32" or "fp16" (default: config.WHISPER_PRECISION)
+        use_vad: Whether each window skips silence before transcribing
+        journal: Optional TranscriptionJournal for resumable runs
+        sr: Sample rate of ``audio``
+
+    Returns:
+        A Whisper-style result dict with "text", "segments" and, with VAD,
+        aggregated "vad" metrics
+    """
+    done = journal.completed() if journal else {}
+    pending = [window for window in windows if window.index not in done]
+    results = {window.index: done[window.index] for window in windows if window.index in done}
+
+    def finish(window, result):
+        results[window.index] = result
+        if journal:
+            journal.record(window.index, result)
+        logger.info(f"Finished window {len(results)}/{len(windows)}")
+
+    def args_for(window):
+        return (audio[window.start:window.end], window.start / sr,
+                model_name, device, precision, use_vad)
+
+    workers = max(1, min(workers or 1, len(pending) or 1))
+    if pending:
+        logger.info(f"Transcribing {len(pending)} window(s) with {workers} worker(s)")
+
+    if workers == 1:
+        for window in pending:
+            finish(window, _transcribe_window(*args_for(window)))
+    else:
+        threads = max(1, (os.cpu_count() or 1) // workers)
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_worker,
+            initargs=(model_name, device, precision, threads),
+        ) as pool:
+            futures = {pool.submit(_transcribe_window, *args_for(w)): w for w in pending}
+            for future in as_completed(futures):
+                window = futures[future]
+                try:
+                    finish(window, future.result())
+                except Exception as e:
+                    raise TranscriptionError(f"Window {window.index} failed: {str(e)}")
+
+    window_results = [(window, results[window.index]) for window in windows]
+    result = stitch(window_results, sr)
+    result["language"] = window_results[0][1].get("language")
+    vad_metrics = _merge_vad_metrics([r for _, r in window_results])
+    if vad_metrics:
+        result["vad"] = vad_metrics
+    return result
+
+
+def transcribe_parallel(audio, workers=None, model_name=None, device=None, precision=None,
+                        use_vad=True, journal=None, sr=SAMPLE_RATE):
+    """
+    Transcribe one long recording by spreading overlapping windows across processes.
+
+    Args:
+        audio: 1-D float32 array
+        workers: Number of worker processes (default: CPU count)
+        model_name: Whisper model to use (default: config.WHISPER_MODEL)
+        device: Device to run on (default: config.WHISPER_DEVICE)
+        precision: "fp32" or "fp16" (default: config.WHISPER_PRECISION)
+        use_vad: Whether each window skips silence before transcribing
+        journal: Optional TranscriptionJournal for resumable runs
+        sr: Sample rate of ``audio``
+
+    Returns:
+        See transcribe_windows
+    """
+    windows = plan_windows(audio, sr)
+    return transcribe_windows(
+        audio, windows, workers or os.cpu_count() or 1, model_name, device, precision,
+        use_vad=use_vad, journal=journal, sr=sr,
+    )
@@ -1,174 +1,721 @@
 import os
-import anthropic
-from pathlib import Path
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from utils.error_handler import (
-    SummarizationError, 
-    APIError, 
-    FileError, 
-    handle_error, 
+    SummarizationError,
+    APIError,
+    handle_error,
     logger
 )
-from config import TRANSCRIPTS_DIR, SUMMARIES_DIR
-
-# Initialize Anthropic client
-try:
-    client = anthropic.Client(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-except Exception as e:
-    logger.error(f"Failed to initialize Anthropic client: {str(e)}")
-    client = None
-
-# Initialize T5 summarizer
-try:
-    logger.info("Loading T5 summarization model")
-    summarizer = pipeline("summarization", model="t5-small", tokenizer="t5-small")
-except Exception as e:
-    logger.error(f"Failed to initialize T5 summarizer: {str(e)}")
-    summarizer = None
+from text_chunking import chunk_text, chunk_by_chars, count_tokens
+from extractive import extract
+from utils.disk_cache import DiskCache, hash_text, make_key
+from config import (
+    T5_MODEL,
+    T5_MAX_INPUT_TOKENS,
+    T5_BATCH_SIZE,
+    T5_BACKEND,
+    CLAUDE_MODEL,
+    ANTHROPIC_BASE_URL,
+    SUMMARY_SECTION_CHARS,
+    SUMMARY_CONCURRENCY,
+    SUMMARY_REDUCE_FAN_IN,
+    SUMMARY_EXTRACTIVE,
+    EXTRACTIVE_RATIO,
+    EXTRACTIVE_MIN_TOKENS,
+    EXTRACTIVE_SECTIONS,
+    SUMMARY_CACHE_ENABLED,
+    SUMMARY_CACHE_DIR,
+    SUMMARY_CACHE_MAX_MB,
+    SUMMARY_CACHE_MAX_AGE_DAYS,
+)
+
+# Tokens kept free in each T5 chunk for the "summarize: " prefix and EOS
+T5_PREFIX_TOKENS = 8
+
+SYSTEM_PROMPT = (
+    "You are a helpful assistant that creates concise summaries of lecture transcripts. "
+    "Focus on the key points, concepts, and main ideas."
+)
+SUMMARY_PROMPT = (
+    "Please summarize the following lecture transcript, highlighting the main points "
+    "and key concepts:\n\n{text}"
+)
+SECTION_PROMPT = (
+    "The following is part {index} of {total} of a lecture transcript. Summarize this "
+    "part, keeping every main point, definition and example it contains:\n\n{text}"
+)
+REDUCE_PROMPT = (
+    "The following are summaries of consecutive parts of one lecture, in order. Combine "
+    "them into a single summary of the whole lecture, highlighting the main points and "
+    "key concepts:\n\n{text}"
+)
+UPDATE_PROMPT = (
+    "Below is a summary of a lecture so far, followed by transcript text that was added "
+    "since. Rewrite the summary so it covers the whole lecture, highlighting the main "
+    "points and key concepts.\n\nSummary so far:\n{summary}\n\nNew transcript text:\n{text}"
+)
+
+# Generation parameters; they are part of the summary cache key
+CLAUDE_MAX_TOKENS = 500
+CLAUDE_TEMPERATURE = 0
+T5_GENERATION = {"max_length": 150, "min_length": 30, "do_sample": False}
+
+SUMMARY_FILE = "summary.md"
+
+STUDY_TIPS = (
+    "\n\nStudy Tips:\n"
+    "- Review the key ideas mentioned in the summary.\n"
+    "- Create flashcards based on core concepts.\n"
+    "- Reflect on what the summary implies for your class."
+)
+
+# Backends are created on first use and then shared by the whole process, so
+# importing this module (e.g. for `app.py --help`) never pays for the
+# transformers/torch import or the T5 weight load.
+_client = None
+_summarizers = {}
+_init_lock = threading.Lock()
+_cache = None
+
+
+def _create_client():
+    import anthropic
+    return anthropic.Client(
+        api_key=os.environ.get("ANTHROPIC_API_KEY"), base_url=ANTHROPIC_BASE_URL
+    )
+
+
+def _create_summarizer(model_name):
+    if T5_BACKEND == "int8":
+        from quantized_summarizer import load_quantized_summarizer
+        return load_quantized_summarizer(model_name)
+    from transformers import pipeline
+    return pipeline("summarization", model=model_name, tokenizer=model_name)
+
+
+def get_client():
+    """
+    Return the shared Anthropic client, creating it on first use.
+
+    Raises:
+        APIError: If the client cannot be created
+    """
+    global _client
+    with _init_lock:
+        if _client is None:
+            try:
+                _client = _create_client()
+            except Exception as e:
+                logger.error(f"Failed to initialize Anthropic client: {str(e)}")
+                raise APIError(
+                    "Anthropic client not initialized. Please set ANTHROPIC_API_KEY "
+                    "environment variable."
+                )
+        return _client
+
+
+def get_summarizer(model_name=None):
+    """
+    Return the shared T5 summarization pipeline, loading it on first use.
+
+    Args:
+        model_name: Hugging Face model id (default: config.T5_MODEL)
+
+    Raises:
+        SummarizationError: If the model cannot be loaded
+    """
+    model_name = model_name or T5_MODEL
+    with _init_lock:
+        if model_name not in _summarizers:
+            try:
+                logger.info(f"Loading {model_name} summarization model")
+                _summarizers[model_name] = _create_summarizer(model_name)
+            except Exception as e:
+                logger.error(f"Failed to initialize T5 summarizer: {str(e)}")
+                raise SummarizationError(f"T5 summarizer not initialized: {str(e)}")
+        return _summarizers[model_name]
+
+
+def get_summary_cache():
+    """Return the process-wide summary cache."""
+    global _cache
+    with _init_lock:
+        if _cache is None:
+            _cache = DiskCache(
+                SUMMARY_CACHE_DIR,
+                max_bytes=SUMMARY_CACHE_MAX_MB * 1024 * 1024,
+                max_age_seconds=SUMMARY_CACHE_MAX_AGE_DAYS * 24 * 3600,
+            )
+        return _cache
+
+
+def summary_key(text, backend, model, prompts, **params):
+    """
+    Build the cache key for a summary.
+
+    Args:
+        text: The transcript text
+        backend: "claude" or "t5"
+        model: Model identifier used by the backend
+        prompts: Prompt templates the backend uses (any change to the
+            wording gives a new key)
+        params: Generation parameters that affect the output
+    """
+    return make_key(hash_text(text), backend, model, hash_text("\0".join(prompts)), **params)
+
+
+def lookup_summary(key):
+    """Return the cached summary text for a key, or None."""
+    if not SUMMARY_CACHE_ENABLED:
+        return None
+    entry = get_summary_cache().get(key)
+    if entry is None:
+        return None
+    logger.info(f"Summary cache hit ({key[:12]})")
+    return (entry / SUMMARY_FILE).read_text(encoding="utf-8")
+
+
+def store_summary(key, summary):
+    """Store summary text under a key; failures are logged, not raised."""
+    if not SUMMARY_CACHE_ENABLED:
+        return
+    try:
+        get_summary_cache().put(key, {SUMMARY_FILE: summary})
+    except OSError as e:
+        # The cache is an optimization; never fail a summary over it
+        logger.warning(f"Failed to write summary cache entry: {str(e)}")
+
+
+def summary_cache_stats():
+    """Return hit/miss counters and the on-disk size of the summary cache."""
+    cache = get_summary_cache()
+    return dict(cache.stats(), size_bytes=cache.size_bytes())
+
+
+def preload(use_local=True, use_claude=True):
+    """
+    Initialize summarizer backends ahead of time.
+
+    Meant for workers and warmup hooks that want the first summary to be
+    as fast as later ones.
+    """
+    if use_claude:
+        get_client()
+    if use_local:
+        get_summarizer()
+
 
 def generate_local_summary(text):
     """
     Generate a summary using T5 model.
-    
+
     Args:
         text: The text to summarize
-        
+
     Returns:
         A string containing the summary and study tips
     """
+    return "Local Summary:\n" + _local_summary_text(text) + STUDY_TIPS
+
+
+def _local_key(text, **params):
+    return summary_key(
+        text, "t5", T5_MODEL, (), max_input_tokens=T5_MAX_INPUT_TOKENS, t5_backend=T5_BACKEND,
+        **T5_GENERATION, **_extractive_params(), **params
+    )
+
+
+def _local_input(text, summarizer):
+    """Cut long transcripts to their most central sentences, measured in T5 tokens."""
+    if not SUMMARY_EXTRACTIVE:
+        return text
+    return extract(text, count_fn=lambda sentences: count_tokens(summarizer.tokenizer, sentences))
+
+
+def _local_summary_text(text):
+    key = _local_key(text)
+    cached = lookup_summary(key)
+    if cached is not None:
+        return cached
+
     try:
-        if summarizer is None:
-            raise SummarizationError("T5 summarizer not initialized")
-            
+        summarizer = get_summarizer()
+
         logger.info("Generating summary with T5 model")
-        
-        # Split text into chunks if too long (T5 has token limits)
-        max_chunk_length = 512
-        chunks = [text[i:i+max_chunk_length] for i in range(0, len(text), max_chunk_length)]
-        
-        summaries = []
-        for chunk in chunks:
-            # Generate summary for each chunk
-            summary = summarizer(chunk, max_length=150, min_length=30, do_sample=False)
-            summaries.append(summary[0]['summary_text'])
-        
+
+        # Pack whole sentences up to T5's token limit, then summarize all
+        # chunks in batched forward passes
+        text = _local_input(text, summarizer)
+        chunks = chunk_text(text, summarizer.tokenizer, T5_MAX_INPUT_TOKENS - T5_PREFIX_TOKENS)
+        logger.info(f"Summarizing {len(chunks)} chunk(s) in batches of {T5_BATCH_SIZE}")
+        outputs = summarizer(chunks, truncation=True, batch_size=T5_BATCH_SIZE, **T5_GENERATION)
+
         # Combine summaries
-        combined_summary = " ".join(summaries)
-        
-        study_tips = (
-            "\n\nStudy Tips:\n"
-            "- Review the key ideas mentioned in the summary.\n"
-            "- Create flashcards based on core concepts.\n"
-            "- Reflect on what the summary implies for your class."
+        combined_summary = " ".join(output['summary_text'] for output in outputs)
+        store_summary(key, combined_summary)
+        return combined_summary
+    except Exception as e:
+        logger.error(f"Local summary generation failed: {str(e)}")
+        raise SummarizationError(f"Failed to generate local summary: {str(e)}")
+
+
+def _generate_streamed(summarizer, text):
+    """Yield T5's summary of one chunk token by token."""
+    from transformers import TextIteratorStreamer
+
+    prefix = getattr(summarizer.model.config, "prefix", None) or ""
+    inputs = summarizer.tokenizer(
+        prefix + text, return_tensors="pt", truncation=True, max_length=T5_MAX_INPUT_TOKENS
+    ).to(summarizer.device)
+    streamer = TextIteratorStreamer(summarizer.tokenizer, skip_special_tokens=True)
+    # Streamers only support a single greedy hypothesis, not beam search
+    generation = dict(inputs, streamer=streamer, num_beams=1, **T5_GENERATION)
+    errors = []
+
+    def generate():
+        try:
+            summarizer.model.generate(**generation)
+        except Exception as e:
+            # Unblock the consumer below; the error is raised there
+            errors.append(e)
+            streamer.end()
+
+    thread = threading.Thread(target=generate, daemon=True)
+    thread.start()
+    yield from streamer
+    thread.join()
+    if errors:
+        raise errors[0]
+
+
+def _stream_local_summary_text(text):
+    key = _local_key(text, streamed=True)
+    cached = lookup_summary(key)
+    if cached is not None:
+        yield cached
+        return
+
+    try:
+        summarizer = get_summarizer()
+        chunks = chunk_text(
+            _local_input(text, summarizer), summarizer.tokenizer,
+            T5_MAX_INPUT_TOKENS - T5_PREFIX_TOKENS
         )
+        logger.info(f"Streaming T5 summary of {len(chunks)} chunk(s)")
 
-        return "Local Summary:\n" + combined_summary + study_tips
+        def deltas():
+            for i, chunk in enumerate(chunks):
+                if i:
+                    yield " "
+                yield from _generate_streamed(summarizer, chunk)
+
+        yield from _stored(key, deltas())
     except Exception as e:
         logger.error(f"Local summary generation failed: {str(e)}")
         raise SummarizationError(f"Failed to generate local summary: {str(e)}")
 
-def generate_summary(text, use_local=False):
+
+def _ask_claude(client, prompt, max_tokens=CLAUDE_MAX_TOKENS):
+    message = client.messages.create(
+        model=CLAUDE_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=CLAUDE_TEMPERATURE,
+        system=SYSTEM_PROMPT,
+    )
+    return message.content[0].text
+
+
+def _claude_stream(client, prompt, max_tokens=CLAUDE_MAX_TOKENS):
+    """Yield the response text of one request as it is generated."""
+    with client.messages.stream(
+        model=CLAUDE_MODEL,
+        messages=[{"role": "user", "content": prompt}],
+        max_tokens=max_tokens,
+        temperature=CLAUDE_TEMPERATURE,
+        system=SYSTEM_PROMPT,
+    ) as stream:
+        yield from stream.text_stream
+
+
+def _stored(key, deltas):
+    """Pass text deltas through and cache the joined text once the stream completes."""
+    parts = []
+    for delta in deltas:
+        parts.append(delta)
+        yield delta
+    store_summary(key, "".join(parts))
+
+
+def _hierarchical_request(text, client, section_chars, concurrency, fan_in):
+    """
+    Run the map and intermediate reduce rounds of a hierarchical summary.
+
+    Returns:
+        (prompt, max_tokens) of the final request, which the caller sends
+        either all at once or streamed
+    """
+    sections = chunk_by_chars(text, section_chars)
+    if len(sections) <= 1:
+        return SUMMARY_PROMPT.format(text=text.strip()), CLAUDE_MAX_TOKENS
+
+    def summarize_section(numbered):
+        index, section = numbered
+        prompt = SECTION_PROMPT.format(index=index, total=len(sections), text=section)
+        return _ask_claude(client, prompt)
+
+    def reduce_group(group):
+        return _ask_claude(client, REDUCE_PROMPT.format(text="\n\n".join(group)))
+
+    fan_in = max(2, fan_in)
+    logger.info(
+        f"Summarizing {len(sections)} sections with up to {concurrency} concurrent requests"
+    )
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        partials = list(pool.map(summarize_section, enumerate(sections, start=1)))
+        while len(partials) > fan_in:
+            groups = [partials[i:i + fan_in] for i in range(0, len(partials), fan_in)]
+            logger.info(f"Reducing {len(partials)} partial summaries in {len(groups)} groups")
+            partials = list(pool.map(reduce_group, groups))
+    return REDUCE_PROMPT.format(text="\n\n".join(partials)), 2 * CLAUDE_MAX_TOKENS
+
+
+def summarize_hierarchical(text, client=None, section_chars=SUMMARY_SECTION_CHARS,
+                           concurrency=SUMMARY_CONCURRENCY, fan_in=SUMMARY_REDUCE_FAN_IN):
+    """
+    Summarize a transcript of any length with Claude by map-reduce.
+
+    The transcript is split into sentence-aligned sections, every section
+    is summarized concurrently (at most ``concurrency`` requests in
+    flight), and the partial summaries are combined ``fan_in`` at a time
+    until one summary is left. Wall-clock time grows with the number of
+    reduce rounds, not with the number of sections.
+
+    Args:
+        text: The transcript text
+        client: Anthropic client (default: the shared one)
+        section_chars: Maximum characters per section
+        concurrency: Maximum concurrent requests
+        fan_in: Partial summaries combined per reduce request
+
+    Returns:
+        The summary text, without study tips
+    """
+    client = client or get_client()
+    return _ask_claude(
+        client, *_hierarchical_request(text, client, section_chars, concurrency, fan_in)
+    )
+
+
+def _extractive_params():
+    if not SUMMARY_EXTRACTIVE:
+        return {}
+    return {"extractive": [EXTRACTIVE_RATIO, EXTRACTIVE_MIN_TOKENS, EXTRACTIVE_SECTIONS]}
+
+
+def claude_summary_key(text, hierarchical=None):
+    """
+    Return the cache key of a Claude summary made with the current settings.
+
+    ``hierarchical`` is the caller's choice (None for automatic), so the
+    key can be computed before any extraction work.
+    """
+    params = {"max_tokens": CLAUDE_MAX_TOKENS, "temperature": CLAUDE_TEMPERATURE,
+              "hierarchical": hierarchical, "section_chars": SUMMARY_SECTION_CHARS}
+    if hierarchical is not False:
+        params["fan_in"] = SUMMARY_REDUCE_FAN_IN
+    if hierarchical is None:
+        params.update(_extractive_params())
+    return summary_key(
+        text, "claude", CLAUDE_MODEL,
+        (SYSTEM_PROMPT, SUMMARY_PROMPT, SECTION_PROMPT, REDUCE_PROMPT), **params
+    )
+
+
+def prepare_claude_input(text, hierarchical=None):
+    """
+    Decide what is sent to Claude for a transcript.
+
+    Unless ``hierarchical`` forces a mode, long transcripts are first cut
+    to their most central sentences (see extractive.extract), and whatever
+    is still longer than one section is summarized hierarchically.
+
+    Returns:
+        (text to summarize, whether to summarize it hierarchically)
+    """
+    if hierarchical is not None:
+        return text, hierarchical
+    if SUMMARY_EXTRACTIVE:
+        shortened = extract(text)
+        if shortened is not text:
+            logger.info(f"Extractive stage kept {len(shortened)} of {len(text)} characters")
+        text = shortened
+    return text, len(text) > SUMMARY_SECTION_CHARS
+
+
+def _claude_request(text, client, hierarchical):
+    """Return (prompt, max_tokens) of the request that produces the final summary."""
+    if hierarchical:
+        logger.info(f"Generating hierarchical summary with {CLAUDE_MODEL}")
+        return _hierarchical_request(
+            text, client, SUMMARY_SECTION_CHARS, SUMMARY_CONCURRENCY, SUMMARY_REDUCE_FAN_IN
+        )
+    # Single request: limit input to one section (about 2400 words)
+    text = text.strip().replace("\n", " ")
+    text = text[:SUMMARY_SECTION_CHARS]
+    logger.info(f"Generating summary with {CLAUDE_MODEL}")
+    return SUMMARY_PROMPT.format(text=text), CLAUDE_MAX_TOKENS
+
+
+def generate_summary(text, use_local=False, hierarchical=None):
     """
     Generate a summary of the given text.
-    
+
     Args:
         text: The text to summarize
         use_local: If True, use local T5 model instead of Claude
-        
+        hierarchical: If True, summarize the whole transcript section by
+            section; if False, summarize only its first
+            SUMMARY_SECTION_CHARS characters in one request. By default
+            transcripts longer than that are summarized hierarchically.
+
     Returns:
         A string containing the summary and study tips
     """
     if use_local:
         return generate_local_summary(text)
-    
-    # Check if client is initialized
-    if client is None:
-        raise APIError("Anthropic client not initialized. Please set ANTHROPIC_API_KEY environment variable.")
-    
-    # Limit input to 4000 characters (about 800 words) to avoid model cutoff
-    text = text.strip().replace("\n", " ")
-    text = text[:4000]
+    return "Summary:\n" + summarize_text(text, hierarchical=hierarchical) + STUDY_TIPS
+
 
+def stream_summary(text, use_local=False, hierarchical=None):
+    """
+    Generate a summary like generate_summary(), yielding text as it arrives.
+
+    The heading comes first, then the summary in the pieces the model
+    produces, then the study tips. Joined, the pieces equal what
+    generate_summary() returns (for T5, see stream_summary_text).
+
+    Args:
+        text: The text to summarize
+        use_local: If True, use local T5 model instead of Claude
+        hierarchical: See generate_summary
+
+    Yields:
+        Text deltas
+    """
+    yield "Local Summary:\n" if use_local else "Summary:\n"
+    yield from stream_summary_text(text, use_local, hierarchical)
+    yield STUDY_TIPS
+
+
+async def astream_summary(text, use_local=False, hierarchical=None):
+    """
+    Async iterator over the deltas of stream_summary().
+
+    The blocking stream is advanced in a worker thread, so the event loop
+    stays free while the model generates.
+    """
+    deltas = stream_summary(text, use_local, hierarchical)
+    done = object()
     try:
-        logger.info("Generating summary with Claude Sonnet 3.7")
-        # Use Claude Sonnet 3.7 for summarization
-        message = client.messages.create(
-            model="claude-3-sonnet-20240229",
-            messages=[{
-                "role": "user",
-                "content": f"Please summarize the following lecture transcript, highlighting the main points and key concepts:\n\n{text}"
-            }],
-            max_tokens=500,
-            temperature=0,
-            system="You are a helpful assistant that creates concise summaries of lecture transcripts. Focus on the key points, concepts, and main ideas."
-        )
-        summary = message.content[0].text
+        while True:
+            delta = await asyncio.to_thread(next, deltas, done)
+            if delta is done:
+                break
+            yield delta
+    finally:
+        deltas.close()
+
+
+def summarize_text(text, use_local=False, hierarchical=None):
+    """
+    Summarize text and return just the summary, without heading or study tips.
+
+    Args:
+        text: The text to summarize
+        use_local: If True, use local T5 model instead of Claude
+        hierarchical: See generate_summary
+    """
+    if use_local:
+        return _local_summary_text(text)
+
+    key = claude_summary_key(text, hierarchical)
+    cached = lookup_summary(key)
+    if cached is not None:
+        return cached
+
+    client = get_client()
+    try:
+        text, hierarchical = prepare_claude_input(text, hierarchical)
+        summary = _ask_claude(client, *_claude_request(text, client, hierarchical))
         logger.info("Summary generated successfully")
     except Exception as e:
         logger.error(f"Summary generation failed: {str(e)}")
         raise SummarizationError(f"Failed to generate summary: {str(e)}")
+    store_summary(key, summary)
+    return summary
 
-    study_tips = (
-        "\n\nStudy Tips:\n"
-        "- Review the key ideas mentioned in the summary.\n"
-        "- Create flashcards based on core concepts.\n"
-        "- Reflect on what the summary implies for your class."
+
+def stream_summary_text(text, use_local=False, hierarchical=None):
+    """
+    Like summarize_text(), but yield the summary in pieces as it is generated.
+
+    With Claude only the final request is streamed; in hierarchical mode
+    the section summaries are made (concurrently) before the first piece
+    arrives. T5 streams one chunk at a time with greedy decoding, so its
+    wording can differ slightly from the batched beam-search summary.
+    """
+    if use_local:
+        yield from _stream_local_summary_text(text)
+        return
+
+    key = claude_summary_key(text, hierarchical)
+    cached = lookup_summary(key)
+    if cached is not None:
+        yield cached
+        return
+
+    client = get_client()
+    try:
+        text, hierarchical = prepare_claude_input(text, hierarchical)
+        prompt, max_tokens = _claude_request(text, client, hierarchical)
+        yield from _stored(key, _claude_stream(client, prompt, max_tokens))
+    except Exception as e:
+        logger.error(f"Summary generation failed: {str(e)}")
+        raise SummarizationError(f"Failed to generate summary: {str(e)}")
+
+
+def _update_key(previous, new_text):
+    return summary_key(
+        new_text, "claude-update", CLAUDE_MODEL, (SYSTEM_PROMPT, UPDATE_PROMPT),
+        previous=hash_text(previous), max_tokens=CLAUDE_MAX_TOKENS,
+        temperature=CLAUDE_TEMPERATURE, section_chars=SUMMARY_SECTION_CHARS,
     )
 
-    return "Summary:\n" + summary + study_tips
 
-def append_summary_to_file(transcript_path, use_local=False):
+def _update_prompt(previous, new_text):
+    # Short additions go in raw; long ones are condensed first
+    if len(new_text) > SUMMARY_SECTION_CHARS:
+        new_text = summarize_text(new_text, hierarchical=True)
+    logger.info(f"Updating summary with {len(new_text)} characters of new text")
+    return UPDATE_PROMPT.format(summary=previous, text=new_text.strip())
+
+
+def update_summary(previous, new_text, use_local=False):
     """
-    Append a summary to a transcript file.
-    
+    Fold newly added transcript text into an existing summary.
+
+    Only ``new_text`` is summarized from scratch; Claude then merges that
+    with ``previous`` in one more request. T5 cannot merge, so its partial
+    summaries are concatenated.
+
     Args:
-        transcript_path: Path to the transcript file
+        previous: The summary of the transcript so far (may be empty)
+        new_text: Transcript text added since ``previous`` was made
         use_local: If True, use local T5 model instead of Claude
-        
-    Raises:
-        FileError: If the transcript file cannot be read or written
-        SummarizationError: If summary generation fails
+
+    Returns:
+        The updated summary, without heading or study tips
     """
+    if not previous:
+        return summarize_text(new_text, use_local)
+    if not new_text.strip():
+        return previous
+    if use_local:
+        return previous + " " + _local_summary_text(new_text)
+
+    key = _update_key(previous, new_text)
+    cached = lookup_summary(key)
+    if cached is not None:
+        return cached
+
+    client = get_client()
     try:
-        # Check if file exists
-        if not os.path.exists(transcript_path):
-            raise FileError(f"Transcript file not found: {transcript_path}")
-        
-        logger.info(f"Reading transcript from {transcript_path}")
-        with open(transcript_path, "r+", encoding="utf-8") as f:
-            content = f.read()
-            
-        logger.info("Generating summary")
-        summary = generate_summary(content, use_local)
-        
-        logger.info(f"Appending summary to {transcript_path}")
-        with open(transcript_path, "a", encoding="utf-8") as f:
-            f.write("\n\n---\n\n" + summary)
-            
-        logger.info("Summary appended successfully")
-    except FileError as e:
-        # Re-raise file errors
+        summary = _ask_claude(
+            client, _update_prompt(previous, new_text), max_tokens=2 * CLAUDE_MAX_TOKENS
+        )
+    except SummarizationError:
         raise
-    except SummarizationError as e:
-        # Re-raise summarization errors
+    except Exception as e:
+        logger.error(f"Summary update failed: {str(e)}")
+        raise SummarizationError(f"Failed to update summary: {str(e)}")
+    store_summary(key, summary)
+    return summary
+
+
+def stream_update_summary(previous, new_text, use_local=False):
+    """Like update_summary(), but yield the updated summary in pieces as it is generated."""
+    if not previous:
+        yield from stream_summary_text(new_text, use_local)
+        return
+    if not new_text.strip():
+        yield previous
+        return
+    if use_local:
+        yield previous + " "
+        yield from _stream_local_summary_text(new_text)
+        return
+
+    key = _update_key(previous, new_text)
+    cached = lookup_summary(key)
+    if cached is not None:
+        yield cached
+        return
+
+    client = get_client()
+    try:
+        prompt = _update_prompt(previous, new_text)
+        yield from _stored(key, _claude_stream(client, prompt, max_tokens=2 * CLAUDE_MAX_TOKENS))
+    except SummarizationError:
         raise
     except Exception as e:
-        # Wrap other exceptions
-        raise RuntimeError(f"Failed to append summary: {str(e)}")
+        logger.error(f"Summary update failed: {str(e)}")
+        raise SummarizationError(f"Failed to update summary: {str(e)}")
+
+
+def summarize_transcript_file(transcript_path, use_local=False, on_delta=None):
+    """
+    Bring the rolling summary of a transcript up to date.
+
+    Only transcript text added since the last run is summarized. The
+    result is saved as a new version in SUMMARIES_DIR (see summary_store);
+    the transcript itself is never modified. See incremental_summary.
+
+    Args:
+        transcript_path: Path to the transcript file
+        use_local: If True, use local T5 model instead of Claude
+        on_delta: Optional callback that receives the summary text piece by
+            piece as it is generated
+
+    Returns:
+        Path to the saved summary version
+
+    Raises:
+        FileError: If the transcript cannot be read or the summary cannot be
+            saved (raised by incremental_summary.summarize_incremental)
+        SummarizationError: If summary generation fails
+    """
+    from incremental_summary import summarize_incremental
+    return summarize_incremental(transcript_path, use_local, on_delta)
+
 
 if __name__ == "__main__":
     import sys
-    
+
     if len(sys.argv) < 2:
         print("Usage: python summary.py <transcript_file_path> [--local]")
         sys.exit(1)
-    
+
     transcript_path = sys.argv[1]
     use_local = "--local" in sys.argv
-    
+
     try:
-        append_summary_to_file(transcript_path, use_local)
-        print(f"Summary appended to: {transcript_path}")
+        summary_path = summarize_transcript_file(
+            transcript_path, use_local, on_delta=lambda text: print(text, end="", flush=True)
+        )
+        print(f"\n\nSummary saved to: {summary_path}")
     except Exception as e:
         error_message = handle_error(e, "summary.py")
         print(f"Error: {error_message}")
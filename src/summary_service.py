@@ -0,0 +1,275 @@
+import os
+import sys
+import asyncio
+from utils.error_handler import SummarizationError, handle_error, logger
+from utils.rate_limit import RateLimiter, backoff_delay
+from text_chunking import chunk_by_chars
+from summary_store import SummaryStore
+from summary import (
+    SYSTEM_PROMPT,
+    SUMMARY_PROMPT,
+    SECTION_PROMPT,
+    REDUCE_PROMPT,
+    STUDY_TIPS,
+    CLAUDE_MAX_TOKENS,
+    CLAUDE_TEMPERATURE,
+    claude_summary_key,
+    prepare_claude_input,
+    lookup_summary,
+    store_summary,
+)
+from config import (
+    CLAUDE_MODEL,
+    ANTHROPIC_BASE_URL,
+    ANTHROPIC_REQUESTS_PER_MINUTE,
+    ANTHROPIC_TOKENS_PER_MINUTE,
+    ANTHROPIC_MAX_RETRIES,
+    ANTHROPIC_RETRY_BASE_SECONDS,
+    ANTHROPIC_RETRY_MAX_SECONDS,
+    SUMMARY_CONCURRENCY,
+    SUMMARY_SECTION_CHARS,
+    SUMMARY_REDUCE_FAN_IN,
+)
+
+# Rough size of a token in English text, for budgeting before a request is sent
+CHARS_PER_TOKEN = 4
+
+
+def _create_async_client():
+    import anthropic
+    # Retries are handled here so they also respect the rate limiter
+    return anthropic.AsyncAnthropic(
+        api_key=os.environ.get("ANTHROPIC_API_KEY"), base_url=ANTHROPIC_BASE_URL, max_retries=0
+    )
+
+
+def _status_code(error):
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status
+
+
+def _retry_after(error):
+    headers = getattr(getattr(error, "response", None), "headers", None) or {}
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_retryable(error):
+    """Return True for rate limiting (429), overload/server errors (5xx) and connection failures."""
+    status = _status_code(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    if isinstance(error, (ConnectionError, asyncio.TimeoutError)):
+        return True
+    try:
+        import anthropic
+    except ImportError:
+        return False
+    return isinstance(error, anthropic.APIConnectionError)
+
+
+class SummaryService:
+    """
+    Asyncio summarization service for bulk work.
+
+    One AsyncAnthropic client (and its HTTP connection pool) is shared by
+    every request. Requests are limited by a concurrency cap and by
+    requests/tokens-per-minute token buckets, and 429/5xx responses are
+    retried with jittered exponential backoff that honors Retry-After.
+    Summaries share the cache used by summary.generate_summary().
+
+    Usage:
+        async with SummaryService() as service:
+            summaries = await service.summarize_many(texts)
+    """
+
+    def __init__(self, client=None, concurrency=SUMMARY_CONCURRENCY,
+                 requests_per_minute=ANTHROPIC_REQUESTS_PER_MINUTE,
+                 tokens_per_minute=ANTHROPIC_TOKENS_PER_MINUTE,
+                 max_retries=ANTHROPIC_MAX_RETRIES, retry_base=ANTHROPIC_RETRY_BASE_SECONDS,
+                 retry_max=ANTHROPIC_RETRY_MAX_SECONDS, sleep=asyncio.sleep, clock=None):
+        self.client = client
+        self.max_retries = max_retries
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.sleep = sleep
+        self.concurrency = concurrency
+        self._semaphore = None
+        self._loop = None
+        limiter_args = {"sleep": sleep}
+        if clock is not None:
+            limiter_args["clock"] = clock
+        self.limiter = RateLimiter(requests_per_minute, tokens_per_minute, **limiter_args)
+        self.requests = 0
+        self.retries = 0
+
+    @property
+    def semaphore(self):
+        """The concurrency cap, created in the running event loop."""
+        # Python 3.9 binds a semaphore to the loop current at creation, which
+        # is not the one asyncio.run() starts for a service built beforehand
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        if self.client is not None and hasattr(self.client, "close"):
+            await self.client.close()
+
+    async def complete(self, prompt, max_tokens=CLAUDE_MAX_TOKENS):
+        """
+        Send one prompt to Claude and return the response text.
+
+        Raises:
+            SummarizationError: If the request fails for good
+        """
+        if self.client is None:
+            self.client = _create_async_client()
+        estimate = len(prompt) // CHARS_PER_TOKEN + max_tokens
+
+        for attempt in range(self.max_retries + 1):
+            async with self.semaphore:
+                await self.limiter.acquire(estimate)
+                self.requests += 1
+                try:
+                    message = await self.client.messages.create(
+                        model=CLAUDE_MODEL,
+                        messages=[{"role": "user", "content": prompt}],
+                        max_tokens=max_tokens,
+                        temperature=CLAUDE_TEMPERATURE,
+                        system=SYSTEM_PROMPT,
+                    )
+                    return message.content[0].text
+                except Exception as e:
+                    if not is_retryable(e) or attempt == self.max_retries:
+                        raise SummarizationError(f"Claude request failed: {str(e)}")
+                    error = e
+            # Back off outside the semaphore so other requests can proceed
+            delay = backoff_delay(attempt, self.retry_base, self.retry_max, _retry_after(error))
+            logger.warning(
+                f"Claude request failed with {_status_code(error) or type(error).__name__}; "
+                f"retrying in {delay:.1f}s"
+            )
+            self.retries += 1
+            await self.sleep(delay)
+
+    async def _hierarchical(self, text):
+        sections = chunk_by_chars(text, SUMMARY_SECTION_CHARS)
+        if len(sections) <= 1:
+            return await self.complete(SUMMARY_PROMPT.format(text=text.strip()))
+
+        partials = await asyncio.gather(*[
+            self.complete(SECTION_PROMPT.format(index=i, total=len(sections), text=section))
+            for i, section in enumerate(sections, start=1)
+        ])
+        fan_in = max(2, SUMMARY_REDUCE_FAN_IN)
+        while len(partials) > fan_in:
+            groups = [partials[i:i + fan_in] for i in range(0, len(partials), fan_in)]
+            partials = await asyncio.gather(*[
+                self.complete(REDUCE_PROMPT.format(text="\n\n".join(group))) for group in groups
+            ])
+        return await self.complete(
+            REDUCE_PROMPT.format(text="\n\n".join(partials)), max_tokens=2 * CLAUDE_MAX_TOKENS
+        )
+
+    async def summarize(self, text, hierarchical=None):
+        """
+        Summarize one transcript; same output and cache as summary.generate_summary().
+
+        Returns:
+            A string containing the summary and study tips
+        """
+        key = claude_summary_key(text, hierarchical)
+        summary = lookup_summary(key)
+        if summary is None:
+            text, hierarchical = prepare_claude_input(text, hierarchical)
+            if hierarchical:
+                summary = await self._hierarchical(text)
+            else:
+                single = text.strip().replace("\n", " ")[:SUMMARY_SECTION_CHARS]
+                summary = await self.complete(SUMMARY_PROMPT.format(text=single))
+            store_summary(key, summary)
+        return "Summary:\n" + summary + STUDY_TIPS
+
+    async def summarize_many(self, texts, hierarchical=None):
+        """
+        Summarize many transcripts concurrently within the rate limits.
+
+        Args:
+            texts: Transcript texts
+            hierarchical: See summarize()
+
+        Returns:
+            A list in the order of ``texts``; each item is the summary string,
+            or the SummarizationError raised for that transcript
+        """
+        results = await asyncio.gather(
+            *[self.summarize(text, hierarchical) for text in texts], return_exceptions=True
+        )
+        failed = sum(isinstance(r, Exception) for r in results)
+        logger.info(
+            f"Summarized {len(results) - failed}/{len(results)} transcripts "
+            f"({self.requests} requests, {self.retries} retries)"
+        )
+        return [
+            r if not isinstance(r, Exception) or isinstance(r, SummarizationError)
+            else SummarizationError(str(r))
+            for r in results
+        ]
+
+
+async def summarize_files(paths, store=None, **service_options):
+    """
+    Summarize transcript files and save each summary as a new version in the summary store.
+
+    Returns:
+        List of (transcript path, summary path or the error) pairs
+    """
+    texts = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            texts.append(f.read())
+    async with SummaryService(**service_options) as service:
+        summaries = await service.summarize_many(texts)
+
+    store = store or SummaryStore()
+    results = []
+    for path, summary in zip(paths, summaries):
+        if isinstance(summary, Exception):
+            results.append((path, summary))
+            continue
+        record = store.save(path, summary, "claude", CLAUDE_MODEL)
+        results.append((path, store.path_of(record)))
+    return results
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python summary_service.py <transcript_file> [<transcript_file> ...]")
+        sys.exit(1)
+
+    try:
+        results = asyncio.run(summarize_files(sys.argv[1:]))
+        for path, outcome in results:
+            if isinstance(outcome, Exception):
+                print(f"❌ {path}: {outcome}")
+            else:
+                print(f"✅ {path} → {outcome}")
+        if any(isinstance(outcome, Exception) for _, outcome in results):
+            sys.exit(1)
+    except Exception as e:
+        error_message = handle_error(e, "summary_service.py")
+        print(f"Error: {error_message}")
+        sys.exit(1)
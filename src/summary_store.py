@@ -0,0 +1,186 @@
+import os
+import json
+import hashlib
+import threading
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+from utils.disk_cache import hash_text
+from utils.error_handler import FileError, logger
+from config import SUMMARIES_DIR
+
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+_index_lock = threading.Lock()
+
+
+@dataclass
+class SummaryRecord:
+    """One saved version of a transcript's summary."""
+
+    transcript: str
+    version: int
+    path: str
+    transcript_hash: str
+    summary_hash: str
+    backend: str
+    model: str
+    created: str
+
+
+def hash_transcript(transcript_path, end=None, chunk_size=1024 * 1024):
+    """
+    Return the SHA-256 of a transcript's first ``end`` bytes (all of it by default).
+
+    Rolling summaries describe only the part of a growing transcript they
+    have covered, so that part is what links a summary to its transcript.
+    """
+    digest = hashlib.sha256()
+    remaining = end if end is not None else float("inf")
+    with open(transcript_path, "rb") as f:
+        while remaining > 0:
+            block = f.read(int(min(chunk_size, remaining)))
+            if not block:
+                break
+            digest.update(block)
+            remaining -= len(block)
+    return digest.hexdigest()
+
+
+def _write_atomic(path, data):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+
+class SummaryStore:
+    """
+    Versioned summary files kept apart from the transcripts.
+
+    Each transcript gets a folder named after it holding ``v0001.md``,
+    ``v0002.md``, ... Saved versions are never rewritten. ``index.json``
+    lists every version with the hash of the transcript content it
+    describes, so listing and lookups never open the summaries themselves.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory or SUMMARIES_DIR)
+        self.index_path = self.directory / INDEX_FILE
+
+    def _load_index(self):
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable summary index {self.index_path}: {str(e)}")
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return {
+            name: [SummaryRecord(**record) for record in records]
+            for name, records in data.get("transcripts", {}).items()
+        }
+
+    def _save_index(self, index):
+        data = {
+            "version": INDEX_VERSION,
+            "transcripts": {
+                name: [asdict(record) for record in records] for name, records in index.items()
+            },
+        }
+        _write_atomic(self.index_path, json.dumps(data, indent=2))
+
+    @staticmethod
+    def _name(transcript):
+        return Path(transcript).stem
+
+    def path_of(self, record):
+        return self.directory / record.path
+
+    def versions(self, transcript):
+        """Return every saved version for a transcript (path or name), oldest first."""
+        return self._load_index().get(self._name(transcript), [])
+
+    def latest(self, transcript):
+        """Return the newest SummaryRecord for a transcript, or None."""
+        versions = self.versions(transcript)
+        return versions[-1] if versions else None
+
+    def latest_versions(self):
+        """Return the newest SummaryRecord of every transcript, sorted by name."""
+        index = self._load_index()
+        return [index[name][-1] for name in sorted(index) if index[name]]
+
+    def find(self, transcript_hash):
+        """Return the versions that describe transcript content with this hash."""
+        return [
+            record
+            for records in self._load_index().values()
+            for record in records
+            if record.transcript_hash == transcript_hash
+        ]
+
+    def read(self, record):
+        with open(self.path_of(record), "r", encoding="utf-8") as f:
+            return f.read()
+
+    def save(self, transcript_path, text, backend, model, transcript_hash=None):
+        """
+        Save a summary as the next version for its transcript.
+
+        Saving the same summary of the same transcript content again
+        returns the existing version instead of adding a new one.
+
+        Args:
+            transcript_path: Path to the transcript the summary describes
+            text: Summary text
+            backend: "claude" or "t5"
+            model: Model name
+            transcript_hash: Hash of the summarized content (default: the
+                whole transcript, see hash_transcript)
+
+        Returns:
+            The SummaryRecord
+
+        Raises:
+            FileError: If the summary cannot be written
+        """
+        name = self._name(transcript_path)
+        try:
+            if transcript_hash is None:
+                transcript_hash = hash_transcript(transcript_path)
+            summary_hash = hash_text(text)
+
+            with _index_lock:
+                index = self._load_index()
+                versions = index.setdefault(name, [])
+                if versions and versions[-1].summary_hash == summary_hash \
+                        and versions[-1].transcript_hash == transcript_hash:
+                    return versions[-1]
+
+                version = versions[-1].version + 1 if versions else 1
+                record = SummaryRecord(
+                    transcript=name,
+                    version=version,
+                    path=f"{name}/v{version:04d}.md",
+                    transcript_hash=transcript_hash,
+                    summary_hash=summary_hash,
+                    backend=backend,
+                    model=model,
+                    created=datetime.now().isoformat(timespec="seconds"),
+                )
+                # The file goes first so the index never points at a missing version
+                _write_atomic(self.path_of(record), text)
+                versions.append(record)
+                self._save_index(index)
+        except OSError as e:
+            raise FileError(f"Failed to save summary: {str(e)}")
+
+        logger.info(f"Saved summary version {version} of {name} to {self.path_of(record)}")
+        return record
@@ -0,0 +1,99 @@
+import re
+import textwrap
+
+# Sentence ends at ., ! or ? (optionally followed by closing quotes or
+# brackets) before whitespace, or at a blank line
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|(?<=[.!?][\"')\]])\s+|\n\s*\n")
+
+
+def split_sentences(text):
+    """Split text into sentences, dropping empty pieces."""
+    return [s.strip() for s in SENTENCE_BOUNDARY.split(text) if s and s.strip()]
+
+
+def count_tokens(tokenizer, texts):
+    """Return the token count of each text, tokenizing them in one batch."""
+    if not texts:
+        return []
+    return [len(ids) for ids in tokenizer(texts, add_special_tokens=False)["input_ids"]]
+
+
+def _split_long(tokenizer, sentence, max_tokens):
+    """Cut a sentence that alone exceeds the budget into token-sized pieces."""
+    ids = tokenizer([sentence], add_special_tokens=False)["input_ids"][0]
+    return [
+        tokenizer.decode(ids[i:i + max_tokens], skip_special_tokens=True).strip()
+        for i in range(0, len(ids), max_tokens)
+    ]
+
+
+def pack_sentences(sentences, counts, max_tokens, tokenizer=None):
+    """
+    Greedily pack consecutive sentences into chunks of at most ``max_tokens``.
+
+    Args:
+        sentences: Sentences in reading order
+        counts: Token count of each sentence
+        max_tokens: Token budget per chunk
+        tokenizer: Used to cut sentences longer than the budget; without it
+            such sentences become a chunk of their own
+
+    Returns:
+        List of chunk strings
+    """
+    chunks = []
+    current, used = [], 0
+    for sentence, count in zip(sentences, counts):
+        if count > max_tokens:
+            if current:
+                chunks.append(" ".join(current))
+                current, used = [], 0
+            if tokenizer is None:
+                chunks.append(sentence)
+            else:
+                chunks.extend(_split_long(tokenizer, sentence, max_tokens))
+            continue
+        # Joining adds a space, which tokenizers usually fold into the next
+        # token, so the sum of sentence counts is a close upper bound
+        if current and used + count > max_tokens:
+            chunks.append(" ".join(current))
+            current, used = [], 0
+        current.append(sentence)
+        used += count
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
+
+
+def chunk_text(text, tokenizer, max_tokens):
+    """
+    Split text into sentence-aligned chunks that fit a model's input budget.
+
+    Args:
+        text: Text to split
+        tokenizer: Hugging Face-style tokenizer (callable on a list of
+            strings, with ``decode``)
+        max_tokens: Token budget per chunk
+
+    Returns:
+        List of chunk strings
+    """
+    sentences = split_sentences(text)
+    return pack_sentences(sentences, count_tokens(tokenizer, sentences), max_tokens, tokenizer)
+
+
+def chunk_by_chars(text, max_chars):
+    """
+    Split text into sentence-aligned chunks of at most ``max_chars`` characters.
+
+    For models whose tokenizer is not available locally. Sentences longer
+    than the budget are wrapped at word boundaries.
+    """
+    sentences = []
+    for sentence in split_sentences(text):
+        if len(sentence) > max_chars:
+            sentences.extend(textwrap.wrap(sentence, max_chars, break_long_words=True))
+        else:
+            sentences.append(sentence)
+    # +1 for the joining space
+    return pack_sentences(sentences, [len(s) + 1 for s in sentences], max_chars + 1)
@@ -1,21 +1,32 @@
 import os
-import subprocess
 import shutil
-import tempfile
-import whisper
 from pathlib import Path
 from utils.error_handler import (
-    TranscriptionError, 
-    FileError, 
-    handle_error, 
+    TranscriptionError,
+    FileError,
+    handle_error,
     logger
 )
-from config import TRANSCRIPTS_DIR
+from config import (
+    WHISPER_MODEL,
+    WHISPER_DEVICE,
+    WHISPER_PRECISION,
+    WHISPER_AUTO_SELECT,
+    WHISPER_PROFILE_PATH,
+    VAD_ENABLED,
+    TRANSCRIBE_WORKERS,
+    PARALLEL_MIN_SECONDS,
+    CHECKPOINT_ENABLED,
+    CHECKPOINT_MIN_SECONDS,
+)
+from model_registry import get_model, set_torch_threads
+from calibrate import select_model
+from audio import check_ffmpeg, load_audio, duration_seconds, probe_duration
+from vad import detect_speech, compact, remap_segments
+from utils.disk_cache import hash_file
+from transcript_store import write_transcript, segments_path_for
+import transcript_cache
 
-def check_ffmpeg():
-    """Check if ffmpeg is installed."""
-    if shutil.which("ffmpeg") is None:
-        raise TranscriptionError("ffmpeg is not installed or not found in system PATH.")
 
 def get_data_dir():
     """Get the data directory where transcripts are saved."""
@@ -23,99 +34,182 @@ def get_data_dir():
     data_dir.mkdir(exist_ok=True)
     return data_dir
 
-def convert_to_wav(input_path):
+
+def transcribe_audio(audio, model, fp16=False, use_vad=VAD_ENABLED):
     """
-    Convert audio file to WAV format.
-    
+    Run Whisper on a decoded recording.
+
+    With VAD enabled, silent stretches are cut out before the model runs
+    and segment timestamps are mapped back onto the original timeline.
+
     Args:
-        input_path: Path to the input audio file
-        
+        audio: 1-D float32 array at 16 kHz
+        model: A loaded Whisper model
+        fp16: Whether to decode in half precision
+        use_vad: Whether to skip silence before transcribing
+
     Returns:
-        Path to the converted WAV file
+        Whisper's result dict; with VAD it also carries a "vad" entry with
+        the speech ratio and related metrics
     """
-    try:
-        check_ffmpeg()
-        temp_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_wav.close()
-
-        command = [
-            "ffmpeg",
-            "-i", input_path,
-            "-ar", "16000",  # Sample rate required by whisper
-            "-ac", "1",      # Mono channel
-            temp_wav.name,
-            "-y"             # Overwrite output if exists
-        ]
-        subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
-        return temp_wav.name
-    except subprocess.CalledProcessError as e:
-        raise TranscriptionError(f"Failed to convert audio to WAV: {str(e)}")
-    except Exception as e:
-        raise TranscriptionError(f"Unexpected error during audio conversion: {str(e)}")
+    if not use_vad:
+        return model.transcribe(audio, fp16=fp16)
+
+    speech = detect_speech(audio)
+    metrics = speech.metrics()
+    logger.info(
+        f"VAD kept {metrics['speech_seconds']:.1f}s of {metrics['total_seconds']:.1f}s "
+        f"(speech ratio {metrics['speech_ratio']:.2f})"
+    )
+    if not speech.regions:
+        return {"text": "", "segments": [], "language": None, "vad": metrics}
+
+    speech_audio, time_map = compact(audio, speech)
+    result = model.transcribe(speech_audio, fp16=fp16)
+    remap_segments(result.get("segments", []), time_map)
+    result["vad"] = metrics
+    return result
+
+
+def _decode(file_path):
+    """Decode straight into memory (16 kHz mono float32)."""
+    check_ffmpeg()
+    logger.info(f"Decoding {file_path}")
+    audio = load_audio(file_path)
+    logger.info(f"Decoded {duration_seconds(audio):.1f}s of audio")
+    return audio
 
-def transcribe(file_path):
+
+def transcribe(file_path, model_name=None, device=None, precision=None, use_vad=VAD_ENABLED,
+               workers=TRANSCRIBE_WORKERS, checkpoint=CHECKPOINT_ENABLED, deadline=None):
     """
     Transcribe an audio file using Whisper.
-    
+
     Args:
         file_path: Path to the audio file
-        
+        model_name: Whisper model to use (default: picked from the calibration
+            profile if there is one, else config.WHISPER_MODEL)
+        device: Device to run on (default: config.WHISPER_DEVICE)
+        precision: "fp32" or "fp16" (default: config.WHISPER_PRECISION)
+        use_vad: Whether to skip silence before transcribing
+        workers: Worker processes for recordings longer than
+            config.PARALLEL_MIN_SECONDS (1 transcribes serially)
+        checkpoint: Whether recordings longer than config.CHECKPOINT_MIN_SECONDS
+            record finished windows in a sidecar journal, so an interrupted
+            run resumes where it stopped
+        deadline: Optional wall-clock budget in seconds; tightens the
+            real-time factor the auto-selected model has to meet
+
     Returns:
         Path to the transcript file
     """
     try:
         logger.info(f"Starting transcription of {file_path}")
-        check_ffmpeg()
 
         # Check if file exists
         if not os.path.exists(file_path):
             raise FileError(f"File not found: {file_path}")
 
-        # Get clean filename for saving transcript
-        filename_base = os.path.splitext(os.path.basename(file_path))[0]
-        transcript_path = TRANSCRIPTS_DIR / f"{filename_base}.txt"
+        # Identify the recording by content, not by name
+        audio_hash = hash_file(file_path)
+        transcript_path = transcript_cache.transcript_path_for(file_path, audio_hash)
+
+        # Let the calibration profile pick the model when none was requested.
+        # The choice depends on the recording's duration, which ffprobe reads
+        # from the header so a cache hit below never pays for a decode
+        audio = None
+        if model_name is None and WHISPER_AUTO_SELECT and WHISPER_PROFILE_PATH.exists():
+            duration = probe_duration(file_path)
+            if duration is None:
+                audio = _decode(file_path)
+                duration = duration_seconds(audio)
+            choice = select_model(
+                duration,
+                deadline_seconds=deadline,
+                device=device or WHISPER_DEVICE,
+            )
+            if choice:
+                model_name = choice["model"]
+                precision = precision or choice["precision"]
+                if not (workers and workers > 1):
+                    set_torch_threads(choice["threads"])
+
+        cache_key = transcript_cache.transcript_key(
+            audio_hash,
+            "whisper",
+            model_name or WHISPER_MODEL,
+            {"precision": precision or WHISPER_PRECISION, "vad": bool(use_vad)},
+        )
+        cached = transcript_cache.lookup(cache_key)
+        if cached is not None:
+            shutil.copyfile(cached / transcript_cache.TRANSCRIPT_FILE, transcript_path)
+            if (cached / transcript_cache.SEGMENTS_FILE).exists():
+                shutil.copyfile(
+                    cached / transcript_cache.SEGMENTS_FILE, segments_path_for(transcript_path)
+                )
+            logger.info(f"Reused cached transcript for {file_path}")
+            return str(transcript_path)
 
-        # Convert if necessary
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext not in [".mp3", ".wav"]:
-            logger.info(f"Converting {file_path} to WAV format")
-            file_path = convert_to_wav(file_path)
-            cleanup_temp = True
+        if audio is None:
+            audio = _decode(file_path)
+        duration = duration_seconds(audio)
+
+        parallel = workers and workers > 1 and duration >= PARALLEL_MIN_SECONDS
+        resumable = checkpoint and duration >= CHECKPOINT_MIN_SECONDS
+        journal = None
+        if parallel or resumable:
+            from parallel_transcribe import plan_windows, transcribe_windows
+            windows = plan_windows(audio)
+            if resumable:
+                from checkpoint import TranscriptionJournal
+                journal = TranscriptionJournal(
+                    transcript_path.with_suffix(".journal.jsonl"),
+                    {
+                        "cache_key": cache_key,
+                        "windows": [
+                            [w.start, w.end, w.core_start, w.core_end] for w in windows
+                        ],
+                    },
+                )
+            result = transcribe_windows(
+                audio, windows, workers if parallel else 1, model_name, device, precision,
+                use_vad=use_vad, journal=journal,
+            )
         else:
-            cleanup_temp = False
+            # Fetch the shared model (loaded once per process)
+            model = get_model(model_name, device, precision)
 
-        # Load and run Whisper
-        logger.info("Loading Whisper model")
-        model = whisper.load_model("base")
-        
-        logger.info("Transcribing audio")
-        result = model.transcribe(file_path, fp16=False)
+            logger.info("Transcribing audio")
+            fp16 = (precision or WHISPER_PRECISION) == "fp16"
+            result = transcribe_audio(audio, model, fp16=fp16, use_vad=use_vad)
 
-        # Write transcript
+        # Write the structured segments and the plain-text view derived from them
         logger.info(f"Writing transcript to {transcript_path}")
-        with open(transcript_path, "w", encoding="utf-8") as f:
-            f.write(result["text"])
-
-        # Clean up temp file if created
-        if cleanup_temp and os.path.exists(file_path):
-            os.remove(file_path)
+        _, segments_path = write_transcript(transcript_path, result.get("segments", []))
+        transcript_cache.store(cache_key, {
+            transcript_cache.TRANSCRIPT_FILE: transcript_path,
+            transcript_cache.SEGMENTS_FILE: segments_path,
+        })
+        if journal:
+            journal.discard()
 
         logger.info("Transcription completed successfully")
         return str(transcript_path)
-    except TranscriptionError as e:
+    except TranscriptionError:
         # Re-raise custom exceptions
         raise
     except Exception as e:
         # Wrap other exceptions
         raise TranscriptionError(f"Transcription failed: {str(e)}")
 
+
 if __name__ == "__main__":
     import sys
-    
+
     if len(sys.argv) < 2:
         print("Usage: python transcribe.py <audio_file_path>")
         sys.exit(1)
-    
+
     file_path = sys.argv[1]
     try:
         transcript_path = transcribe(file_path)
@@ -0,0 +1,82 @@
+import os
+import threading
+from utils.disk_cache import DiskCache, make_key
+from utils.error_handler import logger
+from config import (
+    TRANSCRIPTS_DIR,
+    TRANSCRIPT_CACHE_DIR,
+    TRANSCRIPT_CACHE_ENABLED,
+    TRANSCRIPT_CACHE_MAX_MB,
+    TRANSCRIPT_CACHE_MAX_AGE_DAYS,
+)
+
+TRANSCRIPT_FILE = "transcript.txt"
+SEGMENTS_FILE = "segments.npz"
+UTTERANCES_FILE = "utterances.npz"
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_transcript_cache():
+    """Return the process-wide transcript cache."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = DiskCache(
+                TRANSCRIPT_CACHE_DIR,
+                max_bytes=TRANSCRIPT_CACHE_MAX_MB * 1024 * 1024,
+                max_age_seconds=TRANSCRIPT_CACHE_MAX_AGE_DAYS * 24 * 3600,
+            )
+        return _cache
+
+
+def transcript_key(audio_hash, engine, model, options):
+    """
+    Build the cache key for a transcription.
+
+    Args:
+        audio_hash: SHA-256 of the audio file's bytes
+        engine: "whisper" or "deepgram"
+        model: Model identifier used by the engine
+        options: Dict of decoding options that affect the output
+    """
+    return make_key(audio_hash, engine, model, **options)
+
+
+def transcript_path_for(file_path, audio_hash, suffix=""):
+    """
+    Return where the transcript of an audio file is written.
+
+    The name carries a prefix of the audio hash, so two different
+    recordings that happen to share a file name do not overwrite each
+    other's transcripts.
+    """
+    filename_base = os.path.splitext(os.path.basename(file_path))[0]
+    return TRANSCRIPTS_DIR / f"{filename_base}_{audio_hash[:8]}{suffix}.txt"
+
+
+def lookup(key):
+    """
+    Return the cached entry directory for a key, or None.
+
+    Always misses when the cache is disabled in config.
+    """
+    if not TRANSCRIPT_CACHE_ENABLED:
+        return None
+    entry = get_transcript_cache().get(key)
+    if entry is not None:
+        logger.info(f"Transcript cache hit ({key[:12]})")
+    return entry
+
+
+def store(key, files):
+    """Store transcript artifacts (mapping of file name to content or path)."""
+    if not TRANSCRIPT_CACHE_ENABLED:
+        return None
+    try:
+        return get_transcript_cache().put(key, files)
+    except OSError as e:
+        # The cache is an optimization; never fail a transcription over it
+        logger.warning(f"Failed to write transcript cache entry: {str(e)}")
+        return None
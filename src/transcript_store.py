@@ -0,0 +1,384 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+import numpy as np
+
+SEGMENTS_SUFFIX = ".segments.npz"
+UTTERANCES_SUFFIX = ".utterances.npz"
+INTERIM_SUFFIX = ".interim.txt"
+
+
+def _pack_texts(texts):
+    """Encode strings as one UTF-8 buffer plus the offsets that delimit them."""
+    encoded = [t.encode("utf-8") for t in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    return offsets, np.frombuffer(b"".join(encoded), dtype=np.uint8)
+
+
+def _unpack_text(buffer, offsets, i):
+    return buffer[offsets[i]:offsets[i + 1]].tobytes().decode("utf-8")
+
+
+def _format_timestamp(seconds, separator=":", millis=False):
+    whole = int(seconds)
+    stamp = f"{whole // 3600:02d}{separator}{whole % 3600 // 60:02d}{separator}{whole % 60:02d}"
+    if millis:
+        stamp += f".{int(round((seconds - whole) * 1000)):03d}"
+    return stamp
+
+
+@dataclass
+class SegmentTable:
+    """
+    Column-oriented transcript segments.
+
+    Timing and confidence live in NumPy arrays; all segment texts are kept
+    in one UTF-8 buffer addressed by ``offsets`` (segment i is
+    ``buffer[offsets[i]:offsets[i + 1]]``), so loading never parses text.
+    """
+
+    start: np.ndarray
+    end: np.ndarray
+    avg_logprob: np.ndarray
+    no_speech_prob: np.ndarray
+    offsets: np.ndarray
+    buffer: np.ndarray
+
+    @classmethod
+    def from_segments(cls, segments):
+        """Build a table from Whisper-style segment dicts."""
+        offsets, buffer = _pack_texts([s.get("text", "") for s in segments])
+        return cls(
+            start=np.array([s.get("start", 0.0) for s in segments], dtype=np.float32),
+            end=np.array([s.get("end", 0.0) for s in segments], dtype=np.float32),
+            avg_logprob=np.array(
+                [s.get("avg_logprob", np.nan) for s in segments], dtype=np.float32
+            ),
+            no_speech_prob=np.array(
+                [s.get("no_speech_prob", np.nan) for s in segments], dtype=np.float32
+            ),
+            offsets=offsets,
+            buffer=buffer,
+        )
+
+    def __len__(self):
+        return len(self.start)
+
+    def text_at(self, i):
+        return _unpack_text(self.buffer, self.offsets, i)
+
+    def texts(self):
+        return [self.text_at(i) for i in range(len(self))]
+
+    def full_text(self):
+        """Return the transcript as one string, exactly as Whisper joined it."""
+        return self.buffer.tobytes().decode("utf-8")
+
+    def to_text(self):
+        """Render the plain-text view: one segment per line."""
+        return "\n".join(text.strip() for text in self.texts()) + ("\n" if len(self) else "")
+
+    def slice_time(self, start, end):
+        """Return the indices of segments that overlap [start, end) seconds."""
+        return np.flatnonzero((self.end > start) & (self.start < end))
+
+    def save(self, path):
+        path = Path(path)
+        # Write through a file object so np.savez keeps the name as given
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                start=self.start,
+                end=self.end,
+                avg_logprob=self.avg_logprob,
+                no_speech_prob=self.no_speech_prob,
+                offsets=self.offsets,
+                buffer=self.buffer,
+            )
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+
+def segments_path_for(transcript_path):
+    """Return the structured artifact that sits next to a .txt transcript."""
+    transcript_path = Path(transcript_path)
+    return transcript_path.with_name(transcript_path.stem + SEGMENTS_SUFFIX)
+
+
+def write_transcript(transcript_path, segments):
+    """
+    Write the structured segments and the derived .txt view.
+
+    Args:
+        transcript_path: Path of the .txt transcript
+        segments: Whisper-style segment dicts
+
+    Returns:
+        (transcript path, segments path)
+    """
+    table = SegmentTable.from_segments(segments)
+    segments_path = table.save(segments_path_for(transcript_path))
+    with open(transcript_path, "w", encoding="utf-8") as f:
+        f.write(table.to_text())
+    return Path(transcript_path), segments_path
+
+
+def load_segments(transcript_path):
+    """
+    Load the structured segments for a transcript.
+
+    Args:
+        transcript_path: Path of the .txt transcript or of the .segments.npz
+
+    Returns:
+        A SegmentTable, or None if no structured artifact exists
+    """
+    path = Path(transcript_path)
+    if not path.name.endswith(SEGMENTS_SUFFIX):
+        path = segments_path_for(path)
+    if not path.exists():
+        return None
+    return SegmentTable.load(path)
+
+
+@dataclass
+class UtteranceTable:
+    """
+    Column-oriented speaker turns from a diarized Deepgram transcript.
+
+    Utterance i spans words ``word_offsets[i]:word_offsets[i + 1]``;
+    utterance and word texts are stored like SegmentTable's, so filtering
+    by speaker or time and exporting never re-parse the API response.
+    """
+
+    start: np.ndarray
+    end: np.ndarray
+    confidence: np.ndarray
+    speaker: np.ndarray
+    offsets: np.ndarray
+    buffer: np.ndarray
+    word_offsets: np.ndarray
+    word_start: np.ndarray
+    word_end: np.ndarray
+    word_confidence: np.ndarray
+    word_text_offsets: np.ndarray
+    word_buffer: np.ndarray
+
+    @classmethod
+    def from_utterances(cls, utterances):
+        """Build a table from Deepgram utterance dicts (``results.utterances``)."""
+        words = [w for u in utterances for w in u.get("words", [])]
+        word_offsets = np.zeros(len(utterances) + 1, dtype=np.int64)
+        if utterances:
+            np.cumsum([len(u.get("words", [])) for u in utterances], out=word_offsets[1:])
+        offsets, buffer = _pack_texts([u.get("transcript", "") for u in utterances])
+        word_text_offsets, word_buffer = _pack_texts(
+            [w.get("punctuated_word") or w.get("word", "") for w in words]
+        )
+        return cls(
+            start=np.array([u.get("start", 0.0) for u in utterances], dtype=np.float32),
+            end=np.array([u.get("end", 0.0) for u in utterances], dtype=np.float32),
+            confidence=np.array(
+                [u.get("confidence", np.nan) for u in utterances], dtype=np.float32
+            ),
+            speaker=np.array(
+                [-1 if u.get("speaker") is None else u["speaker"] for u in utterances],
+                dtype=np.int16,
+            ),
+            offsets=offsets,
+            buffer=buffer,
+            word_offsets=word_offsets,
+            word_start=np.array([w.get("start", 0.0) for w in words], dtype=np.float32),
+            word_end=np.array([w.get("end", 0.0) for w in words], dtype=np.float32),
+            word_confidence=np.array(
+                [w.get("confidence", np.nan) for w in words], dtype=np.float32
+            ),
+            word_text_offsets=word_text_offsets,
+            word_buffer=word_buffer,
+        )
+
+    @classmethod
+    def from_response(cls, response):
+        """
+        Build a table from a prerecorded API response (as a dict).
+
+        Without ``utterances`` in the response, turns are rebuilt from the
+        first channel's words wherever the speaker changes.
+        """
+        results = response.get("results") or {}
+        if results.get("utterances"):
+            return cls.from_utterances(results["utterances"])
+        words = results["channels"][0]["alternatives"][0].get("words") or []
+        utterances = []
+        for word in words:
+            if not utterances or utterances[-1]["speaker"] != word.get("speaker"):
+                utterances.append({"speaker": word.get("speaker"), "words": []})
+            utterances[-1]["words"].append(word)
+        for u in utterances:
+            u["start"] = u["words"][0].get("start", 0.0)
+            u["end"] = u["words"][-1].get("end", 0.0)
+            u["confidence"] = float(np.mean([w.get("confidence", np.nan) for w in u["words"]]))
+            u["transcript"] = " ".join(
+                w.get("punctuated_word") or w.get("word", "") for w in u["words"]
+            )
+        return cls.from_utterances(utterances)
+
+    def __len__(self):
+        return len(self.start)
+
+    def text_at(self, i):
+        return _unpack_text(self.buffer, self.offsets, i)
+
+    def texts(self):
+        return [self.text_at(i) for i in range(len(self))]
+
+    def words_at(self, i):
+        """Return (word, start, end, confidence) tuples of utterance i."""
+        return [
+            (
+                _unpack_text(self.word_buffer, self.word_text_offsets, j),
+                float(self.word_start[j]),
+                float(self.word_end[j]),
+                float(self.word_confidence[j]),
+            )
+            for j in range(self.word_offsets[i], self.word_offsets[i + 1])
+        ]
+
+    def speakers(self):
+        """Return the distinct speaker ids (-1 when diarization was off)."""
+        return np.unique(self.speaker)
+
+    def by_speaker(self, speaker):
+        """Return the indices of one speaker's utterances."""
+        return np.flatnonzero(self.speaker == speaker)
+
+    def slice_time(self, start, end):
+        """Return the indices of utterances that overlap [start, end) seconds."""
+        return np.flatnonzero((self.end > start) & (self.start < end))
+
+    def search(self, query, speaker=None):
+        """Return the indices of utterances containing ``query`` (case-insensitive)."""
+        indices = range(len(self)) if speaker is None else self.by_speaker(speaker)
+        query = query.lower()
+        return np.array([i for i in indices if query in self.text_at(i).lower()], dtype=np.int64)
+
+    def _selected(self, indices):
+        return range(len(self)) if indices is None else indices
+
+    def to_timestamped_text(self, indices=None):
+        """Render "[hh:mm:ss] Speaker n: text" lines, for all or the given utterances."""
+        return "".join(
+            f"[{_format_timestamp(self.start[i])}] Speaker {self.speaker[i]}: {self.text_at(i)}\n"
+            for i in self._selected(indices)
+        )
+
+    def to_webvtt(self, indices=None):
+        """Render WebVTT captions with one cue per utterance and the speaker as the voice."""
+        cues = [
+            f"{_format_timestamp(self.start[i], millis=True)} --> "
+            f"{_format_timestamp(self.end[i], millis=True)}\n"
+            f"<v Speaker {self.speaker[i]}>{self.text_at(i)}\n"
+            for i in self._selected(indices)
+        ]
+        return "WEBVTT\n\n" + "\n".join(cues)
+
+    def save(self, path):
+        path = Path(path)
+        # Write through a file object so np.savez keeps the name as given
+        with open(path, "wb") as f:
+            np.savez(f, **{name: getattr(self, name) for name in self.__dataclass_fields__})
+        return path
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls(**{name: data[name] for name in data.files})
+
+
+def utterances_path_for(transcript_path):
+    """Return the diarized utterances artifact that sits next to a .txt transcript."""
+    transcript_path = Path(transcript_path)
+    return transcript_path.with_name(transcript_path.stem + UTTERANCES_SUFFIX)
+
+
+def load_utterances(transcript_path):
+    """
+    Load the diarized utterances for a transcript.
+
+    Args:
+        transcript_path: Path of the .txt transcript or of the .utterances.npz
+
+    Returns:
+        An UtteranceTable, or None if no utterances were saved
+    """
+    path = Path(transcript_path)
+    if not path.name.endswith(UTTERANCES_SUFFIX):
+        path = utterances_path_for(path)
+    if not path.exists():
+        return None
+    return UtteranceTable.load(path)
+
+
+def interim_path_for(transcript_path):
+    """Return the sidecar that holds a live transcript's current interim text."""
+    transcript_path = Path(transcript_path)
+    return transcript_path.with_name(transcript_path.stem + INTERIM_SUFFIX)
+
+
+class LiveTranscriptWriter:
+    """
+    Build a transcript while it is being streamed.
+
+    Final segments are appended to the .txt as they arrive, one per line,
+    so the transcript can be read (or summarized incrementally) during the
+    lecture. The latest interim text is kept in a sidecar file that is
+    replaced on every update and removed on close(), which also writes
+    the structured segments.
+    """
+
+    def __init__(self, transcript_path):
+        self.transcript_path = Path(transcript_path)
+        self.interim_path = interim_path_for(transcript_path)
+        self.segments = []
+        self.transcript_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.transcript_path, "w", encoding="utf-8")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def add_interim(self, text):
+        tmp_path = self.interim_path.with_name(self.interim_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp_path, self.interim_path)
+
+    def add_final(self, segment):
+        """Append a final Whisper-style segment dict; empty ones are dropped."""
+        if not segment.get("text", "").strip():
+            return
+        self.segments.append(segment)
+        self._file.write(segment["text"].strip() + "\n")
+        self._file.flush()
+
+    def close(self):
+        """
+        Finish the transcript.
+
+        Returns:
+            (transcript path, segments path)
+        """
+        if self._file.closed:
+            return self.transcript_path, segments_path_for(self.transcript_path)
+        self._file.close()
+        if self.interim_path.exists():
+            self.interim_path.unlink()
+        return write_transcript(self.transcript_path, self.segments)
@@ -0,0 +1,339 @@
+import os
+import json
+import time
+import asyncio
+from collections import Counter
+from dataclasses import dataclass, field
+from utils.circuit_breaker import CircuitBreaker, CLOSED, OPEN, HALF_OPEN
+from utils.rate_limit import backoff_delay
+from utils.error_handler import TranscriptionError, FileError, AudioDecodeError, logger
+from batch_transcribe import BatchReport, FileResult, collect_inputs
+from config import (
+    ROUTER_ENGINES,
+    ROUTER_TIMEOUTS,
+    ROUTER_RETRIES,
+    ROUTER_CONCURRENCY,
+    ROUTER_RETRY_BASE_SECONDS,
+    ROUTER_RETRY_MAX_SECONDS,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_RESET_SECONDS,
+    ROUTER_METRICS_DIR,
+)
+
+METRICS_NAME = "transcription_router"
+BREAKER_STATES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+@dataclass
+class Engine:
+    """A transcription backend as seen by the router."""
+
+    name: str
+    transcribe: object  # async callable: file path -> transcript path
+    timeout: float = None
+    retries: int = 0
+    concurrency: int = 1
+    breaker: CircuitBreaker = None
+    cancellable: bool = True  # False for work running in a thread
+
+    def __post_init__(self):
+        self.breaker = self.breaker or CircuitBreaker(
+            self.name, BREAKER_FAILURE_THRESHOLD, BREAKER_RESET_SECONDS
+        )
+        if self.timeout and not self.cancellable:
+            # Timing out would leave the work running while a retry or the
+            # next job starts another one
+            logger.warning(f"Ignoring the timeout of {self.name}: its work cannot be cancelled")
+            self.timeout = None
+        self._semaphore = None
+        self._loop = None
+
+    @property
+    def semaphore(self):
+        """The concurrency limit, created in the running event loop."""
+        # Before Python 3.10 a semaphore is bound to the loop that was current
+        # when it was created, so one made outside asyncio.run() breaks there
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+            self._loop = loop
+        return self._semaphore
+
+
+@dataclass
+class RouteResult:
+    transcript_path: str
+    engine: str
+    attempts: int
+
+
+@dataclass
+class RouterMetrics:
+    """Counters of routing decisions, keyed by (engine, event)."""
+
+    events: Counter = field(default_factory=Counter)
+    seconds: Counter = field(default_factory=Counter)
+
+    def record(self, engine, event, seconds=None):
+        self.events[(engine, event)] += 1
+        if seconds is not None:
+            self.seconds[engine] += seconds
+
+    def to_dict(self, engines=()):
+        names = sorted({name for name, _ in self.events} | {e.name for e in engines})
+        return {
+            name: {
+                "events": {ev: n for (en, ev), n in sorted(self.events.items()) if en == name},
+                "seconds": round(self.seconds[name], 3),
+                "breaker": next((e.breaker.state for e in engines if e.name == name), None),
+            }
+            for name in names
+        }
+
+    def to_prometheus(self, engines=()):
+        """Render the Prometheus text exposition format (for a textfile collector)."""
+        lines = [
+            f"# HELP {METRICS_NAME}_events_total Routing decisions by engine and event",
+            f"# TYPE {METRICS_NAME}_events_total counter",
+        ]
+        for (engine, event), count in sorted(self.events.items()):
+            lines.append(
+                f'{METRICS_NAME}_events_total{{engine="{engine}",event="{event}"}} {count}'
+            )
+        lines += [
+            f"# HELP {METRICS_NAME}_seconds_total Time spent in successful and failed attempts",
+            f"# TYPE {METRICS_NAME}_seconds_total counter",
+        ]
+        for engine, seconds in sorted(self.seconds.items()):
+            lines.append(f'{METRICS_NAME}_seconds_total{{engine="{engine}"}} {seconds:.3f}')
+        lines += [
+            f"# HELP {METRICS_NAME}_breaker_state Circuit breaker state (0 closed, 1 half-open, "
+            "2 open)",
+            f"# TYPE {METRICS_NAME}_breaker_state gauge",
+        ]
+        for engine in engines:
+            lines.append(
+                f'{METRICS_NAME}_breaker_state{{engine="{engine.name}"}} '
+                f"{BREAKER_STATES[engine.breaker.state]}"
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, directory=None, engines=()):
+        """Write <directory>/transcription_router.prom and .json atomically."""
+        directory = directory or ROUTER_METRICS_DIR
+        os.makedirs(directory, exist_ok=True)
+        for suffix, text in (
+            (".prom", self.to_prometheus(engines)),
+            (".json", json.dumps(self.to_dict(engines), indent=2)),
+        ):
+            path = os.path.join(directory, METRICS_NAME + suffix)
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(path + ".tmp", path)
+
+
+def _error_chain(error):
+    # Engines wrap the errors they raise, so the cause may be a few links down
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        yield error
+        error = error.__cause__ or error.__context__
+
+
+def is_input_error(error):
+    """Return True if the file itself is missing, unreadable or undecodable."""
+    return any(isinstance(e, (FileError, AudioDecodeError)) for e in _error_chain(error))
+
+
+def is_engine_failure(error):
+    """
+    Return True if ``error`` says the engine is unhealthy.
+
+    Rate limiting (429) and server errors (5xx) count, as do transport
+    errors that carry no HTTP status. Other 4xx responses reject this
+    request, not the engine, so they don't.
+    """
+    for e in _error_chain(error):
+        status = getattr(e, "status_code", None)
+        if status is None:
+            status = getattr(getattr(e, "response", None), "status_code", None)
+        if status is not None:
+            return status == 429 or status >= 500
+    return True
+
+
+def default_engines(names=None):
+    """Build the configured engines; their modules are imported only when used."""
+    async def deepgram(path):
+        from api.deepgram_transcribe import transcribe_with_deepgram
+        return await transcribe_with_deepgram(path)
+
+    async def whisper(path):
+        from transcribe import transcribe
+        return await asyncio.to_thread(transcribe, path)
+
+    backends = {"deepgram": deepgram, "whisper": whisper}
+    return [
+        Engine(
+            name,
+            backends[name],
+            timeout=ROUTER_TIMEOUTS.get(name),
+            retries=ROUTER_RETRIES.get(name, 0),
+            concurrency=ROUTER_CONCURRENCY.get(name, 1),
+            cancellable=name != "whisper",
+        )
+        for name in (names or ROUTER_ENGINES)
+    ]
+
+
+class TranscriptionRouter:
+    """
+    Send each transcription to the first healthy engine, falling back down the list.
+
+    Every attempt is bounded by the engine's timeout and failed attempts
+    are retried with jittered exponential backoff. Each engine has a
+    circuit breaker: after repeated failures it is skipped outright for a
+    while, so jobs go straight to the fallback (local Whisper by default)
+    instead of waiting on a remote engine that is down. Only timeouts,
+    transport errors and 429/5xx responses count towards opening it; a
+    missing or undecodable file is re-raised without touching any
+    breaker. Routing decisions are counted in ``metrics``.
+    """
+
+    def __init__(self, engines=None, metrics=None, retry_base=ROUTER_RETRY_BASE_SECONDS,
+                 retry_max=ROUTER_RETRY_MAX_SECONDS, sleep=asyncio.sleep):
+        self.engines = engines or default_engines()
+        self.metrics = metrics or RouterMetrics()
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.sleep = sleep
+
+    async def _attempt(self, engine, file_path):
+        if engine.timeout:
+            return await asyncio.wait_for(engine.transcribe(file_path), engine.timeout)
+        return await engine.transcribe(file_path)
+
+    async def route(self, file_path):
+        """
+        Transcribe one file.
+
+        Returns:
+            A RouteResult naming the engine that produced the transcript
+
+        Raises:
+            FileError: If the file does not exist
+            TranscriptionError: If every engine failed or was unavailable, or
+                as raised by an engine that could not read or decode the file
+        """
+        if not os.path.exists(file_path):
+            raise FileError(f"File not found: {file_path}")
+
+        attempts = 0
+        errors = []
+        for position, engine in enumerate(self.engines):
+            if position:
+                self.metrics.record(engine.name, "fallback")
+            for retry in range(engine.retries + 1):
+                async with engine.semaphore:
+                    # Checked once a slot is free, so queued jobs see a breaker
+                    # that opened while they were waiting
+                    if not engine.breaker.allow():
+                        self.metrics.record(engine.name, "rejected")
+                        errors.append(f"{engine.name}: circuit open")
+                        break
+                    trial = engine.breaker.trial_in_flight
+                    if retry:
+                        self.metrics.record(engine.name, "retry")
+                    attempts += 1
+                    start = time.perf_counter()
+                    try:
+                        transcript_path = await self._attempt(engine, file_path)
+                    except asyncio.TimeoutError:
+                        outcome, error, counted = (
+                            "timeout", f"timed out after {engine.timeout}s", True
+                        )
+                    except Exception as e:
+                        if is_input_error(e):
+                            # A bad file fails on every engine and says nothing
+                            # about this one's health
+                            if trial:
+                                engine.breaker.release_trial()
+                            self.metrics.record(engine.name, "bad_input",
+                                                time.perf_counter() - start)
+                            raise
+                        outcome, error, counted = "failure", str(e), is_engine_failure(e)
+                    except BaseException:
+                        # A cancelled trial settles nothing; free it for the next job
+                        if trial:
+                            engine.breaker.release_trial()
+                        raise
+                    else:
+                        engine.breaker.record_success()
+                        self.metrics.record(engine.name, "success", time.perf_counter() - start)
+                        return RouteResult(str(transcript_path), engine.name, attempts)
+
+                    if counted:
+                        engine.breaker.record_failure()
+                    elif trial:
+                        engine.breaker.release_trial()
+                    self.metrics.record(engine.name, outcome, time.perf_counter() - start)
+                errors.append(f"{engine.name}: {error}")
+                logger.warning(f"{engine.name} failed on {file_path}: {error}")
+                if not counted:
+                    # The request was rejected; sending it again won't help
+                    break
+                if retry < engine.retries:
+                    # Back off outside the semaphore so other jobs can proceed
+                    await self.sleep(backoff_delay(retry, self.retry_base, self.retry_max))
+
+        raise TranscriptionError(
+            f"All transcription engines failed for {file_path}: " + "; ".join(errors)
+        )
+
+    async def route_many(self, paths):
+        """
+        Transcribe many files; each engine's concurrency limit applies across them.
+
+        Returns:
+            A BatchReport; each result names the engine that served it
+        """
+        report = BatchReport(workers=sum(e.concurrency for e in self.engines))
+
+        async def route_one(path):
+            start = time.perf_counter()
+            try:
+                result = await self.route(path)
+                return FileResult(path, "ok", result.transcript_path,
+                                  seconds=time.perf_counter() - start, engine=result.engine)
+            except Exception as e:
+                return FileResult(path, "failed", error=str(e), seconds=time.perf_counter() - start)
+
+        start = time.perf_counter()
+        for finished in asyncio.as_completed([route_one(path) for path in paths]):
+            result = await finished
+            report.results.append(result)
+            logger.info(
+                f"[{len(report.results)}/{len(paths)}] {result.path}: {result.status}"
+                + (f" via {result.engine}" if result.engine else "")
+            )
+        report.wall_seconds = time.perf_counter() - start
+        return report
+
+
+def transcribe_auto(source, engines=None, metrics_dir=None):
+    """
+    Transcribe a file, directory, glob or manifest through the router.
+
+    Routing metrics are written to ``metrics_dir`` (default:
+    ROUTER_METRICS_DIR) when the run ends.
+
+    Returns:
+        A BatchReport
+    """
+    paths = collect_inputs(source)
+    router = TranscriptionRouter(engines)
+    try:
+        return asyncio.run(router.route_many(paths))
+    finally:
+        router.metrics.write(metrics_dir, router.engines)
@@ -0,0 +1,73 @@
+import time
+import threading
+from utils.error_handler import logger
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Stops sending work to a backend that keeps failing.
+
+    While closed, calls pass and ``failure_threshold`` consecutive
+    failures open the breaker. While open, calls are refused until
+    ``reset_seconds`` have passed; then a single trial call is let
+    through (half-open). Its success closes the breaker, its failure
+    opens it for another ``reset_seconds``.
+    """
+
+    def __init__(self, name, failure_threshold=5, reset_seconds=60.0, clock=time.monotonic):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.clock = clock
+        self.failures = 0
+        self.opened_at = None
+        self.trial_in_flight = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return CLOSED
+        if self.clock() - self.opened_at >= self.reset_seconds:
+            return HALF_OPEN
+        return OPEN
+
+    def allow(self):
+        """Return True if a call may be made now."""
+        with self._lock:
+            state = self.state
+            if state == CLOSED:
+                return True
+            if state == HALF_OPEN and not self.trial_in_flight:
+                self.trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                self.opened_at = None
+                logger.info(f"Circuit breaker for {self.name} closed")
+            self.failures = 0
+            self.trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            was_trial = self.trial_in_flight
+            self.trial_in_flight = False
+            if was_trial or (self.opened_at is None and self.failures >= self.failure_threshold):
+                self.opened_at = self.clock()
+                logger.warning(
+                    f"Circuit breaker for {self.name} opened after {self.failures} failure(s); "
+                    f"retrying in {self.reset_seconds:.0f}s"
+                )
+
+    def release_trial(self):
+        """End a half-open trial that neither succeeded nor failed (e.g. it was cancelled)."""
+        with self._lock:
+            self.trial_in_flight = False
@@ -0,0 +1,175 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+from pathlib import Path
+
+COMPLETE_MARKER = ".complete"
+
+
+def hash_file(path, chunk_size=1024 * 1024):
+    """
+    Compute the SHA-256 of a file without reading it into memory at once.
+
+    Args:
+        path: Path to the file
+        chunk_size: Bytes read per iteration
+
+    Returns:
+        Hex digest string
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(chunk_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_text(text):
+    """Return the SHA-256 hex digest of a string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def make_key(*parts, **options):
+    """
+    Build a cache key from positional parts and keyword options.
+
+    Options are serialized with sorted keys, so the same options always
+    produce the same key regardless of the order they were given in.
+    """
+    payload = json.dumps([parts, options], sort_keys=True, default=str)
+    return hash_text(payload)
+
+
+class DiskCache:
+    """
+    A content-addressed on-disk cache of small file bundles.
+
+    Every entry is a directory holding one or more named files. Entries are
+    written to a temporary directory and renamed into place, so readers
+    never see a half-written entry. Reads refresh an entry's modification
+    time, which is what least-recently-used eviction is based on.
+    """
+
+    def __init__(self, directory, max_bytes=None, max_age_seconds=None):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def path_for(self, key):
+        return self.directory / key[:2] / key
+
+    def _is_expired(self, entry):
+        if not self.max_age_seconds:
+            return False
+        return time.time() - entry.stat().st_mtime > self.max_age_seconds
+
+    def get(self, key):
+        """
+        Look up an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Path to the entry directory, or None on a miss
+        """
+        entry = self.path_for(key)
+        try:
+            if (entry / COMPLETE_MARKER).exists() and not self._is_expired(entry):
+                os.utime(entry)
+                with self._lock:
+                    self.hits += 1
+                return entry
+        except OSError:
+            pass
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, key, files):
+        """
+        Store an entry.
+
+        Args:
+            key: Cache key
+            files: Mapping of file name to str, bytes or a path to copy
+
+        Returns:
+            Path to the entry directory
+        """
+        entry = self.path_for(key)
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(dir=entry.parent, prefix=".tmp-"))
+        try:
+            for name, content in files.items():
+                target = staging / name
+                if isinstance(content, bytes):
+                    target.write_bytes(content)
+                elif isinstance(content, str):
+                    target.write_text(content, encoding="utf-8")
+                else:
+                    shutil.copyfile(content, target)
+            (staging / COMPLETE_MARKER).touch()
+            if entry.exists():
+                shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)
+            if not (entry / COMPLETE_MARKER).exists():
+                raise
+        self.evict()
+        return entry
+
+    def entries(self):
+        """Return (path, size_bytes, mtime) for every complete entry."""
+        result = []
+        if not self.directory.exists():
+            return result
+        for shard in self.directory.iterdir():
+            if not shard.is_dir():
+                continue
+            for entry in shard.iterdir():
+                if entry.name.startswith(".tmp-") or not (entry / COMPLETE_MARKER).exists():
+                    continue
+                try:
+                    size = sum(f.stat().st_size for f in entry.iterdir())
+                    result.append((entry, size, entry.stat().st_mtime))
+                except OSError:
+                    continue
+        return result
+
+    def size_bytes(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        """
+        Remove expired entries, then the least recently used ones until the
+        cache fits in max_bytes.
+
+        Returns:
+            The number of entries removed
+        """
+        entries = sorted(self.entries(), key=lambda e: e[2])
+        removed = 0
+        total = sum(size for _, size, _ in entries)
+        now = time.time()
+        for entry, size, mtime in entries:
+            expired = self.max_age_seconds and now - mtime > self.max_age_seconds
+            oversized = self.max_bytes is not None and total > self.max_bytes
+            if not (expired or oversized):
+                continue
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses}
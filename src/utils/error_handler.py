@@ -56,10 +56,17 @@ class RecordingError(LecturaError):
     """Exception raised for recording errors."""
     pass
 
-class APIError(LecturaError):
-    """Exception raised for API errors."""
+class AudioDecodeError(TranscriptionError):
+    """Exception raised when ffmpeg cannot decode an input file."""
     pass
 
+class APIError(LecturaError):
+    """Exception raised for API errors; ``status_code`` is the HTTP status, if any."""
+
+    def __init__(self, message, status_code=None):
+        super().__init__(message)
+        self.status_code = status_code
+
 class FileError(LecturaError):
     """Exception raised for file-related errors."""
     pass
@@ -0,0 +1,85 @@
+import time
+import random
+import asyncio
+
+
+class TokenBucket:
+    """
+    Asyncio token bucket refilled continuously at a per-minute rate.
+
+    The bucket starts full, so up to ``capacity`` can be spent in a burst;
+    after that callers wait for the refill.
+    """
+
+    def __init__(self, rate_per_minute, capacity=None, clock=time.monotonic, sleep=asyncio.sleep):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self.tokens = float(self.capacity)
+        self.clock = clock
+        self.sleep = sleep
+        self.updated = clock()
+        self._lock = None
+        self._loop = None
+
+    @property
+    def lock(self):
+        """Serializes waiters; created in the running event loop."""
+        # Before Python 3.10 a lock is bound to the loop that was current
+        # when it was created, so one made outside asyncio.run() breaks there
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._lock = asyncio.Lock()
+            self._loop = loop
+        return self._lock
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount=1):
+        """
+        Wait until ``amount`` tokens are available and take them.
+
+        Waiters are served in arrival order. A request larger than the
+        whole bucket is clamped to its capacity so it can still proceed.
+        """
+        amount = min(amount, self.capacity)
+        async with self.lock:
+            while True:
+                self._refill()
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await self.sleep((amount - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budgets enforced together."""
+
+    def __init__(self, requests_per_minute, tokens_per_minute=None, clock=time.monotonic,
+                 sleep=asyncio.sleep):
+        self.requests = TokenBucket(requests_per_minute, clock=clock, sleep=sleep)
+        self.tokens = (
+            TokenBucket(tokens_per_minute, clock=clock, sleep=sleep) if tokens_per_minute else None
+        )
+
+    async def acquire(self, tokens=0):
+        await self.requests.acquire(1)
+        if self.tokens is not None and tokens:
+            await self.tokens.acquire(tokens)
+
+
+def backoff_delay(attempt, base=1.0, maximum=60.0, retry_after=None):
+    """
+    Return how long to wait before retry number ``attempt`` (0-based).
+
+    Uses "full jitter" exponential backoff, a uniform delay between zero
+    and ``base * 2**attempt`` capped at ``maximum``, so clients that failed
+    together do not retry together. A server-supplied ``retry_after`` is
+    treated as a lower bound.
+    """
+    delay = random.uniform(0, min(maximum, base * 2 ** attempt))
+    if retry_after is not None:
+        delay = max(delay, retry_after)
+    return delay
@@ -0,0 +1,63 @@
+import numpy as np
+
+# Rough (F1, F2) formant pairs for a handful of vowels, in Hz
+VOWEL_FORMANTS = [(730, 1090), (270, 2290), (530, 1840), (570, 840), (300, 870), (660, 1720)]
+
+
+def _syllable(duration, sr, f0, formants, rng):
+    n = int(duration * sr)
+    t = np.arange(n) / sr
+    # Slight pitch glide within the syllable, like natural intonation
+    pitch = f0 * (1.0 + 0.08 * np.linspace(-1, 1, n) * rng.choice([-1, 1]))
+    phase = 2 * np.pi * np.cumsum(pitch) / sr
+    harmonics = np.arange(1, int(3800 // f0) + 1)
+    gains = np.zeros(len(harmonics))
+    for formant in formants:
+        gains += np.exp(-0.5 * ((harmonics * f0 - formant) / 120.0) ** 2)
+    gains = gains / (harmonics ** 0.5) + 0.02
+    voiced = np.sin(np.outer(phase, harmonics)) @ gains
+    # Attack/decay envelope so syllables have onsets like speech
+    envelope = np.sin(np.pi * np.minimum(t / duration, 1.0)) ** 0.6
+    return voiced * envelope
+
+
+def synthetic_speech(seconds, sr=16000, seed=0, pause_ratio=0.15):
+    """
+    Generate deterministic speech-like audio.
+
+    The signal is a sequence of voiced "syllables" (harmonic series shaped
+    by vowel formants, with pitch glides and attack/decay envelopes)
+    grouped into phrases separated by pauses. It is not intelligible, but
+    it has the energy, spectrum and rhythm of speech, which is what VAD,
+    decoding and model throughput measurements depend on.
+
+    Args:
+        seconds: Length of the output
+        sr: Sample rate
+        seed: Random seed; the same seed always yields the same samples
+        pause_ratio: Rough fraction of the output that is silence
+
+    Returns:
+        1-D float32 array in [-1, 1]
+    """
+    rng = np.random.default_rng(seed)
+    total = int(seconds * sr)
+    out = np.zeros(total, dtype=np.float64)
+    position = 0
+    speaker_f0 = rng.uniform(100, 210)
+
+    while position < total:
+        phrase_end = position + int(rng.uniform(1.5, 4.5) * sr)
+        while position < min(phrase_end, total):
+            duration = rng.uniform(0.12, 0.32)
+            f0 = speaker_f0 * rng.uniform(0.9, 1.15)
+            formants = VOWEL_FORMANTS[rng.integers(len(VOWEL_FORMANTS))]
+            syllable = _syllable(duration, sr, f0, formants, rng)
+            syllable = syllable[: total - position]
+            out[position:position + len(syllable)] += syllable * rng.uniform(0.5, 1.0)
+            position += len(syllable) + int(rng.uniform(0.01, 0.06) * sr)
+        position += int(rng.exponential(pause_ratio * 4.0) * sr)
+
+    out += rng.standard_normal(total) * 1e-3
+    peak = np.max(np.abs(out)) or 1.0
+    return (0.5 * out / peak).astype(np.float32)
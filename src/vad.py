@@ -0,0 +1,207 @@
+from dataclasses import dataclass, field
+import numpy as np
+from audio import SAMPLE_RATE
+from config import (
+    VAD_FRAME_MS,
+    VAD_MARGIN_DB,
+    VAD_MIN_SPEECH_MS,
+    VAD_MIN_SILENCE_MS,
+    VAD_PAD_MS,
+)
+
+# Absolute floor: anything quieter than this is never treated as speech
+MIN_SPEECH_DB = -55.0
+# Frames that are both noisy (high zero-crossing rate) and only just above
+# the threshold are treated as hiss rather than speech
+MAX_SPEECH_ZCR = 0.35
+ZCR_ENERGY_SLACK_DB = 6.0
+
+
+@dataclass
+class SpeechRegion:
+    start: int  # First sample of the region
+    end: int  # One past the last sample
+
+    @property
+    def length(self):
+        return self.end - self.start
+
+
+@dataclass
+class VADResult:
+    regions: list = field(default_factory=list)
+    total_samples: int = 0
+    sr: int = SAMPLE_RATE
+
+    @property
+    def speech_samples(self):
+        return sum(r.length for r in self.regions)
+
+    @property
+    def speech_ratio(self):
+        """Fraction of the recording classified as speech."""
+        if self.total_samples == 0:
+            return 0.0
+        return self.speech_samples / self.total_samples
+
+    def metrics(self):
+        return {
+            "speech_ratio": round(self.speech_ratio, 4),
+            "speech_seconds": round(self.speech_samples / self.sr, 2),
+            "total_seconds": round(self.total_samples / self.sr, 2),
+            "regions": len(self.regions),
+        }
+
+
+def frame_features(audio, frame_len):
+    """
+    Compute per-frame energy (dBFS) and zero-crossing rate.
+
+    Frames are non-overlapping; a trailing partial frame is ignored.
+
+    Args:
+        audio: 1-D float32 array
+        frame_len: Frame length in samples
+
+    Returns:
+        (energy_db, zcr) arrays with one value per frame
+    """
+    n_frames = len(audio) // frame_len
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.float32), np.zeros(0, dtype=np.float32)
+    frames = audio[: n_frames * frame_len].reshape(n_frames, frame_len)
+    rms = np.sqrt(np.mean(np.square(frames, dtype=np.float32), axis=1))
+    energy_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+    signs = np.signbit(frames)
+    zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / float(frame_len - 1)
+    return energy_db.astype(np.float32), zcr.astype(np.float32)
+
+
+def _runs(mask):
+    """Return (start, end) index pairs of consecutive True runs in a boolean array."""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(padded[1:] != padded[:-1])
+    return edges.reshape(-1, 2)
+
+
+def detect_speech(audio, sr=SAMPLE_RATE, frame_ms=VAD_FRAME_MS, margin_db=VAD_MARGIN_DB,
+                  min_speech_ms=VAD_MIN_SPEECH_MS, min_silence_ms=VAD_MIN_SILENCE_MS,
+                  pad_ms=VAD_PAD_MS):
+    """
+    Find the speech regions of a recording with an energy/zero-crossing VAD.
+
+    The threshold adapts to the recording: it sits ``margin_db`` above the
+    estimated noise floor (10th percentile of frame energy), but never
+    more than ``margin_db`` below the loud end (99th percentile), so
+    recordings with little silence are not discarded wholesale.
+
+    Args:
+        audio: 1-D float32 array
+        sr: Sample rate of ``audio``
+        frame_ms: Analysis frame length
+        margin_db: How far above the noise floor speech must be
+        min_speech_ms: Shorter bursts are dropped
+        min_silence_ms: Shorter pauses are bridged
+        pad_ms: Context kept on both sides of every region
+
+    Returns:
+        A VADResult
+    """
+    frame_len = max(1, int(sr * frame_ms / 1000))
+    energy_db, zcr = frame_features(audio, frame_len)
+    result = VADResult(total_samples=len(audio), sr=sr)
+    if len(energy_db) == 0:
+        return result
+
+    noise_floor, loud = np.percentile(energy_db, [10, 99])
+    threshold = max(min(noise_floor + margin_db, loud - margin_db), MIN_SPEECH_DB)
+    speech = energy_db > threshold
+    hiss = (zcr > MAX_SPEECH_ZCR) & (energy_db < threshold + ZCR_ENERGY_SLACK_DB)
+    speech &= ~hiss
+
+    runs = _runs(speech)
+    if len(runs) == 0:
+        return result
+
+    # Bridge short pauses, then drop short bursts
+    min_gap = int(np.ceil(min_silence_ms / frame_ms))
+    merged = [list(runs[0])]
+    for start, end in runs[1:]:
+        if start - merged[-1][1] < min_gap:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+    min_len = int(np.ceil(min_speech_ms / frame_ms))
+    pad = int(sr * pad_ms / 1000)
+
+    for start, end in merged:
+        if end - start < min_len:
+            continue
+        s = max(0, int(start) * frame_len - pad)
+        e = min(len(audio), int(end) * frame_len + pad)
+        if result.regions and s <= result.regions[-1].end:
+            result.regions[-1].end = e
+        else:
+            result.regions.append(SpeechRegion(s, e))
+    return result
+
+
+class TimeMap:
+    """Maps times in compacted (speech-only) audio back to the original recording."""
+
+    def __init__(self, compact_starts, original_starts, lengths):
+        self.compact_starts = np.asarray(compact_starts, dtype=np.float64)
+        self.original_starts = np.asarray(original_starts, dtype=np.float64)
+        self.lengths = np.asarray(lengths, dtype=np.float64)
+
+    def to_original(self, t):
+        """Convert a time (seconds) in the compacted audio to the original timeline."""
+        if len(self.compact_starts) == 0:
+            return float(t)
+        idx = int(np.searchsorted(self.compact_starts, t, side="right")) - 1
+        idx = max(idx, 0)
+        offset = min(max(t - self.compact_starts[idx], 0.0), self.lengths[idx])
+        return float(self.original_starts[idx] + offset)
+
+
+def compact(audio, vad_result, gap_ms=300):
+    """
+    Concatenate the speech regions of a recording.
+
+    A short stretch of silence is kept between regions so the model still
+    sees a boundary there.
+
+    Args:
+        audio: 1-D float32 array
+        vad_result: Output of detect_speech
+        gap_ms: Silence inserted between regions
+
+    Returns:
+        (compacted audio, TimeMap)
+    """
+    sr = vad_result.sr
+    gap = np.zeros(int(sr * gap_ms / 1000), dtype=audio.dtype)
+    pieces, compact_starts, original_starts, lengths = [], [], [], []
+    position = 0
+    for i, region in enumerate(vad_result.regions):
+        if i:
+            pieces.append(gap)
+            position += len(gap)
+        pieces.append(audio[region.start:region.end])
+        compact_starts.append(position / sr)
+        original_starts.append(region.start / sr)
+        lengths.append(region.length / sr)
+        position += region.length
+    compacted = np.concatenate(pieces) if pieces else audio[:0]
+    return compacted, TimeMap(compact_starts, original_starts, lengths)
+
+
+def remap_segments(segments, time_map):
+    """Rewrite Whisper segment (and word) timestamps onto the original timeline."""
+    for segment in segments:
+        segment["start"] = time_map.to_original(segment["start"])
+        segment["end"] = time_map.to_original(segment["end"])
+        for word in segment.get("words", []):
+            word["start"] = time_map.to_original(word["start"])
+            word["end"] = time_map.to_original(word["end"])
+    return segments
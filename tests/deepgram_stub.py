@@ -0,0 +1,128 @@
+import json
+import threading
+from contextlib import contextmanager, asynccontextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class StubState:
+    def __init__(self, status):
+        self.status = status
+        self.requests = []
+
+
+def _read_body(handler):
+    if handler.headers.get("Transfer-Encoding", "").lower() != "chunked":
+        return handler.rfile.read(int(handler.headers.get("Content-Length", 0)))
+    body = b""
+    while True:
+        size = int(handler.rfile.readline().split(b";")[0], 16)
+        if size == 0:
+            handler.rfile.readline()
+            return body
+        body += handler.rfile.read(size)
+        handler.rfile.readline()
+
+
+def _handler(state):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = _read_body(self)
+            state.requests.append({
+                "path": urlparse(self.path).path,
+                "query": parse_qs(urlparse(self.path).query),
+                "headers": dict(self.headers),
+                "body": body,
+            })
+            payload = json.dumps({"results": {"channels": [{"alternatives": [
+                {"transcript": f"received {len(body)} bytes"}
+            ]}]}}).encode()
+            self.send_response(state.status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args):
+            pass
+
+    return Handler
+
+
+@contextmanager
+def deepgram_stub(status=200):
+    """
+    Serve a minimal Deepgram prerecorded endpoint on localhost.
+
+    Request bodies may be chunked; the yielded state records each
+    request's path, query, headers and decoded body.
+    """
+    state = StubState(status)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        state.url = f"http://127.0.0.1:{server.server_address[1]}/v1/listen"
+        yield state
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class LiveStubState:
+    def __init__(self):
+        self.path = None
+        self.headers = {}
+        self.audio = b""
+        self.closed_by_client = False
+
+
+@asynccontextmanager
+async def deepgram_live_stub(bytes_per_result):
+    """
+    Serve a minimal Deepgram streaming endpoint on localhost.
+
+    Each ``bytes_per_result`` bytes of audio produce an interim and then a
+    final "Results" message; CloseStream flushes the rest and closes.
+    """
+    from websockets.asyncio.server import serve
+
+    state = LiveStubState()
+
+    def results(index, is_final, seconds):
+        return json.dumps({
+            "type": "Results",
+            "start": float(index) * seconds,
+            "duration": seconds,
+            "is_final": is_final,
+            "channel": {"alternatives": [
+                {"transcript": f"words {index}" + ("" if is_final else " ..."),
+                 "confidence": 0.9}
+            ]},
+        })
+
+    async def handler(ws):
+        state.path = ws.request.path
+        state.headers = dict(ws.request.headers)
+        seconds = bytes_per_result / (2 * 16000)
+        sent = 0
+        async for message in ws:
+            if isinstance(message, bytes):
+                state.audio += message
+                while len(state.audio) >= (sent + 1) * bytes_per_result:
+                    await ws.send(results(sent, False, seconds))
+                    await ws.send(results(sent, True, seconds))
+                    sent += 1
+            elif json.loads(message).get("type") == "CloseStream":
+                state.closed_by_client = True
+                if len(state.audio) > sent * bytes_per_result:
+                    await ws.send(results(sent, True, seconds))
+                await ws.send(json.dumps({"type": "Metadata"}))
+                await ws.close()
+
+    async with serve(handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        state.url = f"ws://127.0.0.1:{port}/v1/listen"
+        yield state
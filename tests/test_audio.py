@@ -0,0 +1,74 @@
+import shutil
+import wave
+import numpy as np
+import pytest
+from audio import SAMPLE_RATE, iter_audio_chunks, load_audio, pcm16_to_float32, probe_duration
+
+requires_ffmpeg = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg not installed")
+requires_ffprobe = pytest.mark.skipif(
+    shutil.which("ffprobe") is None, reason="ffprobe not installed"
+)
+
+
+def write_wav(path, samples, sr=SAMPLE_RATE):
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(sr)
+        w.writeframes(samples.astype("<i2").tobytes())
+
+
+def test_pcm16_to_float32():
+    """Test that s16le bytes map to float32 samples in [-1, 1)."""
+    data = np.array([0, 16384, -32768, 32767], dtype="<i2").tobytes()
+    samples = pcm16_to_float32(data)
+
+    assert samples.dtype == np.float32
+    np.testing.assert_allclose(samples, [0.0, 0.5, -1.0, 32767 / 32768])
+
+
+def test_pcm16_to_float32_ignores_trailing_odd_byte():
+    """Test that a partial trailing sample from a pipe read is dropped."""
+    data = np.array([100, 200], dtype="<i2").tobytes() + b"\x01"
+    assert len(pcm16_to_float32(data)) == 2
+
+
+@requires_ffmpeg
+def test_load_audio_resamples_without_temp_files(tmp_path):
+    """Test that a 44.1 kHz WAV decodes to a 16 kHz array and leaves no files behind."""
+    tone = (np.sin(np.arange(44100) * 2 * np.pi * 440 / 44100) * 10000).astype(np.int16)
+    source = tmp_path / "tone.wav"
+    write_wav(source, tone, sr=44100)
+
+    audio = load_audio(source)
+
+    assert audio.dtype == np.float32
+    assert abs(len(audio) - SAMPLE_RATE) < 100
+    assert list(tmp_path.iterdir()) == [source]
+
+
+@requires_ffmpeg
+def test_iter_audio_chunks(tmp_path):
+    """Test that streaming decode yields fixed-size chunks covering the file."""
+    source = tmp_path / "silence.wav"
+    write_wav(source, np.zeros(SAMPLE_RATE * 5, dtype=np.int16))
+
+    chunks = list(iter_audio_chunks(source, chunk_seconds=2))
+
+    assert [len(c) for c in chunks] == [2 * SAMPLE_RATE, 2 * SAMPLE_RATE, SAMPLE_RATE]
+
+
+@requires_ffprobe
+def test_probe_duration(tmp_path):
+    """Test that the duration is read from the file header."""
+    source = tmp_path / "silence.wav"
+    write_wav(source, np.zeros(SAMPLE_RATE * 3, dtype=np.int16))
+    assert probe_duration(source) == pytest.approx(3.0, abs=0.01)
+
+
+def test_probe_duration_without_ffprobe(tmp_path, monkeypatch):
+    """Test that a missing ffprobe reports an unknown duration instead of failing."""
+    import audio
+
+    monkeypatch.setattr(audio.shutil, "which", lambda name: None)
+    assert probe_duration(tmp_path / "lecture.wav") is None
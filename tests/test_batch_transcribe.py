@@ -0,0 +1,110 @@
+import json
+import pytest
+import batch_transcribe
+from batch_transcribe import BatchReport, FileResult, collect_inputs, transcribe_batch
+from utils.error_handler import FileError
+
+
+def touch(path):
+    path.write_bytes(b"")
+    return path
+
+
+def test_collect_inputs_from_directory(tmp_path):
+    """Test that a directory yields only audio files, sorted."""
+    touch(tmp_path / "b.mp3")
+    touch(tmp_path / "a.WAV")
+    touch(tmp_path / "notes.txt")
+
+    paths = collect_inputs(str(tmp_path))
+    assert [p.rsplit("/", 1)[-1] for p in paths] == ["a.WAV", "b.mp3"]
+
+
+def test_collect_inputs_from_glob(tmp_path):
+    """Test that a glob pattern is expanded."""
+    touch(tmp_path / "one.m4a")
+    touch(tmp_path / "two.m4a")
+    touch(tmp_path / "three.mp3")
+
+    assert len(collect_inputs(str(tmp_path / "*.m4a"))) == 2
+
+
+def test_collect_inputs_from_manifests(tmp_path):
+    """Test that txt, csv and jsonl manifests resolve paths relative to the manifest."""
+    (tmp_path / "list.txt").write_text("# lectures\nweek1.mp3\n\nweek2.mp3\n")
+    (tmp_path / "list.csv").write_text("path,title\nweek1.mp3,Intro\n")
+    (tmp_path / "list.jsonl").write_text(json.dumps({"path": "/abs/week3.wav"}) + "\n")
+
+    assert collect_inputs(str(tmp_path / "list.txt")) == [
+        str(tmp_path / "week1.mp3"),
+        str(tmp_path / "week2.mp3"),
+    ]
+    assert collect_inputs(str(tmp_path / "list.csv")) == [str(tmp_path / "week1.mp3")]
+    assert collect_inputs(str(tmp_path / "list.jsonl")) == ["/abs/week3.wav"]
+
+
+def test_collect_inputs_empty(tmp_path):
+    """Test that an empty source raises a FileError."""
+    with pytest.raises(FileError):
+        collect_inputs(str(tmp_path))
+
+
+def test_transcribe_batch_reports_failures(tmp_path, monkeypatch):
+    """Test that the report captures per-file status with a single worker."""
+    touch(tmp_path / "good.mp3")
+    touch(tmp_path / "bad.mp3")
+
+    def fake_transcribe_one(path, model_name):
+        if path.endswith("bad.mp3"):
+            return FileResult(path, "failed", error="corrupt audio")
+        return FileResult(path, "ok", transcript_path=path + ".txt")
+
+    monkeypatch.setattr(batch_transcribe, "_transcribe_one", fake_transcribe_one)
+    report = transcribe_batch(str(tmp_path), workers=1)
+
+    assert len(report.succeeded) == 1
+    assert [r.error for r in report.failed] == ["corrupt audio"]
+    assert "1/2 files transcribed" in report.format()
+
+
+def test_worker_pool_uses_one_preloaded_model(tmp_path, monkeypatch):
+    """Test that pool workers are given the configured model instead of auto-selecting."""
+    from concurrent.futures import Future
+
+    for name in ("a.mp3", "b.mp3"):
+        touch(tmp_path / name)
+    pools = []
+
+    class InlinePool:
+        def __init__(self, max_workers, initializer, initargs):
+            pools.append(initargs)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            return False
+
+        def submit(self, fn, *args):
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+    models = []
+
+    def fake_transcribe_one(path, model_name):
+        models.append(model_name)
+        return FileResult(path, "ok", transcript_path=path + ".txt")
+
+    monkeypatch.setattr(batch_transcribe, "ProcessPoolExecutor", InlinePool)
+    monkeypatch.setattr(batch_transcribe, "_transcribe_one", fake_transcribe_one)
+    transcribe_batch(str(tmp_path), workers=2)
+
+    assert pools[0][0] == batch_transcribe.WHISPER_MODEL
+    assert models == [batch_transcribe.WHISPER_MODEL] * 2
+
+
+def test_files_per_minute():
+    """Test the throughput calculation."""
+    report = BatchReport(results=[FileResult("a", "ok")] * 4, wall_seconds=120)
+    assert report.files_per_minute == 2.0
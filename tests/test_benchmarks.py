@@ -0,0 +1,48 @@
+import wave
+from benchmarks.bench_transcription import compare
+from benchmarks.bench_t5_quantized import rouge_n, rouge_l
+from benchmarks.fixtures import make_fixture
+
+
+def test_wav_fixtures_are_deterministic(tmp_path):
+    """Test that the same parameters always produce byte-identical fixtures."""
+    first = make_fixture(2, "wav", sr=16000, seed=3, directory=tmp_path / "a")
+    second = make_fixture(2, "wav", sr=16000, seed=3, directory=tmp_path / "b")
+
+    assert first.read_bytes() == second.read_bytes()
+    with wave.open(str(first), "rb") as w:
+        assert (w.getframerate(), w.getnchannels(), w.getnframes()) == (16000, 1, 32000)
+
+
+def test_fixtures_are_reused(tmp_path):
+    """Test that an existing fixture is not regenerated."""
+    path = make_fixture(1, "wav", directory=tmp_path)
+    mtime = path.stat().st_mtime_ns
+    assert make_fixture(1, "wav", directory=tmp_path).stat().st_mtime_ns == mtime
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    """Test that only slowdowns beyond the tolerance are reported."""
+    baseline = [
+        {"name": "decode/mp3/30s", "value": 1.0},
+        {"name": "rtf/tiny/full/30s", "value": 0.10},
+        {"name": "load/tiny", "value": 0.0},
+    ]
+    results = [
+        {"name": "decode/mp3/30s", "value": 1.1},
+        {"name": "rtf/tiny/full/30s", "value": 0.13},
+        {"name": "load/tiny", "value": 5.0},
+        {"name": "e2e/tiny/30s", "value": 9.0},
+    ]
+
+    assert compare(results, baseline, tolerance=0.15) == [("rtf/tiny/full/30s", 0.10, 0.13)]
+
+
+def test_rouge_scores():
+    """Test ROUGE-1/2/L F1 on identical, disjoint and partly overlapping texts."""
+    assert rouge_n("the cat sat", "The cat sat.") == 1.0
+    assert rouge_n("the cat sat", "a dog ran") == 0.0
+    assert abs(rouge_n("the cat sat on the mat", "the cat lay on a mat") - 4 / 6) < 1e-9
+    assert abs(rouge_n("the cat sat", "the cat ran", n=2) - 0.5) < 1e-9
+    # LCS "the cat on mat" = 4 of 6 words in both
+    assert abs(rouge_l("the cat sat on the mat", "the cat lay on a mat") - 4 / 6) < 1e-9
@@ -0,0 +1,79 @@
+import numpy as np
+from calibrate import default_thread_counts, format_profile, load_profile, save_profile
+from calibrate import load_sample, select_model
+from audio import SAMPLE_RATE
+from tests.test_audio import requires_ffmpeg, write_wav
+
+PROFILE = {
+    "results": [
+        {"model": "tiny", "threads": 4, "device": "cpu", "precision": "fp32",
+         "rtf": 0.05, "load_seconds": 0.4, "peak_rss_mb": 400},
+        {"model": "base", "threads": 4, "device": "cpu", "precision": "fp32",
+         "rtf": 0.12, "load_seconds": 0.8, "peak_rss_mb": 600},
+        {"model": "small", "threads": 2, "device": "cpu", "precision": "fp32",
+         "rtf": 0.60, "load_seconds": 2.0, "peak_rss_mb": 1400},
+        {"model": "small", "threads": 4, "device": "cpu", "precision": "fp32",
+         "rtf": 0.35, "load_seconds": 2.0, "peak_rss_mb": 1400},
+    ]
+}
+
+
+def test_selects_most_accurate_model_within_target():
+    """Test that the largest model meeting the RTF target wins, with its fastest setting."""
+    choice = select_model(600, target_rtf=0.5, profile=PROFILE)
+    assert (choice["model"], choice["threads"]) == ("small", 4)
+
+
+def test_deadline_tightens_target():
+    """Test that a deadline shorter than the target allows forces a faster model."""
+    # 3600s of audio in 600s means RTF <= 0.167
+    choice = select_model(3600, target_rtf=0.5, deadline_seconds=600, profile=PROFILE)
+    assert choice["model"] == "base"
+
+
+def test_falls_back_to_fastest_when_nothing_qualifies():
+    """Test that an impossible target still yields the fastest configuration."""
+    assert select_model(3600, target_rtf=0.01, profile=PROFILE)["model"] == "tiny"
+
+
+def test_no_profile(tmp_path):
+    """Test that selection is skipped without a profile."""
+    assert load_profile(tmp_path / "missing.json") is None
+    assert select_model(60, profile={"results": []}) is None
+
+
+def test_profile_round_trip_and_table(tmp_path):
+    """Test saving, loading and rendering a profile."""
+    path = tmp_path / "profiles" / "whisper_profile.json"
+    save_profile(PROFILE, path)
+    assert load_profile(path) == PROFILE
+    assert format_profile(PROFILE).splitlines()[1].startswith("tiny")
+
+
+def test_default_thread_counts_end_at_cpu_count():
+    """Test the thread counts tried during calibration."""
+    counts = default_thread_counts()
+    assert counts[0] == 1
+    assert counts == sorted(set(counts))
+
+
+@requires_ffmpeg
+def test_sample_from_real_recording_is_its_middle(tmp_path):
+    """Test that calibrating on a recording measures its middle, not the synthetic sample."""
+    samples = np.zeros(SAMPLE_RATE * 10, dtype=np.int16)
+    samples[SAMPLE_RATE * 4:SAMPLE_RATE * 6] = 1000
+    path = tmp_path / "lecture.wav"
+    write_wav(path, samples)
+
+    audio = load_sample(2, path)
+
+    assert len(audio) == SAMPLE_RATE * 2
+    assert np.all(audio > 0)
+
+
+def test_sample_from_short_recording_is_whole(tmp_path, monkeypatch):
+    """Test that a recording shorter than the sample length is used whole."""
+    import audio
+
+    monkeypatch.setattr(audio, "load_audio", lambda path: np.ones(SAMPLE_RATE, dtype=np.float32))
+    assert len(load_sample(60, tmp_path / "short.wav")) == SAMPLE_RATE
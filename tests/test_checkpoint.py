@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import parallel_transcribe
+from checkpoint import TranscriptionJournal
+from parallel_transcribe import plan_windows, transcribe_windows
+
+SR = 16000
+HEADER = {"cache_key": "abc", "windows": [[0, 10, 0, 10]]}
+
+
+def segment_result(index):
+    return {"segments": [{"start": index * 10.0, "end": index * 10.0 + 5, "text": f" w{index}"}]}
+
+
+def test_journal_resumes_completed_windows(tmp_path):
+    """Test that finished windows survive a restart."""
+    path = tmp_path / "lecture.journal.jsonl"
+    journal = TranscriptionJournal(path, HEADER)
+    journal.record(0, segment_result(0))
+    journal.record(2, segment_result(2))
+
+    resumed = TranscriptionJournal(path, HEADER)
+    assert sorted(resumed.completed()) == [0, 2]
+    assert resumed.completed()[2]["segments"][0]["text"] == " w2"
+
+
+def test_journal_discards_mismatched_job(tmp_path):
+    """Test that a journal for different audio or options is not reused."""
+    path = tmp_path / "lecture.journal.jsonl"
+    TranscriptionJournal(path, HEADER).record(0, segment_result(0))
+
+    other = TranscriptionJournal(path, dict(HEADER, cache_key="different"))
+    assert other.completed() == {}
+
+
+def test_journal_tolerates_torn_write(tmp_path):
+    """Test that a half-written last line is dropped and appending still works."""
+    path = tmp_path / "lecture.journal.jsonl"
+    TranscriptionJournal(path, HEADER).record(0, segment_result(0))
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "window", "index": 1, "res')
+
+    journal = TranscriptionJournal(path, HEADER)
+    journal.record(1, segment_result(1))
+
+    assert sorted(TranscriptionJournal(path, HEADER).completed()) == [0, 1]
+
+
+def test_transcribe_windows_skips_journaled_windows(tmp_path, monkeypatch):
+    """Test that an interrupted run only transcribes the remaining windows."""
+    audio = np.zeros(SR * 30, dtype=np.float32)
+    windows = plan_windows(audio, SR, window_seconds=10, overlap_seconds=0, search_seconds=1)
+    header = {"cache_key": "abc", "windows": [[w.start, w.end] for w in windows]}
+    journal = TranscriptionJournal(tmp_path / "j.jsonl", header)
+    calls = []
+
+    def fake_window(window_audio, offset, *args):
+        index = int(round(offset / 10))
+        calls.append(index)
+        if index == 1 and len(calls) == 2:
+            raise KeyboardInterrupt
+        return segment_result(index)
+
+    monkeypatch.setattr(parallel_transcribe, "_transcribe_window", fake_window)
+    with pytest.raises(KeyboardInterrupt):
+        transcribe_windows(audio, windows, journal=journal, use_vad=False, sr=SR)
+
+    calls.clear()
+    resumed = TranscriptionJournal(tmp_path / "j.jsonl", header)
+    result = transcribe_windows(audio, windows, journal=resumed, use_vad=False, sr=SR)
+
+    assert calls == [1, 2]
+    assert result["text"] == " w0 w1 w2"
@@ -0,0 +1,63 @@
+import asyncio
+import numpy as np
+import pytest
+
+pytest.importorskip("websockets")
+
+from api import deepgram_live  # noqa: E402
+from transcript_store import interim_path_for, load_segments  # noqa: E402
+from tests.deepgram_stub import deepgram_live_stub  # noqa: E402
+from tests.test_audio import requires_ffmpeg, write_wav  # noqa: E402
+
+
+async def pcm_source(total_bytes, chunk_bytes=3200):
+    for start in range(0, total_bytes, chunk_bytes):
+        await asyncio.sleep(0)
+        yield b"\x00" * min(chunk_bytes, total_bytes - start)
+
+
+def test_live_transcript_is_written_as_results_arrive(tmp_path):
+    """Test that finals are appended in order and interim text lives in a sidecar."""
+    transcript = tmp_path / "lecture_live.txt"
+    events = []
+
+    async def run():
+        async with deepgram_live_stub(bytes_per_result=32000) as stub:
+            def on_event(event):
+                events.append(event)
+                if event.is_final:
+                    # Readable while the lecture is still streaming
+                    assert transcript.read_text(encoding="utf-8").endswith(f"{event.text}\n")
+                else:
+                    assert interim_path_for(transcript).read_text(encoding="utf-8") == event.text
+
+            await deepgram_live.transcribe_live(
+                pcm_source(3 * 32000 + 6400), transcript, on_event, url=stub.url, api_key="key"
+            )
+            return stub
+
+    stub = asyncio.run(run())
+
+    assert stub.closed_by_client
+    assert len(stub.audio) == 3 * 32000 + 6400
+    assert stub.headers["authorization"] == "Token key"
+    assert "encoding=linear16" in stub.path and "interim_results=true" in stub.path
+    assert "utterances" not in stub.path
+    assert transcript.read_text(encoding="utf-8") == "words 0\nwords 1\nwords 2\nwords 3\n"
+    assert [e.is_final for e in events[:2]] == [False, True]
+    assert not interim_path_for(transcript).exists()
+    segments = load_segments(transcript)
+    np.testing.assert_allclose(segments.start, [0.0, 1.0, 2.0, 3.0])
+
+
+@requires_ffmpeg
+def test_file_source_yields_pcm_chunks(tmp_path):
+    """Test that the file-backed source produces 16 kHz mono PCM in fixed-size chunks."""
+    source = tmp_path / "tone.wav"
+    write_wav(source, np.zeros(44100, dtype=np.int16), sr=44100)
+
+    async def collect():
+        return [chunk async for chunk in deepgram_live.file_source(source, chunk_seconds=0.25)]
+
+    chunks = asyncio.run(collect())
+    assert [len(c) for c in chunks] == [8000, 8000, 8000, 8000]
@@ -0,0 +1,115 @@
+import asyncio
+import pytest
+
+pytest.importorskip("deepgram")
+
+import transcript_cache  # noqa: E402
+from api import deepgram_transcribe  # noqa: E402
+from utils.disk_cache import DiskCache  # noqa: E402
+from utils.error_handler import APIError  # noqa: E402
+from transcript_store import load_utterances  # noqa: E402
+
+
+class FakePrerecorded:
+    """Stand-in for the SDK's async prerecorded client that tracks requests in flight."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.sizes = []
+
+    def v(self, version):
+        return self
+
+    async def transcribe_file(self, source, options):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        if source["buffer"] == b"bad":
+            raise RuntimeError("400 Bad Request")
+        self.sizes.append(len(source["buffer"]))
+        text = f"{len(source['buffer'])} bytes"
+        response = {"results": {
+            "channels": [{"alternatives": [{"transcript": text}]}],
+            "utterances": [{"start": 0.0, "end": 1.0, "confidence": 0.9, "speaker": 0,
+                            "transcript": text, "words": []}],
+        }}
+        return type("Response", (), {"to_dict": lambda self: response})()
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    prerecorded = FakePrerecorded()
+    listen = type("Listen", (), {"asyncprerecorded": prerecorded})()
+    monkeypatch.setattr(transcript_cache, "get_transcript_cache", lambda: DiskCache(tmp_path / "c"))
+    monkeypatch.setattr(transcript_cache, "TRANSCRIPTS_DIR", tmp_path)
+    return type("Client", (), {"listen": listen, "prerecorded": prerecorded})()
+
+
+def test_transcribe_many_bounds_requests_in_flight(client, tmp_path):
+    """Test that uploads overlap up to the concurrency limit and failures are reported per file."""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"lecture{i}.wav"
+        path.write_bytes(b"bad" if i == 3 else b"x" * (i + 1))
+        paths.append(str(path))
+
+    report = asyncio.run(deepgram_transcribe.transcribe_many_async(
+        paths, concurrency=2, client=client, codec=None
+    ))
+
+    assert client.prerecorded.max_in_flight == 2
+    assert len(report.succeeded) == 5
+    failed, = report.failed
+    assert failed.path == paths[3] and "400" in failed.error
+    for result in report.succeeded:
+        with open(result.transcript_path, encoding="utf-8") as f:
+            assert f.read().endswith("bytes")
+        assert load_utterances(result.transcript_path).texts()[0].endswith("bytes")
+        assert result.seconds > 0
+
+
+def test_compressed_upload_does_not_need_the_sdk_client(client, tmp_path, monkeypatch):
+    """Test that the streamed upload path works when the SDK client failed to initialize."""
+    monkeypatch.setattr(deepgram_transcribe, "dg_client", None)
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "key")
+
+    async def fake_upload(file_path, model, options, codec, http_client):
+        response = {"results": {"channels": [{"alternatives": [{"transcript": "hello"}]}]}}
+        return response, None
+
+    monkeypatch.setattr(deepgram_transcribe, "transcribe_compressed", fake_upload)
+    source = tmp_path / "lecture.wav"
+    source.write_bytes(b"audio")
+
+    path = asyncio.run(deepgram_transcribe.transcribe_with_deepgram(str(source), codec="opus"))
+
+    with open(path, encoding="utf-8") as f:
+        assert f.read() == "hello"
+    with pytest.raises(APIError, match="not initialized"):
+        asyncio.run(deepgram_transcribe.transcribe_with_deepgram(str(source), codec=None))
+
+
+def test_upload_savings_reach_the_batch_report(client, tmp_path, monkeypatch):
+    """Test that compressed-upload stats are kept per file and totalled in the report."""
+    from api.deepgram_upload import UploadStats
+
+    monkeypatch.setenv("DEEPGRAM_API_KEY", "key")
+
+    async def fake_upload(file_path, model, options, codec, http_client):
+        response = {"results": {"channels": [{"alternatives": [{"transcript": "hi"}]}]}}
+        return response, UploadStats(source_bytes=4_000_000, uploaded_bytes=1_000_000, seconds=1.0)
+
+    monkeypatch.setattr(deepgram_transcribe, "transcribe_compressed", fake_upload)
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"lecture{i}.wav"
+        path.write_bytes(b"audio %d" % i)
+        paths.append(str(path))
+
+    report = asyncio.run(deepgram_transcribe.transcribe_many_async(paths, codec="opus"))
+
+    assert [r.upload.saved_bytes for r in report.results] == [3_000_000, 3_000_000]
+    assert "Uploaded 2.0 MB instead of 8.0 MB (75% smaller) for 2 file(s)" in report.format()
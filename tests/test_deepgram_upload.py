@@ -0,0 +1,59 @@
+import wave
+import asyncio
+import numpy as np
+import pytest
+
+pytest.importorskip("httpx")
+
+from api.deepgram_upload import transcribe_compressed  # noqa: E402
+from utils.error_handler import APIError  # noqa: E402
+from tests.deepgram_stub import deepgram_stub  # noqa: E402
+from tests.test_audio import requires_ffmpeg  # noqa: E402
+
+
+def write_stereo_wav(path, seconds=5, sr=44100):
+    t = np.arange(int(seconds * sr)) / sr
+    tone = (np.sin(2 * np.pi * 220 * t) * 8000).astype("<i2")
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2)
+        w.setsampwidth(2)
+        w.setframerate(sr)
+        w.writeframes(np.repeat(tone, 2).tobytes())
+
+
+@requires_ffmpeg
+@pytest.mark.parametrize("codec, magic", [("opus", b"OggS"), ("flac", b"fLaC")])
+def test_upload_is_transcoded_and_streamed(tmp_path, codec, magic):
+    """Test that the body is compressed speech audio sent with chunked transfer encoding."""
+    source = tmp_path / "lecture.wav"
+    write_stereo_wav(source)
+
+    with deepgram_stub() as stub:
+        response, stats = asyncio.run(transcribe_compressed(
+            source, "nova-2", {"diarize": True}, codec, api_key="key", url=stub.url
+        ))
+
+    request, = stub.requests
+    assert request["headers"]["Transfer-Encoding"] == "chunked"
+    assert request["headers"]["Authorization"] == "Token key"
+    assert request["query"] == {"model": ["nova-2"], "diarize": ["true"]}
+    assert request["body"].startswith(magic)
+    assert stats.uploaded_bytes == len(request["body"])
+    assert stats.source_bytes == source.stat().st_size
+    assert stats.uploaded_bytes < stats.source_bytes / 4
+    assert stats.raw_upload_seconds > stats.seconds
+    transcript = response["results"]["channels"][0]["alternatives"][0]["transcript"]
+    assert transcript == f"received {stats.uploaded_bytes} bytes"
+
+
+@requires_ffmpeg
+def test_rejected_upload_raises_api_error(tmp_path):
+    """Test that an HTTP error from Deepgram surfaces as APIError."""
+    source = tmp_path / "lecture.wav"
+    write_stereo_wav(source, seconds=1)
+
+    with deepgram_stub(status=401) as stub:
+        with pytest.raises(APIError, match="401"):
+            asyncio.run(transcribe_compressed(
+                source, "nova-2", {}, api_key="bad", url=stub.url
+            ))
@@ -0,0 +1,63 @@
+import os
+import time
+from utils.disk_cache import DiskCache, hash_file, make_key
+
+
+def test_hash_file_streams_in_chunks(tmp_path):
+    """Test that chunked hashing matches a one-shot hash."""
+    path = tmp_path / "audio.bin"
+    path.write_bytes(os.urandom(10000))
+    assert hash_file(path, chunk_size=1000) == hash_file(path)
+
+
+def test_make_key_ignores_option_order():
+    """Test that option order does not change the key but values do."""
+    assert make_key("abc", "whisper", vad=True, precision="fp32") == make_key(
+        "abc", "whisper", precision="fp32", vad=True
+    )
+    assert make_key("abc", "whisper", vad=True) != make_key("abc", "whisper", vad=False)
+
+
+def test_put_and_get(tmp_path):
+    """Test storing and retrieving an entry with hit/miss counting."""
+    cache = DiskCache(tmp_path)
+    key = make_key("audio")
+
+    assert cache.get(key) is None
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"\x00\x01")
+    cache.put(key, {"transcript.txt": "hello", "raw.bin": b"\x01", "copy.bin": source})
+
+    entry = cache.get(key)
+    assert (entry / "transcript.txt").read_text() == "hello"
+    assert (entry / "copy.bin").read_bytes() == b"\x00\x01"
+    assert cache.stats() == {"hits": 1, "misses": 1}
+
+
+def test_size_eviction_drops_least_recently_used(tmp_path):
+    """Test that the oldest entries are evicted once the size budget is exceeded."""
+    cache = DiskCache(tmp_path / "cache", max_bytes=250)
+    keys = [make_key(i) for i in range(3)]
+    for i, key in enumerate(keys[:2]):
+        cache.put(key, {"t.txt": "x" * 100})
+        os.utime(cache.path_for(key), (time.time() - 100 + i, time.time() - 100 + i))
+
+    cache.get(keys[0])  # refresh the first entry
+    cache.put(keys[2], {"t.txt": "x" * 100})
+
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+
+
+def test_age_eviction(tmp_path):
+    """Test that expired entries are treated as misses and evicted."""
+    cache = DiskCache(tmp_path, max_age_seconds=60)
+    key = make_key("old")
+    cache.put(key, {"t.txt": "stale"})
+    old = time.time() - 120
+    os.utime(cache.path_for(key), (old, old))
+
+    assert cache.get(key) is None
+    assert cache.evict() == 1
+    assert not cache.path_for(key).exists()
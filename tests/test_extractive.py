@@ -0,0 +1,57 @@
+import numpy as np
+import extractive
+from extractive import extract, select_sentences, textrank, tfidf_matrix
+from text_chunking import split_sentences
+
+
+def lecture(sentences):
+    topics = ["entropy", "enthalpy", "equilibrium", "kinetics"]
+    return " ".join(
+        f"Sentence {i} is about {topics[i * len(topics) // sentences]} and its uses."
+        for i in range(sentences)
+    )
+
+
+def test_short_text_is_returned_unchanged():
+    """Test that text within the minimum budget passes through untouched."""
+    text = lecture(20)
+    assert extract(text, min_tokens=10_000) is text
+
+
+def test_extract_keeps_budget_and_order():
+    """Test that the selection fits the budget and keeps the original sentence order."""
+    text = lecture(400)
+    sentences = split_sentences(text)
+    total = sum(extractive.estimate_tokens(sentences))
+
+    result = extract(text, ratio=0.25, min_tokens=0)
+
+    kept = split_sentences(result)
+    assert sum(extractive.estimate_tokens(kept)) <= total * 0.25
+    positions = [sentences.index(s) for s in kept]
+    assert positions == sorted(positions)
+
+
+def test_selection_covers_every_section():
+    """Test that the budget is spread over the whole transcript."""
+    sentences = split_sentences(lecture(400))
+    counts = [10] * len(sentences)
+
+    indices = select_sentences(sentences, counts, budget=400, sections=4)
+
+    assert len(indices) == 40
+    assert np.bincount(indices * 4 // len(sentences), minlength=4).tolist() == [10, 10, 10, 10]
+
+
+def test_textrank_favours_central_sentences():
+    """Test that a sentence sharing words with the others outranks an outlier."""
+    sentences = [
+        "Entropy measures disorder in a system.",
+        "Entropy of an isolated system never decreases.",
+        "Disorder and entropy rise together in a system.",
+        "The cafeteria closes early on Fridays.",
+    ]
+    scores = textrank(tfidf_matrix(sentences))
+
+    assert np.isclose(scores.sum(), 1.0)
+    assert scores.argmin() == 3
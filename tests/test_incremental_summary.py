@@ -0,0 +1,149 @@
+import json
+import pytest
+import summary
+import summary_store
+from incremental_summary import summarize_incremental, state_path_for, read_new_text, SummaryState
+from transcript_store import interim_path_for
+from utils.disk_cache import DiskCache
+
+
+class RecordingClient:
+    """Fake Anthropic client that echoes how much text each request carried."""
+
+    def __init__(self):
+        self.prompts = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        prompt = kwargs["messages"][0]["content"]
+        self.prompts.append(prompt)
+        text = type("Block", (), {"text": f"summary #{len(self.prompts)}"})()
+        return type("Message", (), {"content": [text]})()
+
+    def stream(self, **kwargs):
+        message = self.create(**kwargs)
+        words = message.content[0].text.split(" ")
+        pieces = [words[0]] + [" " + word for word in words[1:]]
+        return type("Stream", (), {
+            "text_stream": iter(pieces),
+            "__enter__": lambda self: self,
+            "__exit__": lambda self, *exc_info: False,
+        })()
+
+
+@pytest.fixture
+def client(monkeypatch, tmp_path):
+    client = RecordingClient()
+    monkeypatch.setattr(summary, "_client", client)
+    monkeypatch.setattr(summary, "_cache", DiskCache(tmp_path / "cache"))
+    monkeypatch.setattr(summary_store, "SUMMARIES_DIR", tmp_path / "summaries")
+    return client
+
+
+def test_only_new_text_is_summarized(client, tmp_path):
+    """Test that a second run sends only the appended text plus the previous summary."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text("First part of the lecture.\n", encoding="utf-8")
+
+    summary_path = summarize_incremental(transcript)
+    assert "summary #1" in summary_path.read_text(encoding="utf-8")
+
+    with open(transcript, "a", encoding="utf-8") as f:
+        f.write("Second part about entropy.\n")
+    summary_path = summarize_incremental(transcript)
+
+    update_prompt = client.prompts[-1]
+    assert "summary #1" in update_prompt
+    assert "Second part about entropy." in update_prompt
+    assert "First part" not in update_prompt
+    assert summary_path.read_text(encoding="utf-8").startswith("Summary:\nsummary #2")
+    # The transcript itself is left alone
+    assert transcript.read_text(encoding="utf-8").count("Summary") == 0
+
+
+def test_unchanged_transcript_makes_no_requests(client, tmp_path):
+    """Test that re-running without new text reuses the saved summary."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text("Only part.\n", encoding="utf-8")
+
+    summarize_incremental(transcript)
+    summarize_incremental(transcript)
+
+    assert len(client.prompts) == 1
+
+
+def test_rewritten_transcript_starts_over(client, tmp_path):
+    """Test that a transcript whose covered bytes changed is summarized from scratch."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text("Original text.\n", encoding="utf-8")
+    summarize_incremental(transcript)
+
+    transcript.write_text("Completely different text, now longer.\n", encoding="utf-8")
+    summarize_incremental(transcript)
+
+    state = json.loads(state_path_for(transcript).read_text(encoding="utf-8"))
+    assert state["covered_bytes"] == transcript.stat().st_size
+    assert "summary so far" not in client.prompts[-1].lower()
+
+
+def test_partial_line_waits_for_newline(tmp_path):
+    """Test that an unfinished last line of a growing transcript is left for the next run."""
+    transcript = tmp_path / "live.txt"
+    transcript.write_bytes("Done line.\nHalf a sen".encode("utf-8"))
+
+    text, end, _ = read_new_text(transcript, SummaryState(), growing=True)
+
+    assert text == "Done line.\n"
+    assert end == len("Done line.\n")
+
+
+def test_finished_transcript_without_trailing_newline_is_summarized(client, tmp_path):
+    """Test that the last line of a completed transcript is not held back."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text(
+        "Intro about cells.\nThe final conclusion about mitochondria.", encoding="utf-8"
+    )
+
+    summarize_incremental(transcript)
+
+    assert "The final conclusion about mitochondria." in client.prompts[-1]
+    state = json.loads(state_path_for(transcript).read_text(encoding="utf-8"))
+    assert state["covered_bytes"] == transcript.stat().st_size
+
+
+def test_live_transcript_holds_back_partial_line(client, tmp_path):
+    """Test that a transcript with a live interim sidecar is read up to its last newline."""
+    transcript = tmp_path / "live.txt"
+    transcript.write_text("Done line.\nHalf a sen", encoding="utf-8")
+    interim_path_for(transcript).write_text("Half a sentence", encoding="utf-8")
+
+    summarize_incremental(transcript)
+
+    assert "Half a sen" not in client.prompts[-1]
+    state = json.loads(state_path_for(transcript).read_text(encoding="utf-8"))
+    assert state["covered_bytes"] == len("Done line.\n")
+
+
+def test_legacy_appended_summaries_are_ignored(tmp_path):
+    """Test that summaries appended by older versions are not treated as lecture text."""
+    transcript = tmp_path / "old.txt"
+    transcript.write_text(
+        "Lecture text.\n\n\n---\n\nSummary:\nOld summary.\n", encoding="utf-8"
+    )
+
+    text, _, _ = read_new_text(transcript, SummaryState())
+
+    assert "Old summary" not in text
+    assert text.strip() == "Lecture text."
+
+
+def test_on_delta_receives_streamed_summary(client, tmp_path):
+    """Test that the callback sees the heading, the streamed text and the study tips."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text("First part.\n", encoding="utf-8")
+    pieces = []
+
+    summary_path = summarize_incremental(transcript, on_delta=pieces.append)
+
+    assert pieces[:3] == ["Summary:\n", "summary", " #1"]
+    assert "".join(pieces) == summary_path.read_text(encoding="utf-8")
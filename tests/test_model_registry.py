@@ -0,0 +1,94 @@
+import threading
+import time
+import pytest
+from model_registry import ModelRegistry
+from utils.error_handler import TranscriptionError
+
+
+class FakeModel:
+    def __init__(self, key):
+        self.key = key
+
+
+def make_registry(**kwargs):
+    calls = []
+
+    def loader(name, device, precision):
+        calls.append((name, device, precision))
+        return FakeModel((name, device, precision))
+
+    kwargs.setdefault("size_fn", lambda model: 100 * 1024 * 1024)
+    return ModelRegistry(loader=loader, **kwargs), calls
+
+
+def test_models_are_loaded_lazily_and_reused():
+    """Test that a model is loaded on first use and then served from the cache."""
+    registry, calls = make_registry(max_models=2)
+    assert calls == []
+
+    first = registry.get("tiny", "cpu", "fp32")
+    second = registry.get("tiny", "cpu", "fp32")
+
+    assert first is second
+    assert calls == [("tiny", "cpu", "fp32")]
+    assert registry.hits == 1
+
+
+def test_defaults_come_from_config():
+    """Test that omitted key parts fall back to the configured model settings."""
+    registry, calls = make_registry()
+    registry.get()
+    assert calls == [ModelRegistry.make_key()]
+
+
+def test_lru_eviction():
+    """Test that the least recently used model is evicted when the cache is full."""
+    registry, calls = make_registry(max_models=2)
+    registry.get("tiny", "cpu", "fp32")
+    registry.get("base", "cpu", "fp32")
+    registry.get("tiny", "cpu", "fp32")  # tiny is now most recently used
+    registry.get("small", "cpu", "fp32")
+
+    assert [key[0] for key in registry.keys()] == ["tiny", "small"]
+
+
+def test_memory_budget_eviction():
+    """Test that models are evicted once the memory budget is exceeded."""
+    registry, calls = make_registry(max_models=10, memory_budget_mb=250)
+    registry.get("tiny", "cpu", "fp32")
+    registry.get("base", "cpu", "fp32")
+    registry.get("small", "cpu", "fp32")
+
+    assert [key[0] for key in registry.keys()] == ["base", "small"]
+    assert registry.memory_bytes() == 200 * 1024 * 1024
+
+
+def test_concurrent_requests_load_once():
+    """Test that concurrent requests for one key only trigger a single load."""
+    calls = []
+
+    def slow_loader(name, device, precision):
+        calls.append(name)
+        time.sleep(0.05)
+        return FakeModel(name)
+
+    registry = ModelRegistry(loader=slow_loader, size_fn=lambda model: 0)
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(registry.get("base", "cpu", "fp32")))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert calls == ["base"]
+    assert all(model is results[0] for model in results)
+
+
+def test_invalid_precision():
+    """Test that an unknown precision is rejected."""
+    registry, _ = make_registry()
+    with pytest.raises(TranscriptionError):
+        registry.get("base", "cpu", "int4")
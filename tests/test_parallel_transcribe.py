@@ -0,0 +1,67 @@
+import numpy as np
+from parallel_transcribe import Window, overlap_length, plan_windows, stitch
+
+SR = 16000
+
+
+def noisy_with_pauses(seconds, pause_every, rng):
+    """Loud noise with a 1-second pause every ``pause_every`` seconds."""
+    audio = (rng.standard_normal(seconds * SR) * 0.2).astype(np.float32)
+    for t in range(pause_every, seconds, pause_every):
+        audio[t * SR:(t + 1) * SR] = 0.0
+    return audio
+
+
+def test_short_audio_is_one_window():
+    """Test that audio shorter than a window is not split."""
+    windows = plan_windows(np.zeros(SR * 10, dtype=np.float32), SR, window_seconds=60)
+    assert len(windows) == 1
+    assert (windows[0].start, windows[0].end) == (0, SR * 10)
+
+
+def test_windows_cover_audio_and_cut_on_silence():
+    """Test that cores tile the recording and cuts land inside pauses."""
+    rng = np.random.default_rng(0)
+    audio = noisy_with_pauses(200, 47, rng)
+
+    windows = plan_windows(audio, SR, window_seconds=50, overlap_seconds=2, search_seconds=10)
+
+    assert windows[0].core_start == 0
+    assert windows[-1].core_end == len(audio)
+    for previous, following in zip(windows, windows[1:]):
+        assert previous.core_end == following.core_start
+        assert following.start == following.core_start - 2 * SR
+        cut = following.core_start / SR
+        assert any(p <= cut <= p + 1 for p in range(47, 200, 47))
+
+
+def test_overlap_length():
+    """Test detection of words repeated across a window boundary."""
+    assert overlap_length("we will now discuss the".split(), "discuss the derivative".split()) == 2
+    assert overlap_length("and that's it.".split(), "That's it. Next".split()) == 2
+    assert overlap_length("one two".split(), "three four".split()) == 0
+
+
+def test_stitch_drops_overlap_segments_and_duplicate_words():
+    """Test that per-window results merge into one transcript without repeats."""
+    first = Window(0, 0, 12 * SR, 0, 10 * SR)
+    second = Window(1, 8 * SR, 20 * SR, 10 * SR, 20 * SR)
+    results = [
+        (second, {"segments": [
+            {"start": 8.5, "end": 9.5, "text": " in the overlap"},
+            {"start": 9.8, "end": 11.0, "text": " the limit exists"},
+            {"start": 11.0, "end": 14.0, "text": " so we continue"},
+        ]}),
+        (first, {"segments": [
+            {"start": 0.0, "end": 4.0, "text": " Today we talk about limits"},
+            {"start": 4.0, "end": 9.9, "text": " and show the limit"},
+            {"start": 10.5, "end": 11.5, "text": " ignored tail"},
+        ]}),
+    ]
+
+    merged = stitch(results, SR)
+
+    assert merged["text"] == (
+        " Today we talk about limits and show the limit exists so we continue"
+    )
+    assert [s["id"] for s in merged["segments"]] == [0, 1, 2, 3]
@@ -0,0 +1,29 @@
+import pytest
+import summary
+
+
+def test_int8_backend_is_selected_by_config(monkeypatch):
+    """Test that T5_BACKEND = "int8" builds the summarizer through the quantized loader."""
+    import quantized_summarizer
+
+    loaded = []
+    monkeypatch.setattr(summary, "T5_BACKEND", "int8")
+    monkeypatch.setattr(
+        quantized_summarizer, "load_quantized_summarizer", lambda name: loaded.append(name)
+    )
+
+    summary._create_summarizer("t5-base")
+
+    assert loaded == ["t5-base"]
+
+
+def test_quantize_replaces_linear_layers():
+    """Test that dynamic quantization swaps Linear layers for int8 ones."""
+    torch = pytest.importorskip("torch")
+    from quantized_summarizer import quantize
+
+    model = torch.nn.Sequential(torch.nn.Linear(8, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+    quantized = quantize(model)
+
+    assert not isinstance(quantized[0], torch.nn.Linear)
+    assert quantized(torch.randn(3, 8)).shape == (3, 2)
@@ -0,0 +1,85 @@
+import asyncio
+from utils.rate_limit import TokenBucket, RateLimiter, backoff_delay
+
+
+class FakeClock:
+    """Monotonic clock that only moves when someone sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_bucket_allows_burst_then_refills_at_rate():
+    """Test that a full bucket serves a burst and then paces callers at the refill rate."""
+    clock = FakeClock()
+    bucket = TokenBucket(60, clock=clock, sleep=clock.sleep)
+
+    async def run():
+        for _ in range(60):
+            await bucket.acquire()
+        assert clock.now == 0.0
+        await bucket.acquire()
+        await bucket.acquire(2)
+
+    asyncio.run(run())
+    assert abs(clock.now - 3.0) < 1e-9
+
+
+def test_oversized_request_is_clamped_to_capacity():
+    """Test that a request larger than the bucket waits for a full bucket instead of forever."""
+    clock = FakeClock()
+    bucket = TokenBucket(100, clock=clock, sleep=clock.sleep)
+
+    async def run():
+        await bucket.acquire(100)
+        await bucket.acquire(500)
+
+    asyncio.run(run())
+    assert abs(clock.now - 60.0) < 1e-9
+
+
+def test_bucket_works_across_event_loops():
+    """Test that a bucket built outside asyncio.run() can queue waiters in any loop."""
+    clock = FakeClock()
+
+    async def yielding_sleep(seconds):
+        await clock.sleep(seconds)
+        await asyncio.sleep(0)
+
+    bucket = TokenBucket(60, capacity=1, clock=clock, sleep=yielding_sleep)
+
+    async def run():
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+    asyncio.run(run())
+    asyncio.run(run())
+    assert abs(clock.now - 5.0) < 1e-9
+
+
+def test_rate_limiter_enforces_both_budgets():
+    """Test that the tighter of the request and token budgets sets the pace."""
+    clock = FakeClock()
+    limiter = RateLimiter(600, tokens_per_minute=1000, clock=clock, sleep=clock.sleep)
+
+    async def run():
+        for _ in range(3):
+            await limiter.acquire(tokens=500)
+
+    asyncio.run(run())
+    assert abs(clock.now - 30.0) < 1e-9
+
+
+def test_backoff_delay_has_jitter_cap_and_retry_after():
+    """Test that backoff delays are jittered, capped, and never shorter than Retry-After."""
+    delays = [backoff_delay(10, base=1.0, maximum=8.0) for _ in range(200)]
+    assert all(0 <= d <= 8.0 for d in delays)
+    assert len(set(delays)) > 1
+    assert backoff_delay(0, base=0.1, retry_after=5.0) == 5.0
@@ -0,0 +1,336 @@
+import sys
+import time
+import asyncio
+import threading
+import subprocess
+from pathlib import Path
+import pytest
+import summary
+from utils.disk_cache import DiskCache
+from utils.error_handler import APIError
+from tests.test_text_chunking import WhitespaceTokenizer
+
+ROOT = Path(__file__).parent.parent
+
+
+class FakeMessage:
+    def __init__(self, text):
+        self.content = [type("Block", (), {"text": text})()]
+
+
+class FakeClient:
+    def __init__(self):
+        self.calls = []
+        self.messages = self
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeMessage("The lecture covered entropy.")
+
+    def stream(self, **kwargs):
+        self.calls.append(kwargs)
+        return FakeStream(["The lecture ", "covered ", "entropy."])
+
+
+class FakeStream:
+    """Stand-in for the SDK's MessageStream context manager."""
+
+    def __init__(self, pieces):
+        self.text_stream = iter(pieces)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def fresh_backends(monkeypatch, tmp_path):
+    monkeypatch.setattr(summary, "_client", None)
+    monkeypatch.setattr(summary, "_summarizers", {})
+    monkeypatch.setattr(summary, "_cache", DiskCache(tmp_path / "summaries"))
+
+
+def test_import_does_not_load_backends():
+    """Test that importing summary does not import anthropic or transformers."""
+    code = (
+        "import sys; import summary; "
+        "print(any(m in sys.modules for m in ('anthropic', 'transformers', 'torch')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env={"PYTHONPATH": f"{ROOT}:{ROOT / 'src'}", "ANTHROPIC_API_KEY": "x",
+             "DEEPGRAM_API_KEY": "x"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert output.stdout.strip() == "False"
+
+
+def test_client_is_created_once(monkeypatch):
+    """Test that the Anthropic client is built on first use and then reused."""
+    created = []
+    monkeypatch.setattr(summary, "_create_client", lambda: created.append(1) or FakeClient())
+
+    first = summary.get_client()
+    text = summary.generate_summary("Entropy always increases.")
+
+    assert summary.get_client() is first
+    assert created == [1]
+    assert text.startswith("Summary:\nThe lecture covered entropy.")
+
+
+def test_client_failure_is_not_cached(monkeypatch):
+    """Test that a failed client init raises APIError and is retried next time."""
+    def broken():
+        raise RuntimeError("no key")
+
+    monkeypatch.setattr(summary, "_create_client", broken)
+    with pytest.raises(APIError):
+        summary.get_client()
+
+    monkeypatch.setattr(summary, "_create_client", FakeClient)
+    assert isinstance(summary.get_client(), FakeClient)
+
+
+def test_preload_warms_requested_backends(monkeypatch):
+    """Test that preload builds only the backends it is asked for."""
+    loaded = []
+    monkeypatch.setattr(summary, "_create_client", FakeClient)
+    monkeypatch.setattr(summary, "_create_summarizer", lambda name: loaded.append(name) or object())
+
+    summary.preload(use_claude=False)
+
+    assert summary._client is None
+    assert loaded == [summary.T5_MODEL]
+    summary.get_summarizer()
+    assert loaded == [summary.T5_MODEL]
+
+
+def test_local_summary_batches_token_sized_chunks(monkeypatch):
+    """Test that the T5 pipeline gets every sentence-packed chunk in one batched call."""
+    class FakePipeline:
+        tokenizer = WhitespaceTokenizer()
+
+        def __init__(self):
+            self.calls = []
+
+        def __call__(self, inputs, **kwargs):
+            self.calls.append((inputs, kwargs))
+            return [{"summary_text": f"part{i}"} for i in range(len(inputs))]
+
+    pipeline = FakePipeline()
+    monkeypatch.setattr(summary, "_create_summarizer", lambda name: pipeline)
+    monkeypatch.setattr(summary, "T5_MAX_INPUT_TOKENS", summary.T5_PREFIX_TOKENS + 6)
+    text = "One two three. Four five six. Seven eight. Nine."
+
+    result = summary.generate_local_summary(text)
+
+    (inputs, kwargs), = pipeline.calls
+    assert inputs == ["One two three. Four five six.", "Seven eight. Nine."]
+    assert kwargs["batch_size"] == summary.T5_BATCH_SIZE
+    assert result.startswith("Local Summary:\npart0 part1")
+
+
+class CountingClient(FakeClient):
+    """Fake client that tracks how many requests run at once."""
+
+    def __init__(self, delay=0.02):
+        super().__init__()
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def create(self, **kwargs):
+        with self.lock:
+            self.calls.append(kwargs)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            number = len(self.calls)
+        time.sleep(self.delay)
+        with self.lock:
+            self.in_flight -= 1
+        return FakeMessage(f"partial {number}")
+
+
+def lecture(sentences):
+    return " ".join(f"Sentence number {i} explains one more idea." for i in range(sentences))
+
+
+def test_hierarchical_summary_covers_whole_transcript():
+    """Test that every section is summarized, with bounded concurrency, then reduced."""
+    client = CountingClient()
+    text = lecture(200)
+
+    result = summary.summarize_hierarchical(
+        text, client, section_chars=500, concurrency=3, fan_in=4
+    )
+
+    prompts = [call["messages"][0]["content"] for call in client.calls]
+    sections = [p for p in prompts if p.startswith("The following is part")]
+    reduces = [p for p in prompts if p.startswith("The following are summaries")]
+    assert len(sections) == len(summary.chunk_by_chars(text, 500))
+    assert "Sentence number 199 " in "".join(sections)
+    # 18 sections -> 5 groups -> 2 groups -> final
+    assert len(reduces) == 5 + 2 + 1
+    assert client.max_in_flight == 3
+    assert result.startswith("partial")
+
+
+def test_generate_summary_switches_to_hierarchical_for_long_text(monkeypatch):
+    """Test that only transcripts longer than one section are summarized hierarchically."""
+    client = CountingClient(delay=0)
+    monkeypatch.setattr(summary, "_create_client", lambda: client)
+    monkeypatch.setattr(summary, "SUMMARY_SECTION_CHARS", 1000)
+
+    summary.generate_summary(lecture(10))
+    assert len(client.calls) == 1
+
+    summary.generate_summary(lecture(100))
+    assert len(client.calls) > 2
+
+
+def test_hierarchical_summary_against_stub_server(monkeypatch):
+    """Test the map-reduce path end to end against a local Messages API stub."""
+    pytest.importorskip("anthropic")
+    from tests.anthropic_stub import anthropic_stub
+
+    with anthropic_stub(delay=0.05) as stub:
+        monkeypatch.setattr(summary, "ANTHROPIC_BASE_URL", stub.base_url)
+        client = summary.get_client()
+        start = time.perf_counter()
+        result = summary.summarize_hierarchical(
+            lecture(120), client, section_chars=400, concurrency=8
+        )
+        elapsed = time.perf_counter() - start
+
+    assert result.startswith("summary ")
+    # 14 sections, 2 reduce groups, 1 final reduce
+    assert len(stub.requests) == 17
+    assert stub.max_in_flight > 1
+    # Sections run concurrently: far less than one delay per request
+    assert elapsed < 0.05 * len(stub.requests)
+
+
+def test_repeated_summary_is_served_from_cache(monkeypatch):
+    """Test that an identical transcript is summarized once and then read from the cache."""
+    client = CountingClient(delay=0)
+    monkeypatch.setattr(summary, "_create_client", lambda: client)
+    text = lecture(5)
+
+    first = summary.generate_summary(text)
+    second = summary.generate_summary(text)
+
+    assert first == second
+    assert len(client.calls) == 1
+    assert summary.summary_cache_stats()["hits"] == 1
+
+    summary.generate_summary(text + " One more sentence.")
+    assert len(client.calls) == 2
+
+
+def test_summary_key_covers_backend_model_prompt_and_params():
+    """Test that every input that changes the output also changes the cache key."""
+    base = summary.summary_key("text", "claude", "m", ("prompt",), max_tokens=500)
+    assert base == summary.summary_key("text", "claude", "m", ("prompt",), max_tokens=500)
+    assert base != summary.summary_key("text!", "claude", "m", ("prompt",), max_tokens=500)
+    assert base != summary.summary_key("text", "t5", "m", ("prompt",), max_tokens=500)
+    assert base != summary.summary_key("text", "claude", "m2", ("prompt",), max_tokens=500)
+    assert base != summary.summary_key("text", "claude", "m", ("prompt v2",), max_tokens=500)
+    assert base != summary.summary_key("text", "claude", "m", ("prompt",), max_tokens=600)
+
+
+def test_summary_cache_can_be_disabled(monkeypatch):
+    """Test that SUMMARY_CACHE_ENABLED = False always calls the backend."""
+    client = CountingClient(delay=0)
+    monkeypatch.setattr(summary, "_create_client", lambda: client)
+    monkeypatch.setattr(summary, "SUMMARY_CACHE_ENABLED", False)
+
+    summary.generate_summary("Same text.")
+    summary.generate_summary("Same text.")
+
+    assert len(client.calls) == 2
+
+
+def test_stream_summary_yields_deltas_that_match_generate_summary(monkeypatch):
+    """Test that streamed pieces join to the same text generate_summary() returns."""
+    client = FakeClient()
+    monkeypatch.setattr(summary, "_client", client)
+
+    pieces = list(summary.stream_summary("Entropy always increases."))
+
+    assert pieces[0] == "Summary:\n"
+    assert pieces[1:4] == ["The lecture ", "covered ", "entropy."]
+    assert "".join(pieces) == summary.generate_summary("Entropy always increases.")
+    # The completed stream was cached, so generate_summary made no request
+    assert len(client.calls) == 1
+
+
+def test_abandoned_stream_is_not_cached(monkeypatch):
+    """Test that a stream the caller stops early does not leave a partial summary cached."""
+    client = FakeClient()
+    monkeypatch.setattr(summary, "_client", client)
+
+    deltas = summary.stream_summary_text("Entropy always increases.")
+    assert next(deltas) == "The lecture "
+    deltas.close()
+
+    assert summary.summarize_text("Entropy always increases.") == "The lecture covered entropy."
+    assert len(client.calls) == 2
+
+
+def test_astream_summary(monkeypatch):
+    """Test that the async iterator yields the same deltas as the sync one."""
+    monkeypatch.setattr(summary, "_client", FakeClient())
+
+    async def collect():
+        return [delta async for delta in summary.astream_summary("Entropy always increases.")]
+
+    pieces = asyncio.run(collect())
+    assert pieces[:4] == ["Summary:\n", "The lecture ", "covered ", "entropy."]
+    assert pieces[-1] == summary.STUDY_TIPS
+
+
+def test_failed_local_generation_does_not_hang_the_stream():
+    """Test that an error inside the T5 generate thread reaches the consumer."""
+    pytest.importorskip("transformers")
+
+    class Inputs(dict):
+        def to(self, device):
+            return self
+
+    class FailingModel:
+        config = type("Config", (), {"prefix": "summarize: "})()
+
+        def generate(self, **kwargs):
+            raise RuntimeError("CUDA out of memory")
+
+    class FakeSummarizer:
+        model = FailingModel()
+        device = "cpu"
+
+        def tokenizer(self, text, **kwargs):
+            return Inputs(input_ids=[[0]])
+
+    with pytest.raises(RuntimeError, match="out of memory"):
+        list(summary._generate_streamed(FakeSummarizer(), "Entropy always increases."))
+
+
+def test_long_transcript_is_shrunk_before_claude(monkeypatch):
+    """Test that the extractive stage cuts what is sent for long transcripts."""
+    client = CountingClient(delay=0)
+    monkeypatch.setattr(summary, "_create_client", lambda: client)
+    text = lecture(2000)
+
+    summary.generate_summary(text)
+    sent = sum(len(call["messages"][0]["content"]) for call in client.calls)
+    assert sent < len(text) / 2
+
+    client.calls.clear()
+    monkeypatch.setattr(summary, "SUMMARY_EXTRACTIVE", False)
+    summary.generate_summary(text)
+    assert sum(len(call["messages"][0]["content"]) for call in client.calls) > len(text)
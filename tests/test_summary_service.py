@@ -0,0 +1,164 @@
+import asyncio
+import pytest
+import summary
+from summary_service import SummaryService, is_retryable
+from utils.disk_cache import DiskCache
+from utils.error_handler import SummarizationError
+from tests.test_rate_limit import FakeClock
+
+
+class FakeStatusError(Exception):
+    def __init__(self, status_code, retry_after=None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        headers = {"retry-after": str(retry_after)} if retry_after is not None else {}
+        self.response = type("Response", (), {"headers": headers})()
+
+
+class FakeMessage:
+    def __init__(self, text):
+        self.content = [type("Block", (), {"text": text})()]
+
+
+class FakeAsyncClient:
+    def __init__(self, failures=(), delay=0.0):
+        self.failures = list(failures)
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+        self.messages = self
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+            if self.failures:
+                raise self.failures.pop(0)
+            return FakeMessage("summary of " + kwargs["messages"][0]["content"].split("\n")[-1])
+        finally:
+            self.in_flight -= 1
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch, tmp_path):
+    monkeypatch.setattr(summary, "_cache", DiskCache(tmp_path / "summaries"))
+
+
+def make_service(client, clock=None, **kwargs):
+    clock = clock or FakeClock()
+    return SummaryService(client=client, sleep=clock.sleep, clock=clock, **kwargs)
+
+
+def test_retries_429_and_5xx_with_retry_after():
+    """Test that 429 and 5xx responses are retried and Retry-After is honored."""
+    clock = FakeClock()
+    client = FakeAsyncClient(failures=[FakeStatusError(429, retry_after=7), FakeStatusError(529)])
+    service = make_service(client, clock)
+
+    text = asyncio.run(service.complete("Summarize this."))
+
+    assert text.startswith("summary of")
+    assert client.calls == 3
+    assert service.retries == 2
+    assert clock.sleeps[0] >= 7
+
+
+def test_client_errors_are_not_retried():
+    """Test that a 400 fails immediately with SummarizationError."""
+    client = FakeAsyncClient(failures=[FakeStatusError(400)])
+    service = make_service(client)
+
+    with pytest.raises(SummarizationError):
+        asyncio.run(service.complete("Summarize this."))
+    assert client.calls == 1
+
+
+def test_gives_up_after_max_retries():
+    """Test that persistent overload errors stop after max_retries."""
+    client = FakeAsyncClient(failures=[FakeStatusError(503)] * 10)
+    service = make_service(client, max_retries=2)
+
+    with pytest.raises(SummarizationError):
+        asyncio.run(service.complete("Summarize this."))
+    assert client.calls == 3
+
+
+def test_is_retryable():
+    """Test which errors count as transient."""
+    assert is_retryable(FakeStatusError(429))
+    assert is_retryable(FakeStatusError(500))
+    assert not is_retryable(FakeStatusError(401))
+    assert is_retryable(ConnectionResetError())
+    assert not is_retryable(ValueError())
+
+
+def test_summarize_many_keeps_order_and_limits():
+    """Test that bulk summaries come back in order within the concurrency and RPM budgets."""
+    clock = FakeClock()
+    client = FakeAsyncClient(delay=0.001)
+    texts = [f"Transcript number {i:03d}." for i in range(30)]
+
+    async def run():
+        async with make_service(
+            client, clock, concurrency=4, requests_per_minute=10, tokens_per_minute=None
+        ) as service:
+            return await service.summarize_many(texts)
+
+    results = asyncio.run(run())
+
+    assert [r.split("\n")[1] for r in results] == [
+        f"summary of Transcript number {i:03d}." for i in range(30)
+    ]
+    assert client.max_in_flight <= 4
+    assert client.closed
+    # 10 requests fit in the initial burst, the other 20 refill at 10 per minute
+    assert abs(clock.now - 120.0) < 1e-6
+
+
+def test_service_built_outside_the_event_loop():
+    """Test that requests queued on the concurrency cap work in whichever loop runs them."""
+    client = FakeAsyncClient(delay=0.01)
+    service = make_service(client, concurrency=1)
+
+    for run in range(2):
+        texts = [f"Run {run} transcript {i}." for i in range(3)]
+        results = asyncio.run(service.summarize_many(texts))
+        assert all(r.startswith("Summary:\n") for r in results)
+    assert client.max_in_flight == 1
+
+
+def test_summarize_many_reports_failures_in_place():
+    """Test that one failing transcript does not sink the batch."""
+    client = FakeAsyncClient(failures=[FakeStatusError(400)])
+    service = make_service(client)
+
+    results = asyncio.run(service.summarize_many(["First.", "Second."]))
+
+    assert isinstance(results[0], SummarizationError)
+    assert results[1].startswith("Summary:\n")
+
+
+def test_service_shares_the_summary_cache(monkeypatch):
+    """Test that a summary made by generate_summary() is reused by the service."""
+    class SyncClient:
+        def __init__(self):
+            self.messages = self
+
+        def create(self, **kwargs):
+            return FakeMessage("cached summary")
+
+    monkeypatch.setattr(summary, "_client", SyncClient())
+    expected = summary.generate_summary("Shared transcript.")
+    client = FakeAsyncClient()
+
+    result = asyncio.run(make_service(client).summarize("Shared transcript."))
+
+    assert result == expected
+    assert client.calls == 0
@@ -0,0 +1,55 @@
+import json
+from summary_store import SummaryStore, hash_transcript, INDEX_FILE
+
+
+def test_versions_are_kept_and_indexed(tmp_path):
+    """Test that each new summary becomes a new version and older ones stay intact."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text("Part one.\n", encoding="utf-8")
+    store = SummaryStore(tmp_path / "summaries")
+
+    first = store.save(transcript, "Summary one", "claude", "claude-test")
+    transcript.write_text("Part one.\nPart two.\n", encoding="utf-8")
+    second = store.save(transcript, "Summary two", "claude", "claude-test")
+
+    assert (first.version, second.version) == (1, 2)
+    assert store.path_of(first).name == "v0001.md"
+    assert store.read(first) == "Summary one"
+    assert store.latest("lecture") == second
+    assert [r.version for r in store.versions(transcript)] == [1, 2]
+    index = json.loads((tmp_path / "summaries" / INDEX_FILE).read_text(encoding="utf-8"))
+    assert len(index["transcripts"]["lecture"]) == 2
+
+
+def test_same_summary_is_not_saved_twice(tmp_path):
+    """Test that re-saving an identical summary returns the existing version."""
+    transcript = tmp_path / "lecture.txt"
+    transcript.write_text("Text.\n", encoding="utf-8")
+    store = SummaryStore(tmp_path / "summaries")
+
+    first = store.save(transcript, "Summary", "t5", "t5-small")
+    assert store.save(transcript, "Summary", "t5", "t5-small") == first
+    assert len(store.versions(transcript)) == 1
+
+
+def test_lookup_by_transcript_hash(tmp_path):
+    """Test finding summaries by the hash of the content they describe."""
+    a, b = tmp_path / "a.txt", tmp_path / "b.txt"
+    a.write_text("Alpha lecture.\n", encoding="utf-8")
+    b.write_text("Beta lecture.\n", encoding="utf-8")
+    store = SummaryStore(tmp_path / "summaries")
+    record = store.save(a, "About alpha", "claude", "claude-test")
+    store.save(b, "About beta", "claude", "claude-test")
+
+    assert store.find(hash_transcript(a)) == [record]
+    assert [r.transcript for r in store.latest_versions()] == ["a", "b"]
+    assert hash_transcript(a, end=5) != hash_transcript(a)
+
+
+def test_missing_or_corrupt_index_is_empty(tmp_path):
+    """Test that a store without a readable index lists nothing."""
+    store = SummaryStore(tmp_path / "summaries")
+    assert store.latest_versions() == []
+    (tmp_path / "summaries").mkdir()
+    (tmp_path / "summaries" / INDEX_FILE).write_text("{not json", encoding="utf-8")
+    assert store.latest("lecture") is None
@@ -0,0 +1,23 @@
+import numpy as np
+from utils.synthetic_audio import synthetic_speech
+from vad import detect_speech
+
+
+def test_synthetic_speech_is_deterministic():
+    """Test that a seed always produces the same samples."""
+    np.testing.assert_array_equal(synthetic_speech(3, seed=7), synthetic_speech(3, seed=7))
+    assert not np.array_equal(synthetic_speech(3, seed=7), synthetic_speech(3, seed=8))
+
+
+def test_synthetic_speech_shape_and_range():
+    """Test length, dtype and amplitude of the generated audio."""
+    audio = synthetic_speech(2.5, sr=16000)
+    assert audio.dtype == np.float32
+    assert len(audio) == 40000
+    assert np.max(np.abs(audio)) <= 1.0
+
+
+def test_synthetic_speech_looks_like_speech_to_vad():
+    """Test that the VAD finds mostly speech with some pauses."""
+    ratio = detect_speech(synthetic_speech(30)).speech_ratio
+    assert 0.5 < ratio < 1.0
@@ -0,0 +1,38 @@
+from text_chunking import split_sentences, pack_sentences, chunk_text
+
+
+class WhitespaceTokenizer:
+    """One token per word, like a tokenizer with a trivial vocabulary."""
+
+    def __call__(self, texts, add_special_tokens=True):
+        return {"input_ids": [text.split() for text in texts]}
+
+    def decode(self, ids, skip_special_tokens=False):
+        return " ".join(ids)
+
+
+def test_split_sentences_keeps_punctuation():
+    """Test that sentences are split after terminal punctuation and blank lines."""
+    text = 'First point. Is it "true?" Yes!\n\nNew paragraph without a stop'
+    assert split_sentences(text) == [
+        "First point.", 'Is it "true?"', "Yes!", "New paragraph without a stop"
+    ]
+
+
+def test_pack_sentences_respects_budget():
+    """Test that sentences are packed greedily without exceeding the token budget."""
+    sentences = ["a b c.", "d e.", "f g h i.", "j."]
+    chunks = pack_sentences(sentences, [3, 2, 4, 1], max_tokens=5)
+    assert chunks == ["a b c. d e.", "f g h i. j."]
+
+
+def test_overlong_sentence_is_cut_by_tokens():
+    """Test that a sentence longer than the budget is cut into token-sized pieces."""
+    tokenizer = WhitespaceTokenizer()
+    text = "Short one. " + " ".join(f"w{i}" for i in range(10)) + ". Tail."
+    chunks = chunk_text(text, tokenizer, max_tokens=4)
+
+    assert chunks[0] == "Short one."
+    assert chunks[-1] == "Tail."
+    assert all(len(chunk.split()) <= 4 for chunk in chunks)
+    assert " ".join(chunks).split() == text.split()
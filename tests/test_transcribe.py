@@ -0,0 +1,160 @@
+import numpy as np
+import pytest
+from transcribe import transcribe_audio
+
+SR = 16000
+
+
+class FakeModel:
+    """Stands in for a Whisper model and records what it was asked to transcribe."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, fp16=False):
+        self.calls.append(len(audio))
+        return {
+            "text": " hello world",
+            "language": "en",
+            "segments": [{"id": 0, "start": 0.0, "end": 1.0, "text": " hello world"}],
+        }
+
+
+def test_transcribe_audio_skips_silence():
+    """Test that only speech reaches the model and timestamps are remapped."""
+    t = np.arange(SR * 2) / SR
+    tone = (0.3 * np.sin(2 * np.pi * 200 * t)).astype(np.float32)
+    audio = np.concatenate([np.zeros(SR * 8, dtype=np.float32), tone])
+    model = FakeModel()
+
+    result = transcribe_audio(audio, model, use_vad=True)
+
+    assert model.calls[0] < SR * 3
+    assert result["segments"][0]["start"] == pytest.approx(8.0, abs=0.3)
+    assert result["vad"]["speech_ratio"] == pytest.approx(0.2, abs=0.05)
+
+
+def test_transcribe_audio_without_speech_skips_model():
+    """Test that a silent recording never reaches the model."""
+    model = FakeModel()
+    result = transcribe_audio(np.zeros(SR * 3, dtype=np.float32), model, use_vad=True)
+
+    assert model.calls == []
+    assert result["text"] == ""
+
+
+def test_transcribe_audio_without_vad():
+    """Test that disabling VAD passes the full recording through."""
+    model = FakeModel()
+    transcribe_audio(np.zeros(SR * 3, dtype=np.float32), model, use_vad=False)
+    assert model.calls == [SR * 3]
+
+
+def test_transcribe_reuses_cached_transcript(tmp_path, monkeypatch):
+    """Test that re-transcribing identical audio is served from the cache."""
+    import transcribe as transcribe_module
+    import transcript_cache
+    from utils.disk_cache import DiskCache, hash_file
+
+    cache = DiskCache(tmp_path / "cache")
+    monkeypatch.setattr(transcript_cache, "get_transcript_cache", lambda: cache)
+    monkeypatch.setattr(transcript_cache, "TRANSCRIPTS_DIR", tmp_path)
+    monkeypatch.setattr(transcribe_module, "WHISPER_AUTO_SELECT", False)
+
+    def fail_load(*args):
+        raise AssertionError("model should not be loaded on a cache hit")
+
+    monkeypatch.setattr(transcribe_module, "get_model", fail_load)
+    monkeypatch.setattr(transcribe_module, "load_audio", fail_load)
+
+    first = tmp_path / "lecture.mp3"
+    second = tmp_path / "renamed.mp3"
+    first.write_bytes(b"same audio")
+    second.write_bytes(b"same audio")
+
+    audio_hash = hash_file(first)
+    key = transcript_cache.transcript_key(
+        audio_hash, "whisper", transcribe_module.WHISPER_MODEL,
+        {"precision": transcribe_module.WHISPER_PRECISION, "vad": True},
+    )
+    cache.put(key, {transcript_cache.TRANSCRIPT_FILE: "cached text"})
+
+    path = transcribe_module.transcribe(str(second), use_vad=True)
+
+    assert path.endswith(f"renamed_{audio_hash[:8]}.txt")
+    assert open(path, encoding="utf-8").read() == "cached text"
+
+
+def test_auto_selection_does_not_decode_before_a_cache_hit(tmp_path, monkeypatch):
+    """Test that the model is chosen from the probed duration, so a cache hit skips decoding."""
+    import transcribe as transcribe_module
+    import transcript_cache
+    from utils.disk_cache import DiskCache, hash_file
+
+    cache = DiskCache(tmp_path / "cache")
+    profile = tmp_path / "whisper_profile.json"
+    profile.write_text("{}")
+    monkeypatch.setattr(transcript_cache, "get_transcript_cache", lambda: cache)
+    monkeypatch.setattr(transcript_cache, "TRANSCRIPTS_DIR", tmp_path)
+    monkeypatch.setattr(transcribe_module, "WHISPER_AUTO_SELECT", True)
+    monkeypatch.setattr(transcribe_module, "WHISPER_PROFILE_PATH", profile)
+    monkeypatch.setattr(transcribe_module, "probe_duration", lambda path: 3600.0)
+    monkeypatch.setattr(transcribe_module, "set_torch_threads", lambda threads: None)
+    durations = []
+
+    def select_model(duration, **kwargs):
+        durations.append(duration)
+        return {"model": "base", "precision": "fp32", "threads": 2}
+
+    def fail_load(*args):
+        raise AssertionError("audio should not be decoded on a cache hit")
+
+    monkeypatch.setattr(transcribe_module, "select_model", select_model)
+    monkeypatch.setattr(transcribe_module, "load_audio", fail_load)
+
+    source = tmp_path / "lecture.mp3"
+    source.write_bytes(b"audio")
+    key = transcript_cache.transcript_key(
+        hash_file(source), "whisper", "base", {"precision": "fp32", "vad": True},
+    )
+    cache.put(key, {transcript_cache.TRANSCRIPT_FILE: "cached text"})
+
+    path = transcribe_module.transcribe(str(source), use_vad=True)
+
+    assert durations == [3600.0]
+    assert open(path, encoding="utf-8").read() == "cached text"
+
+
+def test_long_recording_is_single_pass_unless_resumable(tmp_path, monkeypatch):
+    """Test that checkpointed windows are opt-in, not the default for long recordings."""
+    import transcribe as transcribe_module
+    import parallel_transcribe
+    import transcript_cache
+    from utils.disk_cache import DiskCache
+
+    monkeypatch.setattr(transcript_cache, "get_transcript_cache", lambda: DiskCache(tmp_path / "c"))
+    monkeypatch.setattr(transcript_cache, "TRANSCRIPTS_DIR", tmp_path)
+    monkeypatch.setattr(transcribe_module, "WHISPER_AUTO_SELECT", False)
+    monkeypatch.setattr(transcribe_module, "check_ffmpeg", lambda: None)
+    monkeypatch.setattr(transcribe_module, "load_audio", lambda path: np.zeros(SR, np.float32))
+    monkeypatch.setattr(transcribe_module, "duration_seconds", lambda audio: 3600.0)
+    model = FakeModel()
+    monkeypatch.setattr(transcribe_module, "get_model", lambda *args: model)
+    windowed = []
+
+    def transcribe_windows(audio, windows, *args, **kwargs):
+        windowed.append(len(windows))
+        return {"segments": []}
+
+    windows = [parallel_transcribe.Window(i, 0, SR, 0, SR) for i in range(2)]
+    monkeypatch.setattr(parallel_transcribe, "plan_windows", lambda audio: windows)
+    monkeypatch.setattr(parallel_transcribe, "transcribe_windows", transcribe_windows)
+
+    source = tmp_path / "lecture.mp3"
+    source.write_bytes(b"long lecture")
+    transcribe_module.transcribe(str(source), use_vad=False, workers=1)
+    assert model.calls == [SR] and windowed == []
+
+    source.write_bytes(b"another long lecture")
+    transcribe_module.transcribe(str(source), use_vad=False, workers=1, checkpoint=True)
+    assert windowed == [2]
@@ -0,0 +1,117 @@
+import numpy as np
+from transcript_store import (
+    SegmentTable,
+    UtteranceTable,
+    load_segments,
+    load_utterances,
+    segments_path_for,
+    utterances_path_for,
+    write_transcript,
+)
+
+SEGMENTS = [
+    {"start": 0.0, "end": 2.5, "text": " Bonjour à tous.", "avg_logprob": -0.2,
+     "no_speech_prob": 0.01},
+    {"start": 2.5, "end": 6.0, "text": " Today: entropy.", "avg_logprob": -0.4,
+     "no_speech_prob": 0.05},
+    {"start": 9.0, "end": 12.0, "text": " Questions?"},
+]
+
+
+def test_round_trip(tmp_path):
+    """Test that segments survive a save/load cycle, including non-ASCII text."""
+    table = SegmentTable.from_segments(SEGMENTS)
+    loaded = SegmentTable.load(table.save(tmp_path / "t.segments.npz"))
+
+    assert len(loaded) == 3
+    assert loaded.texts() == [s["text"] for s in SEGMENTS]
+    assert loaded.full_text() == " Bonjour à tous. Today: entropy. Questions?"
+    np.testing.assert_allclose(loaded.end, [2.5, 6.0, 12.0])
+    assert np.isnan(loaded.avg_logprob[2])
+
+
+def test_text_view_has_one_segment_per_line():
+    """Test the derived plain-text rendering."""
+    assert SegmentTable.from_segments(SEGMENTS).to_text() == (
+        "Bonjour à tous.\nToday: entropy.\nQuestions?\n"
+    )
+    assert SegmentTable.from_segments([]).to_text() == ""
+
+
+def test_slice_time():
+    """Test selecting segments by time range."""
+    table = SegmentTable.from_segments(SEGMENTS)
+    assert list(table.slice_time(2.0, 7.0)) == [0, 1]
+    assert list(table.slice_time(7.0, 8.0)) == []
+
+
+def test_write_and_load_next_to_transcript(tmp_path):
+    """Test that the .txt and .segments.npz are written side by side."""
+    transcript = tmp_path / "lecture_abcd1234.txt"
+    _, segments_path = write_transcript(transcript, SEGMENTS)
+
+    assert segments_path == segments_path_for(transcript)
+    assert segments_path.name == "lecture_abcd1234.segments.npz"
+    assert transcript.read_text(encoding="utf-8").splitlines()[1] == "Today: entropy."
+    assert load_segments(transcript).texts() == load_segments(segments_path).texts()
+    assert load_segments(tmp_path / "missing.txt") is None
+
+
+def word(text, start, speaker, confidence=0.9):
+    return {"word": text.lower().strip(".?"), "punctuated_word": text, "start": start,
+            "end": start + 0.4, "confidence": confidence, "speaker": speaker}
+
+
+RESPONSE = {"results": {
+    "channels": [{"alternatives": [{"transcript": "Welcome everyone. Is it on the exam? Yes."}]}],
+    "utterances": [
+        {"start": 0.0, "end": 1.2, "confidence": 0.95, "speaker": 0,
+         "transcript": "Welcome everyone.", "words": [word("Welcome", 0.0, 0),
+                                                      word("everyone.", 0.5, 0)]},
+        {"start": 62.0, "end": 63.5, "confidence": 0.8, "speaker": 1,
+         "transcript": "Is it on the exam?", "words": [word("Is", 62.0, 1), word("it", 62.3, 1),
+                                                       word("on", 62.6, 1), word("the", 62.9, 1),
+                                                       word("exam?", 63.1, 1)]},
+        {"start": 64.0, "end": 64.4, "confidence": 0.99, "speaker": 0,
+         "transcript": "Yes.", "words": [word("Yes.", 64.0, 0)]},
+    ],
+}}
+
+
+def test_utterances_round_trip(tmp_path):
+    """Test that speaker turns and their words survive a save/load cycle."""
+    transcript = tmp_path / "lecture_deepgram.txt"
+    UtteranceTable.from_response(RESPONSE).save(utterances_path_for(transcript))
+    table = load_utterances(transcript)
+
+    assert table.texts() == ["Welcome everyone.", "Is it on the exam?", "Yes."]
+    assert list(table.speaker) == [0, 1, 0]
+    assert table.words_at(1)[-1][0] == "exam?"
+    assert table.words_at(2)[0][1] == 64.0
+    assert load_utterances(tmp_path / "missing.txt") is None
+
+
+def test_filter_search_and_export():
+    """Test speaker filtering, search and timestamped exports."""
+    table = UtteranceTable.from_response(RESPONSE)
+
+    assert list(table.speakers()) == [0, 1]
+    assert list(table.by_speaker(0)) == [0, 2]
+    assert list(table.search("EXAM")) == [1]
+    assert list(table.search("exam", speaker=0)) == []
+    assert list(table.slice_time(60, 70)) == [1, 2]
+    assert table.to_timestamped_text(table.by_speaker(1)) == (
+        "[00:01:02] Speaker 1: Is it on the exam?\n"
+    )
+    assert "00:01:04.000 --> 00:01:04.400\n<v Speaker 0>Yes." in table.to_webvtt()
+
+
+def test_utterances_rebuilt_from_words():
+    """Test that speaker turns are derived from words when utterances are absent."""
+    words = [w for u in RESPONSE["results"]["utterances"] for w in u["words"]]
+    response = {"results": {"channels": [{"alternatives": [{"transcript": "", "words": words}]}]}}
+    table = UtteranceTable.from_response(response)
+
+    assert table.texts() == ["Welcome everyone.", "Is it on the exam?", "Yes."]
+    assert list(table.speaker) == [0, 1, 0]
+    np.testing.assert_allclose(table.end, [0.9, 63.5, 64.4])
@@ -0,0 +1,234 @@
+import json
+import asyncio
+import pytest
+
+from utils.circuit_breaker import CircuitBreaker, CLOSED, OPEN
+from utils.error_handler import TranscriptionError, FileError, AudioDecodeError, APIError
+from transcription_router import Engine, RouterMetrics, TranscriptionRouter, transcribe_auto
+
+
+class FakeEngine:
+    """Async transcribe callable that fails its first ``failures`` calls."""
+
+    def __init__(self, name, failures=0, delay=0.0):
+        self.name = name
+        self.failures = failures
+        self.delay = delay
+        self.calls = 0
+
+    async def __call__(self, path):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        if self.calls <= self.failures:
+            raise RuntimeError(f"{self.name} unavailable")
+        return f"{path}.{self.name}.txt"
+
+
+async def no_sleep(seconds):
+    pass
+
+
+def make_engine(fake, retries=0, timeout=None, threshold=3, concurrency=1):
+    return Engine(fake.name, fake, timeout=timeout, retries=retries, concurrency=concurrency,
+                  breaker=CircuitBreaker(fake.name, threshold, reset_seconds=60))
+
+
+@pytest.fixture
+def audio(tmp_path):
+    paths = []
+    for i in range(4):
+        path = tmp_path / f"lecture{i}.wav"
+        path.write_bytes(b"RIFF")
+        paths.append(str(path))
+    return paths
+
+
+def test_retries_then_succeeds(audio):
+    remote = FakeEngine("deepgram", failures=2)
+    router = TranscriptionRouter([make_engine(remote, retries=2)], sleep=no_sleep)
+
+    result = asyncio.run(router.route(audio[0]))
+
+    assert result.engine == "deepgram"
+    assert result.attempts == 3
+    assert router.metrics.events[("deepgram", "retry")] == 2
+    assert router.metrics.events[("deepgram", "failure")] == 2
+    assert router.metrics.events[("deepgram", "success")] == 1
+
+
+def test_timeout_falls_back(audio):
+    remote = FakeEngine("deepgram", delay=1.0)
+    local = FakeEngine("whisper")
+    router = TranscriptionRouter(
+        [make_engine(remote, timeout=0.05), make_engine(local)], sleep=no_sleep
+    )
+
+    result = asyncio.run(router.route(audio[0]))
+
+    assert result.engine == "whisper"
+    assert router.metrics.events[("deepgram", "timeout")] == 1
+    assert router.metrics.events[("whisper", "fallback")] == 1
+
+
+def test_open_breaker_sends_jobs_straight_to_fallback(audio):
+    remote = FakeEngine("deepgram", failures=100)
+    local = FakeEngine("whisper")
+    deepgram = make_engine(remote, threshold=2)
+    router = TranscriptionRouter([deepgram, make_engine(local)], sleep=no_sleep)
+
+    async def run():
+        return [await router.route(path) for path in audio]
+
+    results = asyncio.run(run())
+
+    assert [r.engine for r in results] == ["whisper"] * 4
+    assert remote.calls == 2
+    assert deepgram.breaker.state == OPEN
+    assert router.metrics.events[("deepgram", "rejected")] == 2
+
+
+def test_all_engines_failing_raises(audio):
+    router = TranscriptionRouter(
+        [make_engine(FakeEngine("deepgram", failures=9), retries=1),
+         make_engine(FakeEngine("whisper", failures=9))],
+        sleep=no_sleep,
+    )
+    with pytest.raises(TranscriptionError, match="deepgram.*whisper"):
+        asyncio.run(router.route(audio[0]))
+
+
+def test_missing_file(tmp_path):
+    router = TranscriptionRouter([make_engine(FakeEngine("whisper"))], sleep=no_sleep)
+    with pytest.raises(FileError):
+        asyncio.run(router.route(str(tmp_path / "missing.wav")))
+
+
+def test_route_many_respects_concurrency(audio):
+    remote = FakeEngine("deepgram", delay=0.05)
+    in_flight = []
+
+    async def tracked(path):
+        in_flight.append(path)
+        assert len(in_flight) <= 2
+        try:
+            return await remote(path)
+        finally:
+            in_flight.remove(path)
+
+    engine = Engine("deepgram", tracked, concurrency=2)
+    report = asyncio.run(TranscriptionRouter([engine], sleep=no_sleep).route_many(audio))
+
+    assert len(report.succeeded) == 4
+    assert all(r.engine == "deepgram" for r in report.results)
+
+
+def test_transcribe_auto_writes_metrics(audio, tmp_path):
+    engines = [make_engine(FakeEngine("deepgram", failures=1)), make_engine(FakeEngine("whisper"))]
+    report = transcribe_auto(str(tmp_path / "lecture[01].wav"), engines=engines,
+                             metrics_dir=tmp_path / "metrics")
+
+    assert len(report.succeeded) == 2
+    assert {r.engine for r in report.results} == {"deepgram", "whisper"}
+
+    prom = (tmp_path / "metrics" / "transcription_router.prom").read_text()
+    assert 'transcription_router_events_total{engine="deepgram",event="failure"} 1' in prom
+    assert 'transcription_router_breaker_state{engine="deepgram"} 0' in prom
+    data = json.loads((tmp_path / "metrics" / "transcription_router.json").read_text())
+    assert data["whisper"]["events"]["fallback"] == 1
+
+
+def test_fallback_queue_drains_through_one_slot(audio, tmp_path):
+    # Engines are built outside the loop asyncio.run() creates, and every job
+    # waits on the single-slot fallback semaphore
+    local = FakeEngine("whisper", delay=0.02)
+    engines = [make_engine(FakeEngine("deepgram", failures=100)), make_engine(local)]
+    report = transcribe_auto(str(tmp_path / "lecture*.wav"), engines=engines,
+                             metrics_dir=tmp_path / "metrics")
+
+    assert len(report.succeeded) == 4
+    assert {r.engine for r in report.results} == {"whisper"}
+    assert local.calls == 4
+
+
+def test_router_can_be_reused_across_event_loops(audio):
+    router = TranscriptionRouter([make_engine(FakeEngine("whisper"))], sleep=no_sleep)
+    for path in audio[:2]:
+        assert asyncio.run(router.route(path)).engine == "whisper"
+
+
+def test_cancelled_trial_frees_the_breaker(audio):
+    remote = FakeEngine("deepgram", delay=1.0)
+    breaker = CircuitBreaker("deepgram", 1, reset_seconds=0)
+    breaker.record_failure()
+    router = TranscriptionRouter([Engine("deepgram", remote, breaker=breaker)], sleep=no_sleep)
+
+    async def cancel_trial():
+        task = asyncio.ensure_future(router.route(audio[0]))
+        await asyncio.sleep(0.01)
+        assert breaker.trial_in_flight
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_trial())
+    assert not breaker.trial_in_flight
+
+    remote.delay = 0.0
+    assert asyncio.run(router.route(audio[0])).engine == "deepgram"
+    assert breaker.state == CLOSED
+
+
+def test_bad_files_do_not_open_the_breaker(audio, tmp_path):
+    remote = FakeEngine("deepgram")
+    local = FakeEngine("whisper")
+
+    async def deepgram(path):
+        if "corrupt" in path:
+            try:
+                raise AudioDecodeError("Failed to process audio: ffmpeg exited with 1")
+            except AudioDecodeError as e:
+                # Wrapped the way transcribe_with_deepgram wraps it
+                raise TranscriptionError(f"Deepgram transcription failed: {e}")
+        return await remote(path)
+
+    engine = Engine("deepgram", deepgram, breaker=CircuitBreaker("deepgram", 2, 60))
+    router = TranscriptionRouter([engine, make_engine(local)], sleep=no_sleep)
+    corrupt = []
+    for i in range(3):
+        path = tmp_path / f"corrupt{i}.wav"
+        path.write_bytes(b"junk")
+        corrupt.append(str(path))
+
+    report = asyncio.run(router.route_many(corrupt + audio))
+
+    assert [r.status for r in report.results].count("failed") == 3
+    assert {r.engine for r in report.results if r.status == "ok"} == {"deepgram"}
+    assert engine.breaker.state == CLOSED
+    assert local.calls == 0
+    assert router.metrics.events[("deepgram", "bad_input")] == 3
+
+
+@pytest.mark.parametrize("status, counted", [(400, False), (429, True), (503, True)])
+def test_only_overload_and_server_errors_count(audio, status, counted):
+    async def rejecting(path):
+        raise APIError(f"Deepgram returned {status}", status_code=status)
+
+    engine = Engine("deepgram", rejecting, retries=2,
+                    breaker=CircuitBreaker("deepgram", 3, reset_seconds=60))
+    router = TranscriptionRouter([engine, make_engine(FakeEngine("whisper"))], sleep=no_sleep)
+
+    assert asyncio.run(router.route(audio[0])).engine == "whisper"
+    assert (engine.breaker.state == OPEN) is counted
+    # A rejected request is not retried
+    assert router.metrics.events[("deepgram", "failure")] == (3 if counted else 1)
+
+
+def test_uncancellable_engine_is_never_timed_out():
+    engine = Engine("whisper", FakeEngine("whisper"), timeout=10, cancellable=False)
+    assert engine.timeout is None
+
+
+def test_metrics_without_engines():
+    metrics = RouterMetrics()
+    metrics.record("whisper", "success", 1.5)
+    assert metrics.to_dict()["whisper"]["seconds"] == 1.5
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+from vad import TimeMap, compact, detect_speech, remap_segments
+
+SR = 16000
+
+
+def speech_like(seconds, rng):
+    """A noisy, amplitude-modulated voiced tone at a random pitch; the VAD should call it speech."""
+    t = np.arange(int(seconds * SR)) / SR
+    pitch = rng.uniform(120, 240)
+    envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 4 * t) ** 2
+    voice = 0.3 * envelope * np.sin(2 * np.pi * pitch * t)
+    return (voice + 0.01 * rng.standard_normal(len(t))).astype(np.float32)
+
+
+def quiet(seconds, rng):
+    return (rng.standard_normal(int(seconds * SR)) * 1e-4).astype(np.float32)
+
+
+def test_detects_speech_regions_and_ratio():
+    """Test that speech surrounded by silence is found at the right offsets."""
+    rng = np.random.default_rng(0)
+    audio = np.concatenate(
+        [quiet(5, rng), speech_like(3, rng), quiet(10, rng), speech_like(2, rng)]
+    )
+
+    result = detect_speech(audio, sr=SR)
+
+    assert len(result.regions) == 2
+    assert result.regions[0].start / SR == pytest.approx(5, abs=0.3)
+    assert result.regions[1].end / SR == pytest.approx(20, abs=0.3)
+    assert result.speech_ratio == pytest.approx(5 / 20, abs=0.05)
+    assert result.metrics()["regions"] == 2
+
+
+def test_silence_has_no_speech():
+    """Test that a silent recording yields no regions."""
+    result = detect_speech(np.zeros(SR * 3, dtype=np.float32), sr=SR)
+    assert result.regions == []
+    assert result.speech_ratio == 0.0
+
+
+def test_continuous_speech_is_kept():
+    """Test that a recording with almost no silence is not discarded."""
+    rng = np.random.default_rng(1)
+    result = detect_speech(speech_like(10, rng), sr=SR)
+    assert result.speech_ratio > 0.9
+
+
+def test_compact_and_timestamp_mapping():
+    """Test that compacted audio timestamps map back onto the original timeline."""
+    rng = np.random.default_rng(2)
+    audio = np.concatenate([quiet(4, rng), speech_like(2, rng), quiet(6, rng), speech_like(2, rng)])
+    result = detect_speech(audio, sr=SR, pad_ms=0)
+
+    compacted, time_map = compact(audio, result, gap_ms=500)
+    assert len(compacted) < len(audio) / 2
+
+    second_start = time_map.compact_starts[1]
+    segments = [{"start": 0.5, "end": 1.0, "words": [{"start": 0.5, "end": 0.7}]},
+                {"start": second_start + 0.25, "end": second_start + 1.0}]
+    remap_segments(segments, time_map)
+
+    assert segments[0]["start"] == pytest.approx(4.5, abs=0.1)
+    assert segments[0]["words"][0]["end"] == pytest.approx(4.7, abs=0.1)
+    assert segments[1]["start"] == pytest.approx(12.25, abs=0.1)
+
+
+def test_time_map_clamps_inside_gaps():
+    """Test that a time inside an inserted gap clamps to the end of the previous region."""
+    time_map = TimeMap([0.0, 2.5], [10.0, 30.0], [2.0, 1.0])
+    assert time_map.to_original(2.2) == 12.0
+    assert time_map.to_original(3.0) == 30.5